@@ -0,0 +1,251 @@
+"""Per carrier and operation request building and response parsing benchmark on the carrier test fixtures.
+
+Usage:
+    python -m benchmarks.carriers [carrier ...] [--output results.json] [--compare baseline.json] [--threshold 0.1]
+
+The unified requests are the ones set up by the carrier test cases and the responses are the test fixtures
+returned by the patched proxy `http` (as the tests do). Reports per carrier and operation:
+    build: mapper.create_* + Serializable.serialize throughput (ops/s), peak memory and retained allocations
+    parse: Deserializable.deserialize + mapper.parse_* throughput (ops/s), peak memory and retained allocations
+The requests serialized into a Pipeline (marked with a *) are only built when the proxy runs their jobs:
+their build runs the whole pipeline against the patched `http` instead (the fixtures being returned as is).
+The carriers without any test fixtures (listed in SKIPPED) are reported as skipped.
+
+--output saves the results as JSON; --compare reports the changes against saved results and exits
+with an error status if any throughput dropped (or any peak memory grew) by more than the threshold.
+"""
+
+import sys
+import json
+import timeit
+import argparse
+import platform
+import importlib
+import tracemalloc
+import unittest
+from collections import deque
+from typing import Callable, List, Optional, Tuple, Union
+from unittest.mock import patch
+from purplship.core.utils.pipeline import Pipeline
+
+REPEAT = 3
+OPERATIONS = {
+    "rate": ("rate", "create_rate_request", "get_rates", "parse_rate_response"),
+    "tracking": ("tracking", "create_tracking_request", "get_tracking", "parse_tracking_response"),
+    "shipment": ("shipment", "create_shipment_request", "create_shipment", "parse_shipment_response"),
+    "shipment_cancel": (
+        "shipment", "create_cancel_shipment_request", "cancel_shipment", "parse_cancel_shipment_response"
+    ),
+    "pickup": ("pickup", "create_pickup_request", "schedule_pickup", "parse_pickup_response"),
+    "pickup_cancel": ("pickup", "create_cancel_pickup_request", "cancel_pickup", "parse_cancel_pickup_response"),
+    "address": (
+        "address", "create_address_validation_request", "validate_address", "parse_address_validation_response"
+    ),
+}
+
+# (carrier, operation, the test case unified request attribute, the response fixture(s) returned by the proxy http)
+CASES: List[Tuple[str, str, str, Union[str, Tuple[str, ...]]]] = [
+    ("aramex", "tracking", "TrackingRequest", "TrackingResponseXML"),
+    ("australiapost", "tracking", "TrackingRequest", "TrackingResponseJSON"),
+    ("canadapost", "rate", "RateRequest", "RateResponseXml"),
+    ("canadapost", "tracking", "TrackingRequest", "TrackingResponseXml"),
+    ("canadapost", "shipment", "ShipmentRequest", ("ShipmentResponseXML", "LabelResponse")),
+    ("canadapost", "pickup", "PickupRequest", ("PickupAvailabilityResponseXML", "PickupResponseXML")),
+    ("canpar", "rate", "RateRequest", "RateResponseXml"),
+    ("canpar", "tracking", "TrackingRequest", "TrackingResponseXML"),
+    ("canpar", "shipment", "ShipmentRequest", ("ShipmentResponseXML", "ShipmentLabelResponseXML")),
+    ("canpar", "shipment_cancel", "VoidShipmentRequest", "VoidShipmentResponseXML"),
+    ("canpar", "pickup", "PickupRequest", "PickupResponseXML"),
+    ("canpar", "pickup_cancel", "PickupCancelRequest", "PickupCancelResponseXML"),
+    ("canpar", "address", "AddressValidationRequest", "AddressValidationResponseXML"),
+    ("dhl_express", "rate", "RateRequest", "RateResponseXML"),
+    ("dhl_express", "tracking", "TrackingRequest", "TrackingResponseXML"),
+    ("dhl_express", "shipment", "ShipmentRequest", "ShipmentResponseXml"),
+    ("dhl_express", "pickup", "BookPURequest", "PickupResponseXML"),
+    ("dhl_express", "pickup_cancel", "CancelPURequest", "CancelPUResponseXML"),
+    ("dhl_express", "address", "AddressValidationRequest", "AddressValidationResponseXML"),
+    ("dhl_universal", "tracking", "TrackingRequest", "TrackingResponseJSON"),
+    ("dicom", "tracking", "TrackingRequest", "TrackingResponseJSON"),
+    ("fedex", "rate", "RateRequest", "RateResponseXml"),
+    ("fedex", "tracking", "TrackRequest", "TrackingResponseXML"),
+    ("fedex", "shipment", "ShipmentRequest", "ShipmentResponseXML"),
+    ("fedex", "pickup", "PickupRequest", ("PickupAvailabilityResponseXML", "PickupResponseXML")),
+    ("fedex", "pickup_cancel", "PickupCancelRequest", "PickupCancelResponseXML"),
+    ("fedex", "address", "AddressValidationRequest", "AddressValidationResponseXML"),
+    ("purolator", "rate", "RateRequest", "RATE_RESPONSE_XML"),
+    ("purolator", "tracking", "TrackingRequest", "TRACKING_RESPONSE_XML"),
+    ("purolator", "shipment", "ShipmentRequest", ("SHIPMENT_RESPONSE_XML", "SHIPMENT_DOCUMENT_RESPONSE_XML")),
+    ("purolator", "shipment_cancel", "ShipmentCancelRequest", "SHIPMENT_CANCEL_RESPONSE_XML"),
+    ("purolator", "pickup", "PickupRequest", ("PickupValidationResponseXML", "PickupResponseXML")),
+    ("purolator", "pickup_cancel", "PickupCancelRequest", "PickupCancelResponseXML"),
+    ("purolator", "address", "AddressValidationRequest", "AddressValidationResponseXML"),
+    ("royalmail", "tracking", "TrackingRequest", "TrackingResponseJSON"),
+    ("sendle", "tracking", "TrackingRequest", "TrackingResponseJSON"),
+    ("sf_express", "tracking", "TrackingRequest", "TrackingResponseJSON"),
+    ("tnt", "tracking", "TrackingRequest", "TRACKING_RESPONSE"),
+    ("ups", "rate", "RateRequest", "RateResponseXML"),
+    ("ups", "tracking", "TrackingRequest", "TrackingResponseXml"),
+    ("ups", "shipment", "ShipmentRequest", "NegotiatedShipmentResponseXML"),
+    ("ups", "shipment_cancel", "ShipmentCancelRequest", "ShipmentCancelResponseXML"),
+    ("ups", "pickup", "PickupRequest", ("PickupRateResponseXML", "PickupResponseXML")),
+    ("ups", "pickup_cancel", "PickupCancelRequest", "PickupCancelResponseXML"),
+    ("ups", "address", "AddressValidationRequest", "AddressValidationResponseXML"),
+    ("usps", "rate", "RateRequest", "RATE_RESPONSE_XML"),
+    ("usps", "tracking", "TrackingRequest", "TRACKING_RESPONSE"),
+    ("usps", "shipment", "ShipmentRequest", "ShipmentResponseXML"),
+    ("usps", "shipment_cancel", "ShipmentCancelRequest", "ShipmentCancelResponseXML"),
+    ("usps_international", "rate", "RateRequest", "RATE_RESPONSE_XML"),
+    ("usps_international", "tracking", "TrackingRequest", "TRACKING_RESPONSE"),
+    ("yanwen", "tracking", "TrackingRequest", "TrackingResponseJSON"),
+    ("yunexpress", "tracking", "TrackingRequest", "TrackingResponseXML"),
+]
+# the carriers without any proxy operation or test fixtures to benchmark
+SKIPPED = {
+    "boxknight": "no proxy operation nor test fixtures",
+}
+
+
+def unified_request(module, attribute: str):
+    """Return the unified request set up by the module test case"""
+    for case in vars(module).values():
+        if isinstance(case, type) and issubclass(case, unittest.TestCase) and case.__module__ == module.__name__:
+            test = case()
+            test.setUp()
+            if hasattr(test, attribute):
+                return getattr(test, attribute)
+
+    raise LookupError(f"no {module.__name__} test case sets up {attribute}")
+
+
+def throughput(action: Callable) -> float:
+    timer = timeit.Timer(action)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(number=number, repeat=REPEAT))
+
+
+def memory(action: Callable) -> Tuple[float, int]:
+    """Return the peak memory (KiB) allocated by an action and the number of allocations its result retains"""
+    tracemalloc.start()
+    try:
+        result = action()
+        _, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return peak / 1024, blocks
+
+
+def measure(carrier: str, operation: str, attribute: str, responses: Union[str, Tuple[str, ...]]) -> dict:
+    module_name, create, send, parse = OPERATIONS[operation]
+    module = importlib.import_module(f"tests.{carrier}.{module_name}")
+    gateway = importlib.import_module(f"tests.{carrier}.fixture").gateway
+    request = unified_request(module, attribute)
+    fixtures = [getattr(module, name) for name in ((responses,) if isinstance(responses, str) else responses)]
+
+    replies: deque = deque()
+
+    def send_request():
+        replies.clear()
+        replies.extend(fixtures)
+        return getattr(gateway.proxy, send)(getattr(gateway.mapper, create)(request))
+
+    with patch(f"purplship.mappers.{carrier}.proxy.http", side_effect=lambda *_, **__: replies.popleft()):
+        pipeline = isinstance(getattr(gateway.mapper, create)(request).serialize(), Pipeline)
+        build = send_request if pipeline else lambda: getattr(gateway.mapper, create)(request).serialize()
+        response = send_request()
+        parsing = lambda: getattr(gateway.mapper, parse)(response)
+
+        # the memory is measured once the throughput runs warmed up the (lazily built) module caches
+        build_ops, parse_ops = throughput(build), throughput(parsing)
+        build_peak, build_blocks = memory(build)
+        parse_peak, parse_blocks = memory(parsing)
+
+    return dict(
+        pipeline=pipeline, build_ops=build_ops, build_peak_kib=build_peak, build_blocks=build_blocks,
+        parse_ops=parse_ops, parse_peak_kib=parse_peak, parse_blocks=parse_blocks,
+    )
+
+
+def run(carriers: List[str]) -> dict:
+    results = {}
+    print(f"{'case':<32}{'build/s':>10}{'KiB':>8}{'blocks':>8}{'parse/s':>10}{'KiB':>8}{'blocks':>8}")
+    for carrier, reason in SKIPPED.items():
+        if not any(carriers) or carrier in carriers:
+            print(f"{carrier:<32}skipped: {reason}")
+
+    for carrier, operation, attribute, responses in CASES:
+        if any(carriers) and carrier not in carriers:
+            continue
+
+        key = f"{carrier}.{operation}"
+        try:
+            result = results[key] = measure(carrier, operation, attribute, responses)
+        except Exception as error:
+            print(f"{key:<32}skipped: {error!r}")
+            continue
+
+        label = f"{key}*" if result["pipeline"] else key
+        print(
+            f"{label:<32}{result['build_ops']:>10.0f}{result['build_peak_kib']:>8.0f}{result['build_blocks']:>8}"
+            f"{result['parse_ops']:>10.0f}{result['parse_peak_kib']:>8.0f}{result['parse_blocks']:>8}"
+        )
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Print the changes against the baseline results and return the regressions"""
+    regressions = []
+    print(f"\n{'case':<32}{'build':>9}{'parse':>9}{'build KiB':>11}{'parse KiB':>11}")
+    for key, result in results.items():
+        previous: Optional[dict] = baseline.get(key)
+        if previous is None:
+            continue
+
+        changes = dict(
+            build=result["build_ops"] / previous["build_ops"] - 1,
+            parse=result["parse_ops"] / previous["parse_ops"] - 1,
+            build_memory=result["build_peak_kib"] / previous["build_peak_kib"] - 1,
+            parse_memory=result["parse_peak_kib"] / previous["parse_peak_kib"] - 1,
+        )
+        regressed = [
+            name for name, change in changes.items()
+            if (change < -threshold if name in ("build", "parse") else change > threshold)
+        ]
+        regressions += [f"{key} {name}" for name in regressed]
+        print(
+            f"{key:<32}" + "".join(f"{change:>+{w}.1%}" for change, w in zip(changes.values(), (9, 9, 11, 11)))
+            + (f"  regressed: {', '.join(regressed)}" if any(regressed) else "")
+        )
+
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("carriers", nargs="*", help="the carriers to benchmark (all by default)")
+    parser.add_argument("--output", help="save the results to a JSON file")
+    parser.add_argument("--compare", help="compare the results to a saved JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="the tolerated relative change (0.1)")
+    args = parser.parse_args(argv)
+
+    results = run(args.carriers)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(dict(python=platform.python_version(), results=results), output, indent=4, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(results, json.load(baseline)["results"], args.threshold)
+
+        if any(regressions):
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Instrumentation overhead benchmark of the operations phases spans.
+
+Usage:
+    python -m benchmarks.instrumentation
+
+Reports the cost (µs) of a span with the no-op default sink and with the in-memory histogram,
+then the phases timings aggregated by the histogram over rate requests answered by a stand-in transport.
+"""
+
+import timeit
+from purplship import Rating
+from purplship.core.utils import set_transport
+from purplship.core.utils.transport import Transport
+from purplship.core.utils.instrument import Histogram, Sink, set_instrumentation, span
+from purplship.core.models import RateRequest
+
+NUMBER = 100_000
+
+
+class StandInTransport(Transport):
+    def __init__(self, response: str):
+        self.response = response.encode("utf-8")
+
+    def send(self, *args, **kwargs) -> bytes:
+        return self.response
+
+
+def empty_span():
+    with span("create"):
+        pass
+
+
+def main():
+    for sink in (Sink(), Histogram()):
+        set_instrumentation(sink)
+        cost = min(timeit.repeat(empty_span, number=NUMBER, repeat=5)) / NUMBER * 1e6
+        print(f"{type(sink).__name__:<12}{cost:>8.3f} µs/span")
+
+    from tests.fedex.fixture import gateway
+    from tests.fedex.rate import RateRequestPayload, RateResponseXml
+
+    histogram = Histogram()
+    set_instrumentation(histogram)
+    previous = set_transport(StandInTransport(RateResponseXml))
+    try:
+        for _ in range(200):
+            Rating.fetch(RateRequest(**RateRequestPayload)).from_(gateway).parse()
+    finally:
+        set_transport(previous)
+        set_instrumentation(None)
+
+    print(f"\n{'phase':<14}{'count':>7}{'mean (µs)':>11}{'p99 (ms)':>10}")
+    for (_, _, _, phase), stats in histogram.summary().items():
+        print(f"{phase:<14}{stats['count']:>7}{stats['mean'] * 1e6:>11.0f}{stats['p99'] * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Shipment options and services parsing benchmark on the DHL Express, FedEx and UPS option sets.
+
+Usage:
+    python -m benchmarks.options
+
+Compares the per key enum membership checks and `Spec.apply` calls parsing (as `Options` and `Services`
+used to do it) with the compiled dispatch tables, for payloads mixing carrier and universal options.
+"""
+
+import sys
+import timeit
+from typing import Iterable, List, Type
+
+from purplship.core.utils import Enum, Spec
+from purplship.core.units import Option, Options, Services
+from purplship.providers.dhl_express.units import SpecialServiceCode, ProductCode
+from purplship.providers.fedex.units import SpecialServiceType, ServiceType
+from purplship.providers.ups.units import ServiceOption, RatingServiceCode
+
+NUMBER = 2000
+UNIVERSAL = dict(currency="USD", insurance=100.0, declared_value=75.5, signature_confirmation=True, unknown="x")
+
+
+def legacy_options(options: dict, option_type: Type[Enum] = Enum) -> dict:
+    option_values = {}
+    for key, val in options.items():
+        if option_type is not None and key in option_type:
+            option_values[option_type[key].name] = option_type[key].value.apply(val)
+        elif key in Option and key:
+            option_values[key] = Option[key].value.apply(val)
+
+    return option_values
+
+
+def legacy_services(services: Iterable, service_type: Type[Enum]) -> List[bool]:
+    members = [service_type[s] for s in services if s in service_type]
+    return [name in [s.name for s in members] for name in services]
+
+
+def normalized(options: dict) -> dict:
+    """The options values with the key/value specs (holding computed closures) compared by key and value"""
+    return {key: (value.key, value.value) if isinstance(value, Spec) else value for key, value in options.items()}
+
+
+def payload(option_type: Type[Enum], count: int) -> dict:
+    names = list(option_type.__members__)
+    step = max(len(names) // count, 1)
+    return {**{name: True for name in names[::step][:count]}, **UNIVERSAL}
+
+
+def main(argv: List[str] = None) -> int:
+    cases = [
+        ("dhl_express", SpecialServiceCode, ProductCode, 10),
+        ("dhl_express (all)", SpecialServiceCode, ProductCode, len(SpecialServiceCode.__members__)),
+        ("fedex", SpecialServiceType, ServiceType, 10),
+        ("ups", ServiceOption, RatingServiceCode, 10),
+    ]
+
+    print(f"{'options':<24}{'keys':>6}{'enum µs':>10}{'table µs':>10}{'speedup':>9}")
+    for label, option_type, service_type, count in cases:
+        options = payload(option_type, count)
+        assert normalized(legacy_options(options, option_type)) == normalized(dict(iter(Options(options, option_type))))
+
+        legacy = min(timeit.repeat(lambda: legacy_options(options, option_type), number=NUMBER, repeat=5)) / NUMBER
+        compiled = min(timeit.repeat(lambda: Options(options, option_type), number=NUMBER, repeat=5)) / NUMBER
+        print(f"{label:<24}{len(options):>6}{legacy * 1e6:>10.2f}{compiled * 1e6:>10.2f}{legacy / compiled:>8.1f}x")
+
+    print(f"\n{'services':<24}{'keys':>6}{'enum µs':>10}{'table µs':>10}{'speedup':>9}")
+    for label, _, service_type, _ in cases[1:]:
+        services = [*list(service_type.__members__)[:5], "unknown"]
+        lookups = lambda: [name in instance for instance in [Services(services, service_type)] for name in services]
+        assert legacy_services(services, service_type) == lookups()
+
+        legacy = min(timeit.repeat(lambda: legacy_services(services, service_type), number=NUMBER, repeat=5)) / NUMBER
+        compiled = min(timeit.repeat(lookups, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{label.split()[0]:<24}{len(services):>6}{legacy * 1e6:>10.2f}{compiled * 1e6:>10.2f}{legacy / compiled:>8.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Parcels processing benchmark on a 500 parcels LTL-style manifest.
+
+Usage:
+    python -m benchmarks.packages
+
+Reports the time (ms) taken to:
+    packages: map and validate the parcels (Packages(..., required=[...], max_weight=...)) and total their weight
+    builder: map the parcels then read each package weight and dimensions the way carrier request builders do
+        (a few reads per field)
+    aggregates: total weight, volume and girth of every package (per-package helpers)
+    vectorized: the packages and aggregates benchmarks with the NumPy backend (Packages(..., vectorized=True))
+"""
+
+import timeit
+from purplship.core.models import Parcel
+from purplship.core.units import Packages, Weight, WeightUnit
+from purplship.core.arrays import numpy
+
+NUMBER = 20
+REQUIRED = ["weight", "height", "width", "length"]
+
+
+def manifest(count: int = 500):
+    return [
+        Parcel(
+            weight=20 + (index % 40), width=40 + index % 8, height=30 + index % 5, length=48,
+            weight_unit="LB", dimension_unit="IN", packaging_type="pallet",
+        )
+        for index in range(count)
+    ]
+
+
+def packages(parcels, vectorized: bool = False):
+    items = Packages(parcels, required=REQUIRED, max_weight=Weight(150, WeightUnit.LB), vectorized=vectorized)
+    return items.weight.LB, items.weight.KG
+
+
+def aggregates(parcels):
+    items = Packages(parcels)
+    return items.weight.LB, [(pkg.volume.value, pkg.girth.value) for pkg in items]
+
+
+def vectorized_aggregates(parcels):
+    items = Packages(parcels, vectorized=True)
+    return items.weight.LB, items.arrays.volumes, items.arrays.girths()
+
+
+def builder(parcels):
+    for package in Packages(parcels):
+        package.weight.LB, package.weight.KG, package.weight.value, package.weight.unit
+        package.width.IN, package.height.IN, package.length.IN
+        package.width.CM, package.height.CM, package.length.CM
+        package.width.value, package.height.value, package.length.value, package.length.unit
+        package.girth.value, package.volume.value
+
+
+def measure(action) -> float:
+    return min(timeit.repeat(action, number=NUMBER, repeat=5)) / NUMBER * 1e3
+
+
+def main():
+    parcels = manifest()
+    print(f"{'benchmark':<26}{'parcels':>9}{'ms':>9}")
+    print(f"{'packages':<26}{len(parcels):>9}{measure(lambda: packages(parcels)):>9.2f}")
+    print(f"{'builder':<26}{len(parcels):>9}{measure(lambda: builder(parcels)):>9.2f}")
+    print(f"{'aggregates':<26}{len(parcels):>9}{measure(lambda: aggregates(parcels)):>9.2f}")
+    if numpy is None:
+        print("vectorized: NumPy is not installed")
+        return
+
+    print(f"{'packages (vectorized)':<26}{len(parcels):>9}{measure(lambda: packages(parcels, True)):>9.2f}")
+    print(f"{'aggregates (vectorized)':<26}{len(parcels):>9}{measure(lambda: vectorized_aggregates(parcels)):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
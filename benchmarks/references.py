@@ -0,0 +1,103 @@
+"""Reference data (countries, states and currencies) import cost and lookups benchmark.
+
+Usage:
+    python -m benchmarks.references [--runs 10]
+
+Reports, in fresh interpreters (the units module dependencies being imported beforehand):
+    import: the `purplship.core.units` module execution time (min of the runs) and the memory it retains
+    enums: the first access (creation) time of the Country, CountryState, Currency and CountryCurrency enums
+Then the country and state code → name and name → code lookups: with the enums and the indexed tables.
+"""
+
+import sys
+import timeit
+import argparse
+import subprocess
+from typing import List
+
+# the units module is imported along with the purplship package: it is re-executed on its own once imported
+DEPENDENCIES = "import sys, purplship.core.units; del sys.modules['purplship.core.units']"
+IMPORT_TIME = f"""
+{DEPENDENCIES}
+from time import perf_counter
+start = perf_counter()
+import purplship.core.units
+print(perf_counter() - start)
+"""
+IMPORT_MEMORY = f"""
+{DEPENDENCIES}
+import tracemalloc
+tracemalloc.start()
+import purplship.core.units
+print(tracemalloc.get_traced_memory()[0])
+"""
+ENUMS_TIME = f"""
+{DEPENDENCIES}
+import purplship.core.units as units
+from time import perf_counter
+start = perf_counter()
+units.Country, units.CountryState, units.Currency, units.CountryCurrency
+print(perf_counter() - start)
+"""
+NUMBER = 10000
+
+
+def run(script: str, runs: int) -> float:
+    return min(
+        float(subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout)
+        for _ in range(runs)
+    )
+
+
+def lookups():
+    from purplship.core import units
+
+    codes = [country.name for country in units.Country]
+    names = [country.value for country in units.Country]
+    states = [("US", "NY"), ("CA", "QC"), ("IN", "KA"), ("XX", "AB")]
+    state_names = [("US", "New York"), ("CA", "Quebec"), ("IN", "Karnataka"), ("XX", "Nowhere")]
+
+    def enum_state_name(country: str, code: str):
+        states: dict = getattr(units.CountryState.__members__.get(country), "value", {})
+        return states[code].value if code in states else None
+
+    def enum_state_code(country: str, name: str):
+        states: dict = getattr(units.CountryState.__members__.get(country), "value", [])
+        return next((state.name for state in states if state.value == name), None)
+
+    cases = [
+        ("country name (enum)", lambda: [units.Country[code].value for code in codes if code in units.Country]),
+        ("country code (enum)", lambda: [next(c.name for c in units.Country if c.value == n) for n in names]),
+        ("state name (enum)", lambda: [enum_state_name(*state) for state in states]),
+        ("state code (enum)", lambda: [enum_state_code(*state) for state in state_names]),
+    ]
+    if hasattr(units, "COUNTRIES"):
+        cases += [
+            ("country name (table)", lambda: [units.COUNTRIES.name(code) for code in codes]),
+            ("country code (table)", lambda: [units.COUNTRIES.code(name) for name in names]),
+            ("state name (table)", lambda: [units.state_name(*state) for state in states]),
+            ("state code (table)", lambda: [units.state_code(*state) for state in state_names]),
+        ]
+
+    print(f"\n{'lookups':<24}{'µs/call':>10}")
+    for label, action in cases:
+        count = len(codes) if label.startswith("country") else len(states)
+        seconds = min(timeit.repeat(action, number=NUMBER // count, repeat=3)) / (NUMBER // count * count)
+        print(f"{label:<24}{seconds * 1e6:>10.3f}")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=10, help="the number of fresh interpreter runs (10)")
+    args = parser.parse_args(argv)
+
+    print(f"{'purplship.core.units':<24}{'value':>10}")
+    print(f"{'import (ms)':<24}{run(IMPORT_TIME, args.runs) * 1e3:>10.2f}")
+    print(f"{'import (KiB)':<24}{run(IMPORT_MEMORY, 1) / 1024:>10.0f}")
+    print(f"{'enums creation (ms)':<24}{run(ENUMS_TIME, args.runs) * 1e3:>10.2f}")
+    lookups()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
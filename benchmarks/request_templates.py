@@ -0,0 +1,62 @@
+"""Rate requests serialization benchmark of the pre-rendered request fragments.
+
+Usage:
+    python -m benchmarks.request_templates
+
+Reports the time (µs) taken to create and serialize the carriers rate requests of the test fixtures
+with the static parts (credentials, version ids, shipper) exported from cached renderings (XP.fragment)
+and with XP.fragment patched to build and export them on every request (the former behavior).
+"""
+
+import timeit
+from unittest.mock import patch
+from purplship.core.utils import XP
+from purplship.core.models import RateRequest
+
+NUMBER = 500
+
+
+def fedex():
+    from tests.fedex.fixture import gateway
+    from tests.fedex.rate import RateRequestPayload
+
+    return gateway, RateRequestPayload
+
+
+def ups():
+    from tests.ups.fixture import gateway
+    from tests.ups.rate import rate_req_data
+
+    return gateway, rate_req_data
+
+
+def purolator():
+    from tests.purolator.fixture import gateway
+    from tests.purolator.rate import RATE_REQUEST_PAYLOAD
+
+    return gateway, RATE_REQUEST_PAYLOAD
+
+
+BENCHMARKS = [fedex, ups, purolator]
+
+
+def measure(action) -> float:
+    return min(timeit.repeat(action, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main():
+    print(f"{'carrier':<12}{'built (µs)':>12}{'fragments (µs)':>16}")
+    for benchmark in BENCHMARKS:
+        gateway, payload = benchmark()
+        request = RateRequest(**payload)
+        action = lambda: gateway.mapper.create_rate_request(request).serialize()
+
+        templated = measure(action)
+        with patch.object(XP, "fragment", lambda key, build: build()):
+            built = measure(action)
+
+        print(f"{benchmark.__name__:<12}{built:>12.0f}{templated:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""DP.to_dict benchmark of the direct conversion against the former JSON round trip.
+
+Usage:
+    python -m benchmarks.to_dict
+
+Reports the time (ms) taken to turn into dictionaries:
+    rates: 10k RateDetails (with extra charges) as returned by Rating.fetch(...).parse()
+    tracking: the JSON tracking responses of the test fixtures (events repeated to long histories)
+"""
+
+import json
+import timeit
+from purplship.core.utils import DP
+from purplship.core.models import RateDetails, ChargeDetails
+
+NUMBER = 5
+EVENTS = 200
+
+
+def round_trip(entity):
+    return json.loads(
+        DP.jsonify(entity) if not isinstance(entity, str) else entity,
+        object_hook=lambda d: {k: v for k, v in d.items() if v not in (None, [], "")},
+    )
+
+
+def rates():
+    return [
+        RateDetails(
+            carrier_name="fedex", carrier_id="fedex", currency="USD", service=f"service_{i}",
+            base_charge=10.0, total_charge=12.5, transit_days=2,
+            extra_charges=[ChargeDetails(name="Fuel", amount=2.5, currency="USD")],
+        )
+        for i in range(10_000)
+    ]
+
+
+def _repeat(response: str, *path) -> str:
+    """Repeat the events (at `path`) of a JSON tracking response to simulate long histories"""
+    content = json.loads(response)
+    events = content
+    for key in path:
+        events = events[key]
+    events.extend(events * (EVENTS // len(events)))
+    return json.dumps(content, indent=4)
+
+
+def dhl_universal():
+    from tests.dhl_universal.tracking import TrackingResponseJSON
+
+    return _repeat(TrackingResponseJSON, "shipments", 0, "events")
+
+
+def sendle():
+    from tests.sendle.tracking import TrackingResponseJSON
+
+    return _repeat(TrackingResponseJSON, "tracking_events")
+
+
+BENCHMARKS = [rates, dhl_universal, sendle]
+
+
+def measure(action) -> float:
+    return min(timeit.repeat(action, number=NUMBER, repeat=3)) / NUMBER * 1e3
+
+
+def main():
+    print(f"{'payload':<16}{'round trip (ms)':>17}{'to_dict (ms)':>14}{'speedup':>9}")
+    for benchmark in BENCHMARKS:
+        entity = benchmark()
+        before = measure(lambda: round_trip(entity))
+        after = measure(lambda: DP.to_dict(entity))
+        print(f"{benchmark.__name__:<16}{before:>17.2f}{after:>14.2f}{before / after:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
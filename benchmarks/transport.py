@@ -0,0 +1,126 @@
+"""HTTP transports benchmark against a local HTTPS carrier stand-in.
+
+Usage:
+    python -m benchmarks.transport [--requests 200] [--latency 0.005]
+
+Reports the number of TCP connections and full TLS handshakes observed by the server
+as well as the p50/p99 client latency for the urllib and pooled transports.
+"""
+
+import ssl
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from statistics import quantiles
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from purplship.core.utils import request as http, set_transport
+from purplship.core.utils.transport import PooledTransport, UrllibTransport
+
+RESPONSE = b"<RateReply><Rate>12.26</Rate></RateReply>"
+
+
+class CarrierStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.stats["connections"] += 1
+            if not self.connection.session_reused:
+                self.server.stats["handshakes"] += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def create_certificate(directory: str) -> Path:
+    cert = Path(directory) / "localhost.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+            "-keyout", str(cert), "-out", str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert
+
+
+def start_server(cert: Path, latency: float) -> ThreadingHTTPServer:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(str(cert))
+    CarrierStandIn.latency = latency
+    server = ThreadingHTTPServer(("localhost", 0), CarrierStandIn)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.stats = dict(connections=0, handshakes=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(name: str, transport, server: ThreadingHTTPServer, requests: int) -> dict:
+    server.stats.update(connections=0, handshakes=0)
+    url = f"https://localhost:{server.server_address[1]}/rate"
+    timings = []
+    previous = set_transport(transport)
+    try:
+        for _ in range(requests):
+            start = time.perf_counter()
+            http(url=url, data=bytearray("<RateRequest/>", "utf-8"), method="POST")
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        set_transport(previous)
+        transport.close()
+
+    percentiles = quantiles(timings, n=100)
+    return dict(
+        transport=name,
+        requests=requests,
+        connections=server.stats["connections"],
+        handshakes=server.stats["handshakes"],
+        p50_ms=round(percentiles[49], 3),
+        p99_ms=round(percentiles[98], 3),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated carrier processing time (s)")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert = create_certificate(directory)
+        server = start_server(cert, options.latency)
+        client_context = ssl.create_default_context(cafile=str(cert))
+        results = [
+            run("urllib", UrllibTransport(client_context), server, options.requests),
+            run("pooled", PooledTransport(ssl_context=client_context), server, options.requests),
+        ]
+        server.shutdown()
+
+    print(f"{'transport':<10}{'requests':>10}{'connections':>13}{'handshakes':>12}{'p50 (ms)':>11}{'p99 (ms)':>11}")
+    for r in results:
+        print(
+            f"{r['transport']:<10}{r['requests']:>10}{r['connections']:>13}"
+            f"{r['handshakes']:>12}{r['p50_ms']:>11}{r['p99_ms']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
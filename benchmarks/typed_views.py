@@ -0,0 +1,64 @@
+"""Carrier responses parsing benchmark of the eager GenerateDS builds against the lazy typed views.
+
+Usage:
+    python -m benchmarks.typed_views
+
+Reports the time (ms) taken by the providers parsers switched to XP.view (or XP.find(..., lazy=True))
+on the carrier test fixtures (repeated to a realistic response size) and the same parsers
+with XP.view patched back to the eager XP.build.
+"""
+
+import re
+import timeit
+from unittest.mock import patch
+from purplship.core.utils import XP
+
+NUMBER = 20
+
+
+def fedex_rate():
+    from tests.fedex.fixture import gateway
+    from tests.fedex.rate import RateResponseXml
+    from purplship.providers.fedex.package.rate import parse_rate_response
+
+    return parse_rate_response, RateResponseXml, gateway.settings, 1
+
+
+def ups_tracking():
+    from tests.ups.fixture import gateway
+    from tests.ups.tracking import TrackingResponseXml
+    from purplship.providers.ups.tracking import parse_tracking_response
+
+    return parse_tracking_response, _repeat(TrackingResponseXml, "Activity", 40), gateway.settings, 40
+
+
+def _repeat(response: str, tag: str, times: int) -> str:
+    """Repeat the `tag` nodes of a response to simulate long events histories"""
+    return re.sub(
+        rf"(<(?:\w+:)?{tag}>.*?</(?:\w+:)?{tag}>)",
+        lambda match: match.group(1) * times,
+        response,
+        flags=re.DOTALL,
+    )
+
+
+BENCHMARKS = [fedex_rate, ups_tracking]
+
+
+def measure(parse, response, settings) -> float:
+    return min(timeit.repeat(lambda: parse(XP.to_xml(response), settings), number=NUMBER, repeat=3)) / NUMBER * 1e3
+
+
+def main():
+    print(f"{'parser':<25}{'repeat':>8}{'build (ms)':>12}{'view (ms)':>12}{'speedup':>9}")
+    for benchmark in BENCHMARKS:
+        parse, response, settings, times = benchmark()
+        lazy = measure(parse, response, settings)
+        with patch.object(XP, "view", XP.build):
+            eager = measure(parse, response, settings)
+
+        print(f"{benchmark.__name__:<25}{times:>8}{eager:>12.2f}{lazy:>12.2f}{eager / lazy:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""XML response node lookups benchmark on the biggest carrier test fixtures.
+
+Usage:
+    python -m benchmarks.xml_lookup
+
+Reports the time (µs) taken to look up the nodes of a given local name in a parsed response:
+    xpath: the `.//*[local-name() = $name]` XPath scan (the former XP.find)
+    compiled: the same expression compiled once with etree.XPath
+    find: XP.find (lxml `{*}tag` filtered iteration)
+"""
+
+import timeit
+from lxml import etree
+from purplship.core.utils import XP
+
+FIXTURES = [
+    ("tests.fedex.rate", "RateResponseXml", "RateReplyDetails"),
+    ("tests.fedex.shipment", "ShipmentResponseXML", "Notifications"),
+    ("tests.dhl_express.shipment", "ShipmentResponseXml", "Condition"),
+    ("tests.ups.shipment", "NegotiatedShipmentResponseXML", "PackageResults"),
+]
+EXPRESSION = ".//*[local-name() = $name]"
+NUMBER = 200
+
+
+def measure(action) -> float:
+    return min(timeit.repeat(action, number=NUMBER, repeat=3)) / NUMBER * 1e6
+
+
+def main():
+    compiled = etree.XPath(EXPRESSION)
+    print(f"{'fixture':<50}{'nodes':>7}{'xpath':>9}{'compiled':>10}{'find':>8}")
+    for module, name, tag in FIXTURES:
+        response = XP.to_xml(getattr(__import__(module, fromlist=[name]), name))
+        timings = [
+            measure(lambda: response.xpath(EXPRESSION, name=tag)),
+            measure(lambda: compiled(response, name=tag)),
+            measure(lambda: XP.find(tag, response)),
+        ]
+        print(
+            f"{f'{module}.{name}':<50}{sum(1 for _ in response.iter()):>7}"
+            + "".join(f"{t:>{w}.1f}" for t, w in zip(timings, (9, 10, 8)))
+        )
+
+
+if __name__ == "__main__":
+    main()
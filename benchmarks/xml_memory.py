@@ -0,0 +1,56 @@
+"""XML responses deserialization memory benchmark on the biggest carrier test fixtures.
+
+Usage:
+    python -m benchmarks.xml_memory
+
+Reports the peak Python memory allocated (and the equivalent number of response body copies)
+while turning a response body received by the transport into an lxml tree:
+    str: the body decoded to str then re-encoded for lxml (the former request/XP.to_xml path)
+    bytes: the raw body handed to XP.to_xml (request(..., decoder=raw_bytes))
+"""
+
+import tracemalloc
+from typing import Callable
+from lxml import etree
+from purplship.core.utils import XP, decode_bytes, raw_bytes
+
+FIXTURES = [
+    ("tests.fedex.shipment", "ShipmentResponseXML"),
+    ("tests.fedex.rate", "RateResponseXml"),
+    ("tests.dhl_express.shipment", "ShipmentResponseXml"),
+    ("tests.ups.shipment", "NegotiatedShipmentResponseXML"),
+]
+
+
+def str_path(body: bytes):
+    xml_str = decode_bytes(body)
+    return etree.fromstring(bytes(bytearray(xml_str, encoding="utf-8")))
+
+
+def bytes_path(body: bytes):
+    return XP.to_xml(raw_bytes(body))
+
+
+def peak(path: Callable[[bytes], etree._Element], body: bytes) -> int:
+    tracemalloc.start()
+    tree = path(body)
+    _, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return peak_size
+
+
+def main():
+    print(f"{'fixture':<50}{'body (KiB)':>12}{'path':>7}{'peak (KiB)':>12}{'copies':>8}")
+    for module, name in FIXTURES:
+        body = getattr(__import__(module, fromlist=[name]), name).encode("utf-8")
+        for label, path in (("str", str_path), ("bytes", bytes_path)):
+            size = peak(path, body)
+            print(
+                f"{f'{module}.{name}':<50}{len(body) / 1024:>12.1f}{label:>7}"
+                f"{size / 1024:>12.1f}{size / len(body):>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ from purplship.providers.aramex import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    errors = response.xpath(".//*[local-name() = $name]", name="Notification")
+    errors = XP.find("Notification", response)
     return [_extract_error(node, settings) for node in errors]
 
 
@@ -26,10 +26,10 @@ from purplship.providers.aramex.error import parse_error_response
 
 def parse_tracking_response(response, settings: Settings) -> Tuple[List[TrackingDetails], List[Message]]:
     non_existents = next(
-        (XP.build(ArrayOfstring, n) for n in response.xpath(".//*[local-name() = $name]", name="NonExistingWaybills")),
+        (XP.build(ArrayOfstring, n) for n in XP.find("NonExistingWaybills", response)),
         ArrayOfstring()
     )
-    results = response.xpath(".//*[local-name() = $name]", name="TrackingResult")
+    results = XP.find("TrackingResult", response)
     tracking_details = [_extract_detail(node, settings) for node in results]
     errors = _extract_errors(non_existents, settings) + parse_error_response(response, settings)
 
@@ -1,4 +1,6 @@
 from purplship.core.metadata import Metadata
+from purplship.core.constraints import Constraints
+from purplship.core.units import Dimension, DimensionUnit, Weight, WeightUnit
 
 from purplship.mappers.canadapost.mapper import Mapper
 from purplship.mappers.canadapost.proxy import Proxy
@@ -18,4 +20,13 @@ METADATA = Metadata(
     options=units.OptionCode,
     package_presets=units.PackagePresets,
     services=units.ServiceType,
+
+    # Webservice limits
+    max_tracking_batch_size=1,
+    constraints=Constraints(
+        max_weight=Weight(30, WeightUnit.KG),
+        max_length=Dimension(200, DimensionUnit.CM),
+        max_length_plus_girth=Dimension(300, DimensionUnit.CM),
+        origin_countries=frozenset(["CA"]),
+    ),
 )
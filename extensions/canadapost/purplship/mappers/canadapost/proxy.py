@@ -1,9 +1,10 @@
 import base64
-import time
 from typing import List
 from canadapost_lib.rating import mailing_scenario
+from purplship.core.utils.xml import XMLBundle
 from purplship.api.proxy import Proxy as BaseProxy
 from purplship.core.errors import ShippingSDKError
+from purplship.core.limiter import RateLimit
 from purplship.core.utils.serializable import Serializable, Deserializable
 from purplship.core.utils.pipeline import Pipeline, Job
 from purplship.core.utils import (
@@ -16,6 +17,7 @@ from purplship.mappers.canadapost.settings import Settings
 
 class Proxy(BaseProxy):
     settings: Settings
+    rate_limit = RateLimit(rps=40)
 
     def get_rates(self, request: Serializable[mailing_scenario]) -> Deserializable[str]:
         response = http(
@@ -31,17 +33,12 @@ class Proxy(BaseProxy):
         )
         return Deserializable(response, XP.to_xml)
 
-    def get_tracking(self, request: Serializable[List[str]]) -> Deserializable[str]:
+    def get_tracking(self, request: Serializable[List[str]]) -> Deserializable[XMLBundle]:
         """
         get_tracking make parallel request for each pin
         """
-        _throttle = 0.0
 
         def track(tracking_pin: str) -> str:
-            nonlocal _throttle
-            time.sleep(_throttle)
-            _throttle += 0.025
-
             return http(
                 url=f"{self.settings.server_url}/vis/track/pin/{tracking_pin}/detail",
                 headers={
@@ -52,11 +49,11 @@ class Proxy(BaseProxy):
                 method="GET",
             )
 
-        response: List[str] = exec_async(track, request.serialize())
+        response: List[str] = exec_async(track, request.serialize(), max_workers=self.settings.max_concurrency)
 
-        return Deserializable(XP.bundle_xml(xml_strings=response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def create_shipment(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def create_shipment(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def _contract_shipment(job: Job):
             return http(
                 url=f"{self.settings.server_url}/rs/{self.settings.customer_number}/{self.settings.customer_number}/shipment",
@@ -112,7 +109,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
     def cancel_shipment(self, request: Serializable) -> Deserializable:
 
@@ -151,9 +148,9 @@ class Proxy(BaseProxy):
 
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def _availability(job: Job) -> str:
             return http(
                 url=f"{self.settings.server_url}/ad/pickup/pickupavailability/{job.data}",
@@ -194,9 +191,9 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def modify_pickup(self, request: Serializable[dict]) -> Deserializable[str]:
+    def modify_pickup(self, request: Serializable[dict]) -> Deserializable[XMLBundle]:
         def _get_pickup(job: Job) -> str:
             return http(
                 url=f"{self.settings.server_url}{job.data.serialize()}",
@@ -237,7 +234,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
     def cancel_pickup(self, request: Serializable[str]) -> Deserializable[str]:
         pickuprequest = request.serialize()
@@ -1,14 +1,14 @@
 from typing import List, Callable, cast, Any
 from functools import reduce
 from urllib.error import HTTPError
-from purplship.core.utils.xml import Element
+from purplship.core.utils import Element, XP
 from purplship.providers.canadapost import Settings
 from purplship.core.models import Message
 from canadapost_lib.messages import messageType
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    messages = response.xpath(".//*[local-name() = $name]", name="message")
+    messages = XP.find("message", response)
     return reduce(_extract_error(settings), messages, [])
 
 
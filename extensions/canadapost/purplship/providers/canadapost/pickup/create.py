@@ -39,7 +39,7 @@ def parse_pickup_response(
 ) -> Tuple[PickupDetails, List[Message]]:
     pickup = (
         _extract_pickup_details(response, settings)
-        if len(response.xpath(".//*[local-name() = $name]", name="pickup-request-header"))
+        if len(XP.find("pickup-request-header", response))
         > 0
         else None
     )
@@ -48,10 +48,10 @@ def parse_pickup_response(
 
 def _extract_pickup_details(response: Element, settings: Settings) -> PickupDetails:
     header = next(
-        (XP.build(PickupRequestHeaderType, elt) for elt in response.xpath(".//*[local-name() = $name]", name="pickup-request-header"))
+        (XP.build(PickupRequestHeaderType, elt) for elt in XP.find("pickup-request-header", response))
     )
     price = next(
-        (XP.build(PickupRequestPriceType, elt) for elt in response.xpath(".//*[local-name() = $name]", name="pickup-request-price")),
+        (XP.build(PickupRequestPriceType, elt) for elt in XP.find("pickup-request-price", response)),
         None
     )
 
@@ -174,7 +174,7 @@ def _create_pickup(availability_response: str, payload: PickupRequest, settings:
 
 
 def _get_pickup(update_response: str, payload: PickupUpdateRequest, settings: Settings) -> Job:
-    errors = parse_error_response(XP.to_xml(XP.bundle_xml([update_response])), settings)
+    errors = parse_error_response(XP.to_xml(XP.bundle([update_response])), settings)
     data = None if any(errors) else f"/enab/{settings.customer_number}/pickuprequest/{payload.confirmation_number}/details"
 
     return Job(id="get_pickup", data=Serializable(data), fallback="" if data is None else "")
@@ -47,7 +47,7 @@ def parse_shipment_response(
 ) -> Tuple[ShipmentDetails, List[Message]]:
     shipment = (
         _extract_shipment(response, settings)
-        if len(response.xpath(".//*[local-name() = $name]", name="shipment-id")) > 0
+        if len(XP.find("shipment-id", response)) > 0
         else None
     )
     return shipment, parse_error_response(response, settings)
@@ -55,9 +55,9 @@ def parse_shipment_response(
 
 def _extract_shipment(response: Element, settings: Settings) -> ShipmentDetails:
     info_node = next(
-        iter(response.xpath(".//*[local-name() = $name]", name="shipment-info"))
+        iter(XP.find("shipment-info", response))
     )
-    label = next(iter(response.xpath(".//*[local-name() = $name]", name="label")))
+    label = next(iter(XP.find("label", response)))
     errors = parse_error_response(label, settings)
     info: ShipmentInfoType = ShipmentInfoType()
     info.build(info_node)
@@ -37,8 +37,8 @@ def _create_shipment(payload: ShipmentRequest, settings: Settings) -> Job:
 
 def _get_shipment_label(shipement_response: str) -> Job:
     response = XP.to_xml(shipement_response)
-    has_errors = len(response.xpath(".//*[local-name() = $name]", name="message")) > 0
-    links = response.xpath(".//*[local-name() = $name]", name="link")
+    has_errors = len(XP.find("message", response)) > 0
+    links = XP.find("link", response)
     href, media = next(
         ((link.get("href"), link.get("media-type")) for link in links if link.get("rel") == "label"),
         (None, None),
@@ -40,7 +40,7 @@ def parse_shipment_response(
 ) -> Tuple[ShipmentDetails, List[Message]]:
     shipment = (
         _extract_shipment(response, settings)
-        if len(response.xpath(".//*[local-name() = $name]", name="shipment-id")) > 0
+        if len(XP.find("shipment-id", response)) > 0
         else None
     )
     return shipment, parse_error_response(response, settings)
@@ -48,9 +48,9 @@ def parse_shipment_response(
 
 def _extract_shipment(response: Element, settings: Settings) -> ShipmentDetails:
     info_node = next(
-        iter(response.xpath(".//*[local-name() = $name]", name="shipment-info"))
+        iter(XP.find("shipment-info", response))
     )
-    label_node = next(iter(response.xpath(".//*[local-name() = $name]", name="label")))
+    label_node = next(iter(XP.find("label", response)))
     errors = parse_error_response(label_node, settings)
     label = str(label_node.text) if len(errors) == 0 else None
     info: NonContractShipmentInfoType = NonContractShipmentInfoType()
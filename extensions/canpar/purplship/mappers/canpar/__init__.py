@@ -14,4 +14,7 @@ METADATA = Metadata(
     Settings=Settings,
 
     # Data Units
+
+    # Webservice limits
+    max_tracking_batch_size=1,
 )
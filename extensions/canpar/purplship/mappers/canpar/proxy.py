@@ -7,9 +7,10 @@ from purplship.core.utils import (
     Job,
     XP,
     request as http,
-    exec_parrallel
+    exec_async
 )
 from purplship.mappers.canpar.settings import Settings
+from purplship.core.utils.xml import XMLBundle
 from purplship.api.proxy import Proxy as BaseProxy
 
 
@@ -47,7 +48,7 @@ class Proxy(BaseProxy):
 
         return Deserializable(response, XP.to_xml)
 
-    def get_tracking(self, request: Serializable[List[Envelope]]) -> Deserializable[str]:
+    def get_tracking(self, request: Serializable[List[Envelope]]) -> Deserializable[XMLBundle]:
         """
         get_tracking make parallel request for each TrackRequest
         """
@@ -59,11 +60,11 @@ class Proxy(BaseProxy):
                 request=Serializable(track_request),
             )
 
-        response: List[str] = exec_parrallel(get_tracking, request.serialize())
+        response: List[str] = exec_async(get_tracking, request.serialize(), max_workers=self.settings.max_concurrency)
 
-        return Deserializable(XP.bundle_xml(xml_strings=response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def create_shipment(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def create_shipment(self, request: Serializable[Envelope]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -80,7 +81,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
     def cancel_shipment(self, request: Serializable[Envelope]) -> Deserializable[str]:
         response = self._send_request(
@@ -100,7 +101,7 @@ class Proxy(BaseProxy):
 
         return Deserializable(response, XP.to_xml)
 
-    def modify_pickup(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def modify_pickup(self, request: Serializable[Envelope]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -117,7 +118,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
     def cancel_pickup(self, request: Serializable[Envelope]) -> Deserializable[str]:
         response = self._send_request(
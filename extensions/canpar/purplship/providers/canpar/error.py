@@ -1,11 +1,11 @@
 from typing import List
 from purplship.core.models import Message
-from purplship.core.utils import Element, extract_fault
+from purplship.core.utils import Element, XP, extract_fault
 from purplship.providers.canpar.utils import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    errors: List[Element] = response.xpath(".//*[local-name() = $name]", name="error")
+    errors: List[Element] = XP.find("error", response)
     return (
         extract_fault(response, settings) +
         [
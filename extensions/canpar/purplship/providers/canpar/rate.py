@@ -22,7 +22,7 @@ from purplship.providers.canpar.units import WeightUnit, DimensionUnit, Option,
 
 
 def parse_rate_response(response: Element, settings: Settings) -> Tuple[List[RateDetails], List[Message]]:
-    shipment_nodes = response.xpath(".//*[local-name() = $name]", name="shipment")
+    shipment_nodes = XP.find("shipment", response)
     rates: List[RateDetails] = [
         _extract_rate_details(node, settings) for node in shipment_nodes
     ]
@@ -32,7 +32,7 @@ from purplship.providers.canpar.rate import _extract_rate_details
 
 def parse_shipment_response(response: Element, settings: Settings) -> Tuple[ShipmentDetails, List[Message]]:
     shipment = XP.build(
-        Shipment, next(iter(response.xpath(".//*[local-name() = $name]", name="shipment")), None)
+        Shipment, next(iter(XP.find("shipment", response)), None)
     )
     success = (shipment is not None and shipment.id is not None)
     shipment_details = _extract_details(response, settings) if success else None
@@ -41,8 +41,8 @@ def parse_shipment_response(response: Element, settings: Settings) -> Tuple[Ship
 
 
 def _extract_details(response: Element, settings: Settings) -> ShipmentDetails:
-    shipment_node = next(iter(response.xpath(".//*[local-name() = $name]", name="shipment")), None)
-    label = next(iter(response.xpath(".//*[local-name() = $name]", name="labels")), None)
+    shipment_node = next(iter(XP.find("shipment", response)), None)
+    label = next(iter(XP.find("labels", response)), None)
     shipment = XP.build(Shipment, shipment_node)
     tracking_number = next(iter(shipment.packages), Package()).barcode
 
@@ -175,7 +175,7 @@ def _process_shipment(payload: ShipmentRequest, settings: Settings) -> Job:
 def _get_label(shipment_response: str, settings: Settings) -> Job:
     response = XP.to_xml(shipment_response)
     shipment = XP.build(
-        Shipment, next(iter(response.xpath(".//*[local-name() = $name]", name="shipment")), None)
+        Shipment, next(iter(XP.find("shipment", response)), None)
     )
     success = (shipment is not None and shipment.id is not None)
     data = (
@@ -25,7 +25,7 @@ from purplship.providers.canpar.utils import Settings
 
 
 def parse_tracking_response(response: Element, settings: Settings) -> Tuple[List[TrackingDetails], List[Message]]:
-    results = response.xpath(".//*[local-name() = $name]", name="result")
+    results = XP.find("result", response)
     details: List[TrackingDetails] = [
         _extract_tracking_details(result, settings) for result in results
     ]
@@ -19,4 +19,7 @@ METADATA = Metadata(
     package_presets=units.PackagePresets,
     packaging_types=units.DCTPackageType,
     services=units.ProductCode,
+
+    # Webservice limits
+    max_tracking_batch_size=10,
 )
@@ -1,5 +1,5 @@
 from typing import Any
-from purplship.core.utils import XP, request as http, Serializable, Deserializable
+from purplship.core.utils import XP, request as http, raw_bytes, Serializable, Deserializable
 from purplship.api.proxy import Proxy as BaseProxy
 from dhl_express_lib.dct_req_global_2_0 import DCTRequest
 from dhl_express_lib.tracking_request_known_1_0 import KnownTrackingRequest
@@ -14,55 +14,56 @@ from purplship.mappers.dhl_express.settings import Settings
 class Proxy(BaseProxy):
     settings: Settings
 
-    def _send_request(self, request: Serializable[Any]) -> str:
+    def _send_request(self, request: Serializable[Any]) -> bytes:
         return http(
             url=self.settings.server_url,
-            data=bytearray(request.serialize(), "utf-8"),
+            data=request.serialize().encode("utf-8"),
             headers={"Content-Type": "application/xml"},
             method="POST",
+            decoder=raw_bytes,
         )
 
-    def validate_address(self, request: Serializable[RouteRequest]) -> Deserializable[str]:
+    def validate_address(self, request: Serializable[RouteRequest]) -> Deserializable[bytes]:
         response = self._send_request(request)
 
         return Deserializable(response, XP.to_xml)
 
-    def get_rates(self, request: Serializable[DCTRequest]) -> Deserializable[str]:
+    def get_rates(self, request: Serializable[DCTRequest]) -> Deserializable[bytes]:
         response = self._send_request(request)
 
         return Deserializable(response, XP.to_xml)
 
     def get_tracking(
         self, request: Serializable[KnownTrackingRequest]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[bytes]:
         response = self._send_request(request)
 
         return Deserializable(response, XP.to_xml)
 
     def create_shipment(
         self, request: Serializable[ShipmentRequest]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[bytes]:
         response = self._send_request(request)
 
         return Deserializable(response, XP.to_xml)
 
     def schedule_pickup(
         self, request: Serializable[BookPURequest]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[bytes]:
         response = self._send_request(request)
 
         return Deserializable(response, XP.to_xml)
 
     def modify_pickup(
         self, request: Serializable[ModifyPURequest]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[bytes]:
         response = self._send_request(request)
 
         return Deserializable(response, XP.to_xml)
 
     def cancel_pickup(
         self, request: Serializable[CancelPURequest]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[bytes]:
         response = self._send_request(request)
 
         return Deserializable(response, XP.to_xml)
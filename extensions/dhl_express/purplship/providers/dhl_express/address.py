@@ -5,7 +5,7 @@ from dhl_express_lib.routing_global_req_2_0 import (
     MetaData,
     Note
 )
-from purplship.core.units import CountryState, Country
+from purplship.core.units import COUNTRIES, state_name
 from purplship.core.utils import Serializable, Element, SF, XP
 from purplship.core.models import AddressValidationRequest, Message, AddressValidationDetails
 from purplship.providers.dhl_express.units import CountryRegion
@@ -14,7 +14,7 @@ from purplship.providers.dhl_express.error import parse_error_response
 
 
 def parse_address_validation_response(response: Element, settings: Settings) -> Tuple[AddressValidationDetails, List[Message]]:
-    notes = response.xpath(".//*[local-name() = $name]", name="Note")
+    notes = XP.find("Note", response)
     success = next((True for note in notes if XP.build(Note, note).ActionNote == "Success"), False)
     validation_details = AddressValidationDetails(
         carrier_id=settings.carrier_id,
@@ -26,15 +26,8 @@ def parse_address_validation_response(response: Element, settings: Settings) ->
 
 
 def address_validation_request(payload: AddressValidationRequest, settings: Settings) -> Serializable[RouteRequest]:
-    country = (
-        Country[payload.address.country_code] if payload.address.country_code is not None else None
-    )
-    division = (
-        CountryState[country.name].value[payload.address.state_code].value if (
-            country.name in CountryState.__members__ and
-            payload.address.state_code in CountryState[country.name].value.__members__
-        ) else None
-    )
+    country_code = payload.address.country_code
+    division = state_name(country_code, payload.address.state_code)
 
     request = RouteRequest(
         schemaVersion="2.0",
@@ -49,8 +42,8 @@ def address_validation_request(payload: AddressValidationRequest, settings: Sett
         PostalCode=payload.address.postal_code,
         City=payload.address.city,
         Division=division,
-        CountryCode=country.name,
-        CountryName=country.value,
+        CountryCode=country_code,
+        CountryName=COUNTRIES.name(country_code),
         OriginCountryCode=payload.address.country_code,
     )
     return Serializable(request, _request_serializer)
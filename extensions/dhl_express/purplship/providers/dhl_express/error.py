@@ -1,13 +1,13 @@
 from typing import List, Callable
 from functools import reduce
-from purplship.core.utils.xml import Element
+from purplship.core.utils import Element, XP
 from purplship.providers.dhl_express import Settings
 from purplship.core.models import Message
 from dhl_express_lib.dct_response_global_2_0 import ConditionType
 
 
 def parse_error_response(response, settings: Settings) -> List[Message]:
-    conditions = response.xpath(".//*[local-name() = $name]", name="Condition")
+    conditions = XP.find("Condition", response)
     return reduce(_extract_error(settings), conditions, [])
 
 
@@ -16,7 +16,7 @@ def parse_pickup_cancel_response(
     response, settings
 ) -> Tuple[ConfirmationDetails, List[Message]]:
     successful = (
-        len(response.xpath(".//*[local-name() = $name]", name="ConfirmationNumber")) > 0
+        len(XP.find("ConfirmationNumber", response)) > 0
     )
     cancellation = (
         ConfirmationDetails(
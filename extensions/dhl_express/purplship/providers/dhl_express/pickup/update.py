@@ -34,7 +34,7 @@ def parse_pickup_update_response(
     response, settings: Settings
 ) -> Tuple[PickupDetails, List[Message]]:
     successful = (
-        len(response.xpath(".//*[local-name() = $name]", name="ConfirmationNumber")) > 0
+        len(XP.find("ConfirmationNumber", response)) > 0
     )
     pickup = _extract_pickup(response, settings) if successful else None
     return pickup, parse_error_response(response, settings)
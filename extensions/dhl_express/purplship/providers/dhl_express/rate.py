@@ -35,7 +35,7 @@ from purplship.providers.dhl_express.error import parse_error_response
 def parse_rate_response(
     response: Element, settings: Settings
 ) -> Tuple[List[RateDetails], List[Message]]:
-    qtdshp_list = response.xpath(".//*[local-name() = $name]", name="QtdShp")
+    qtdshp_list = XP.find("QtdShp", response)
     quotes: List[RateDetails] = [
         _extract_quote(qtdshp_node, settings) for qtdshp_node in qtdshp_list
     ]
@@ -57,7 +57,7 @@ def parse_shipment_response(
         response: Element, settings: Settings
 ) -> Tuple[ShipmentDetails, List[Message]]:
     air_way_bill = next(
-        iter(response.xpath(".//*[local-name() = $name]", name="AirwayBillNumber")),
+        iter(XP.find("AirwayBillNumber", response)),
         None,
     )
     return (
@@ -67,8 +67,8 @@ def parse_shipment_response(
 
 
 def _extract_shipment(shipment_node, settings: Settings) -> Optional[ShipmentDetails]:
-    tracking_number = shipment_node.xpath(".//*[local-name() = $name]", name="AirwayBillNumber")[0].text
-    label_node = shipment_node.xpath(".//*[local-name() = $name]", name="LabelImage")[0]
+    tracking_number = XP.find("AirwayBillNumber", shipment_node)[0].text
+    label_node = XP.find("LabelImage", shipment_node)[0]
     label = encodebytes(XP.build(LabelImage, label_node).OutputImage).decode("utf-8")
 
     return ShipmentDetails(
@@ -20,7 +20,7 @@ from .error import parse_error_response
 def parse_tracking_response(
     response: Element, settings: Settings
 ) -> Tuple[List[TrackingDetails], List[Message]]:
-    awb_nodes = response.xpath(".//*[local-name() = $name]", name="AWBInfo")
+    awb_nodes = XP.find("AWBInfo", response)
 
     tracking_details = [
         _extract_tracking(info_node, settings) for info_node in awb_nodes
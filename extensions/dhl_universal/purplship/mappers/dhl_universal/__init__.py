@@ -12,4 +12,7 @@ METADATA = Metadata(
     Mapper=Mapper,
     Proxy=Proxy,
     Settings=Settings,
+
+    # Webservice limits
+    max_tracking_batch_size=1,
 )
@@ -19,5 +19,8 @@ METADATA = Metadata(
     package_presets=units.PackagePresets,
     packaging_types=units.PackagingType,
     services=units.ServiceType,
+
+    # Webservice limits
+    max_tracking_batch_size=30,
 )
 
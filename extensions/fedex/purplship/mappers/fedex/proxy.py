@@ -2,12 +2,14 @@ from typing import Any
 from purplship.core.utils import (
     XP,
     request as http,
+    raw_bytes,
     Pipeline,
     Serializable,
     Deserializable,
     Job,
     Envelope
 )
+from purplship.core.utils.xml import XMLBundle
 from purplship.api.proxy import Proxy as BaseProxy
 from purplship.mappers.fedex.settings import Settings
 
@@ -15,42 +17,43 @@ from purplship.mappers.fedex.settings import Settings
 class Proxy(BaseProxy):
     settings: Settings
 
-    def _send_request(self, path: str, request: Serializable[Any]) -> str:
+    def _send_request(self, path: str, request: Serializable[Any]) -> bytes:
         return http(
             url=f"{self.settings.server_url}{path}",
-            data=bytearray(request.serialize(), "utf-8"),
+            data=request.serialize().encode("utf-8"),
             headers={"Content-Type": "application/xml"},
             method="POST",
+            decoder=raw_bytes,
         )
 
-    def validate_address(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def validate_address(self, request: Serializable[Envelope]) -> Deserializable[bytes]:
         response = self._send_request("/addressvalidation", request)
 
         return Deserializable(response, XP.to_xml)
 
-    def get_rates(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def get_rates(self, request: Serializable[Envelope]) -> Deserializable[bytes]:
         response = self._send_request("/rate", request)
 
         return Deserializable(response, XP.to_xml)
 
-    def get_tracking(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def get_tracking(self, request: Serializable[Envelope]) -> Deserializable[bytes]:
         response = self._send_request("/track", request)
 
         return Deserializable(response, XP.to_xml)
 
     def create_shipment(
         self, request: Serializable[Envelope]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[bytes]:
         response = self._send_request("/ship", request)
 
         return Deserializable(response, XP.to_xml)
 
-    def cancel_shipment(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def cancel_shipment(self, request: Serializable[Envelope]) -> Deserializable[bytes]:
         response = self._send_request("/ship", request)
 
         return Deserializable(response, XP.to_xml)
 
-    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -60,9 +63,9 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def modify_pickup(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def modify_pickup(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -72,11 +75,11 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
     def cancel_pickup(
         self, request: Serializable[Envelope]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[bytes]:
         response = self._send_request("/pickup", request)
 
         return Deserializable(response, XP.to_xml)
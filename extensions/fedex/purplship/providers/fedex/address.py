@@ -18,7 +18,7 @@ from purplship.providers.fedex.error import parse_error_response
 def parse_address_validation_response(response: Element, settings: Settings) -> Tuple[AddressValidationDetails, List[Message]]:
     reply = XP.build(
         AddressValidationReply,
-        next(iter(response.xpath(".//*[local-name() = $name]", name="AddressValidationReply")), None)
+        next(iter(XP.find("AddressValidationReply", response)), None)
     )
     address: FedexAddress = next((result.EffectiveAddress for result in reply.AddressResults), None)
     success = reply.HighestSeverity == NotificationSeverityType.SUCCESS.value
@@ -6,9 +6,7 @@ from purplship.providers.fedex.utils import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    notifications = response.xpath(
-        ".//*[local-name() = $name]", name="Notifications"
-    ) + response.xpath(".//*[local-name() = $name]", name="Notification")
+    notifications = XP.find("Notifications", response) + XP.find("Notification", response)
     errors = [_extract_error(node, settings) for node in notifications] + extract_fault(
         response, settings
     )
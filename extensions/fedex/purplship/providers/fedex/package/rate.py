@@ -3,6 +3,8 @@ from typing import Tuple, List, Optional, cast
 from fedex_lib.rate_service_v28 import (
     RateRequest as FedexRateRequest,
     RateReplyDetail,
+    WebAuthenticationDetail,
+    ClientDetail,
     TransactionDetail,
     VersionId,
     RequestedShipment,
@@ -28,7 +30,7 @@ from purplship.providers.fedex.utils import Settings
 def parse_rate_response(
     response: Element, settings: Settings
 ) -> Tuple[List[RateDetails], List[Message]]:
-    rate_reply = response.xpath(".//*[local-name() = $name]", name="RateReplyDetails")
+    rate_reply = XP.find("RateReplyDetails", response)
     rate_details: List[RateDetails] = [
         _extract_rate(detail_node, settings) for detail_node in rate_reply
     ]
@@ -39,8 +41,7 @@ def parse_rate_response(
 
 
 def _extract_rate(detail_node: Element, settings: Settings) -> Optional[RateDetails]:
-    rate: RateReplyDetail = RateReplyDetail()
-    rate.build(detail_node)
+    rate: RateReplyDetail = XP.view(RateReplyDetail, detail_node)
 
     service = ServiceType(rate.ServiceType).name
     rate_type = rate.ActualRateType
@@ -102,10 +103,20 @@ def rate_request(
     request_types = ["LIST"] + ([] if "currency" not in options else ["PREFERRED"])
 
     request = FedexRateRequest(
-        WebAuthenticationDetail=settings.webAuthenticationDetail,
-        ClientDetail=settings.clientDetail,
-        TransactionDetail=TransactionDetail(CustomerTransactionId="FTC"),
-        Version=VersionId(ServiceId="crs", Major=28, Intermediate=0, Minor=0),
+        WebAuthenticationDetail=XP.fragment(
+            (WebAuthenticationDetail, settings.user_key, settings.password),
+            lambda: settings.webAuthenticationDetail,
+        ),
+        ClientDetail=XP.fragment(
+            (ClientDetail, settings.account_number, settings.meter_number),
+            lambda: settings.clientDetail,
+        ),
+        TransactionDetail=XP.fragment(
+            TransactionDetail, lambda: TransactionDetail(CustomerTransactionId="FTC")
+        ),
+        Version=XP.fragment(
+            VersionId, lambda: VersionId(ServiceId="crs", Major=28, Intermediate=0, Minor=0)
+        ),
         ReturnTransitAndCommit=True,
         CarrierCodes=None,
         VariableOptions=None,
@@ -123,37 +134,40 @@ def rate_request(
             TotalInsuredValue=None,
             PreferredCurrency=options.currency,
             ShipmentAuthorizationDetail=None,
-            Shipper=Party(
-                AccountNumber=settings.account_number,
-                Tins=(
-                    [TaxpayerIdentification(Number=tax) for tax in shipper.taxes]
-                    if shipper.has_tax_info else None
-                ),
-                Contact=(
-                    Contact(
-                        ContactId=None,
-                        PersonName=shipper.person_name,
-                        Title=None,
-                        CompanyName=shipper.company_name,
-                        PhoneNumber=shipper.phone_number,
-                        PhoneExtension=None,
-                        TollFreePhoneNumber=None,
-                        PagerNumber=None,
-                        FaxNumber=None,
-                        EMailAddress=shipper.email,
-                    )
-                    if shipper.has_contact_info else None
-                ),
-                Address=Address(
-                    StreetLines=shipper.address_lines,
-                    City=shipper.city,
-                    StateOrProvinceCode=shipper.state_code,
-                    PostalCode=shipper.postal_code,
-                    UrbanizationCode=None,
-                    CountryCode=shipper.country_code,
-                    CountryName=shipper.country_name,
-                    Residential=shipper.residential,
-                    GeographicCoordinates=None,
+            Shipper=XP.fragment(
+                (Party, settings.account_number, repr(payload.shipper)),
+                lambda: Party(
+                    AccountNumber=settings.account_number,
+                    Tins=(
+                        [TaxpayerIdentification(Number=tax) for tax in shipper.taxes]
+                        if shipper.has_tax_info else None
+                    ),
+                    Contact=(
+                        Contact(
+                            ContactId=None,
+                            PersonName=shipper.person_name,
+                            Title=None,
+                            CompanyName=shipper.company_name,
+                            PhoneNumber=shipper.phone_number,
+                            PhoneExtension=None,
+                            TollFreePhoneNumber=None,
+                            PagerNumber=None,
+                            FaxNumber=None,
+                            EMailAddress=shipper.email,
+                        )
+                        if shipper.has_contact_info else None
+                    ),
+                    Address=Address(
+                        StreetLines=shipper.address_lines,
+                        City=shipper.city,
+                        StateOrProvinceCode=shipper.state_code,
+                        PostalCode=shipper.postal_code,
+                        UrbanizationCode=None,
+                        CountryCode=shipper.country_code,
+                        CountryName=shipper.country_name,
+                        Residential=shipper.residential,
+                        GeographicCoordinates=None,
+                    ),
                 ),
             ),
             Recipient=Party(
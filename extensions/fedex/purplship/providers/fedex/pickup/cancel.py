@@ -31,7 +31,7 @@ def parse_pickup_cancel_response(
         CancelPickupReply,
         next(
             iter(
-                response.xpath(".//*[local-name() = $name]", name="CancelPickupReply")
+                XP.find("CancelPickupReply", response)
             ),
             None,
         ),
@@ -46,7 +46,7 @@ def parse_pickup_response(
         CreatePickupReply,
         next(
             iter(
-                response.xpath(".//*[local-name() = $name]", name="CreatePickupReply")
+                XP.find("CreatePickupReply", response)
             ),
             None,
         ),
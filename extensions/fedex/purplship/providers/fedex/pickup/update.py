@@ -52,9 +52,7 @@ def _cancel_pickup_request(
 ):
     reply = next(
         iter(
-            XP.to_xml(response).xpath(
-                ".//*[local-name() = $name]", name="CreatePickupReply"
-            )
+            XP.find("CreatePickupReply", XP.to_xml(response))
         ),
         None,
     )
@@ -23,7 +23,7 @@ from purplship.providers.fedex.utils import Settings
 def parse_tracking_response(
     response: Element, settings: Settings
 ) -> Tuple[List[TrackingDetails], List[Message]]:
-    track_details = response.xpath(".//*[local-name() = $name]", name="TrackDetails")
+    track_details = XP.find("TrackDetails", response)
     tracking_details = [
         _extract_tracking(track_detail_node, settings)
         for track_detail_node in track_details
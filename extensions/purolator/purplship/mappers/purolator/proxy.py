@@ -2,6 +2,7 @@ import logging
 from typing import Any
 from pysoap.envelope import Envelope
 from purplship.core.utils import XP, request as http, Pipeline, Job
+from purplship.core.utils.xml import XMLBundle
 from purplship.api.proxy import Proxy as BaseProxy
 from purplship.mappers.purolator.settings import Settings
 from purplship.core.utils.serializable import Serializable, Deserializable
@@ -53,7 +54,7 @@ class Proxy(BaseProxy):
 
         return Deserializable(response, XP.to_xml)
 
-    def create_shipment(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def create_shipment(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -72,7 +73,7 @@ class Proxy(BaseProxy):
 
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
     def cancel_shipment(self, request: Serializable) -> Deserializable:
         response = self._send_request(
@@ -83,7 +84,7 @@ class Proxy(BaseProxy):
 
         return Deserializable(response, XP.to_xml)
 
-    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -100,9 +101,9 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def modify_pickup(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def modify_pickup(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -119,7 +120,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
     def cancel_pickup(self, request: Serializable[Envelope]) -> Deserializable[str]:
         response = self._send_request(
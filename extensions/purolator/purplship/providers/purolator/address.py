@@ -16,7 +16,7 @@ def parse_address_validation_response(response: Element, settings: Settings) ->
     errors = parse_error_response(response, settings)
     reply = XP.build(
         ValidateCityPostalCodeZipResponse,
-        next(iter(response.xpath(".//*[local-name() = $name]", name="ValidateCityPostalCodeZipResponse")), None)
+        next(iter(XP.find("ValidateCityPostalCodeZipResponse", response)), None)
     )
     address: ShortAddress = next((result.Address for result in reply.SuggestedAddresses.SuggestedAddress), None)
     success = len(errors) == 0
@@ -1,13 +1,13 @@
 from typing import List
 from purolator_lib.estimate_service_2_1_2 import Error
 from purplship.core.models import Message
-from purplship.core.utils.xml import Element
+from purplship.core.utils import Element, XP
 from purplship.core.utils.soap import extract_fault
 from .utils import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    errors = response.xpath(".//*[local-name() = $name]", name="Error")
+    errors = XP.find("Error", response)
     return [_extract_error(node, settings) for node in errors] + extract_fault(
         response, settings
     )
@@ -32,7 +32,7 @@ from purolator_lib.estimate_service_2_1_2 import (
     OptionIDValuePair,
 )
 from purplship.core.units import Currency, Packages, Options, Phone, Services
-from purplship.core.utils import Serializable, Element, SF, NF, create_envelope
+from purplship.core.utils import Serializable, Element, SF, NF, XP, create_envelope
 from purplship.core.models import RateRequest, RateDetails, Message, ChargeDetails
 from purplship.providers.purolator.utils import Settings, standard_request_serializer
 from purplship.providers.purolator.error import parse_error_response
@@ -44,7 +44,7 @@ from purplship.providers.purolator.units import (
 def parse_rate_response(
     response: Element, settings: Settings
 ) -> Tuple[List[RateDetails], List[Message]]:
-    estimates = response.xpath(".//*[local-name() = $name]", name="ShipmentEstimate")
+    estimates = XP.find("ShipmentEstimate", response)
     return (
         [_extract_rate(node, settings) for node in estimates],
         parse_error_response(response, settings),
@@ -121,45 +121,51 @@ def rate_request(payload: RateRequest, settings: Settings) -> Serializable[Envel
         show_alternate_services = options['purolator_show_alternative_services'] is True
 
     request = create_envelope(
-        header_content=RequestContext(
-            Version="2.1",
-            Language=settings.language,
-            GroupID="",
-            RequestReference="",
-            UserToken=settings.user_token,
+        header_content=XP.fragment(
+            (RequestContext, settings.language, settings.user_token),
+            lambda: RequestContext(
+                Version="2.1",
+                Language=settings.language,
+                GroupID="",
+                RequestReference="",
+                UserToken=settings.user_token,
+            ),
         ),
         body_content=GetFullEstimateRequest(
             Shipment=Shipment(
-                SenderInformation=SenderInformation(
-                    Address=Address(
-                        Name=payload.shipper.person_name or "",
-                        Company=payload.shipper.company_name,
-                        Department=None,
-                        StreetNumber="",
-                        StreetSuffix=None,
-                        StreetName=SF.concat_str(payload.shipper.address_line1, join=True),
-                        StreetType=None,
-                        StreetDirection=None,
-                        Suite=None,
-                        Floor=None,
-                        StreetAddress2=SF.concat_str(
-                            payload.shipper.address_line2, join=True
+                SenderInformation=XP.fragment(
+                    (SenderInformation, repr(payload.shipper)),
+                    lambda: SenderInformation(
+                        Address=Address(
+                            Name=payload.shipper.person_name or "",
+                            Company=payload.shipper.company_name,
+                            Department=None,
+                            StreetNumber="",
+                            StreetSuffix=None,
+                            StreetName=SF.concat_str(payload.shipper.address_line1, join=True),
+                            StreetType=None,
+                            StreetDirection=None,
+                            Suite=None,
+                            Floor=None,
+                            StreetAddress2=SF.concat_str(
+                                payload.shipper.address_line2, join=True
+                            ),
+                            StreetAddress3=None,
+                            City=payload.shipper.city or "",
+                            Province=payload.shipper.state_code or "",
+                            Country=payload.shipper.country_code or "",
+                            PostalCode=payload.shipper.postal_code or "",
+                            PhoneNumber=PhoneNumber(
+                                CountryCode=shipper_phone.country_code or "0",
+                                AreaCode=shipper_phone.area_code or "0",
+                                Phone=shipper_phone.phone or "0",
+                                Extension=None,
+                            ),
+                            FaxNumber=None,
                         ),
-                        StreetAddress3=None,
-                        City=payload.shipper.city or "",
-                        Province=payload.shipper.state_code or "",
-                        Country=payload.shipper.country_code or "",
-                        PostalCode=payload.shipper.postal_code or "",
-                        PhoneNumber=PhoneNumber(
-                            CountryCode=shipper_phone.country_code or "0",
-                            AreaCode=shipper_phone.area_code or "0",
-                            Phone=shipper_phone.phone or "0",
-                            Extension=None,
+                        TaxNumber=(
+                            payload.shipper.federal_tax_id or payload.shipper.state_tax_id
                         ),
-                        FaxNumber=None,
-                    ),
-                    TaxNumber=(
-                        payload.shipper.federal_tax_id or payload.shipper.state_tax_id
                     ),
                 ),
                 ReceiverInformation=ReceiverInformation(
@@ -25,9 +25,7 @@ from purplship.providers.purolator.error import parse_error_response
 def parse_tracking_response(
     response: Element, settings: Settings
 ) -> Tuple[List[TrackingDetails], List[Message]]:
-    track_infos = response.xpath(
-        ".//*[local-name() = $name]", name="TrackingInformation"
-    )
+    track_infos = XP.find("TrackingInformation", response)
     return (
         [_extract_tracking(node, settings) for node in track_infos],
         parse_error_response(response, settings),
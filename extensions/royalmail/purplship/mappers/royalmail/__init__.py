@@ -19,4 +19,7 @@ METADATA = Metadata(
     # package_presets=units.PackagePresets,
     # packaging_types=units.PackagingType,
     # services=units.Serives,
+
+    # Webservice limits
+    max_tracking_batch_size=1,
 )
@@ -23,5 +23,5 @@ class Proxy(BaseProxy):
                 method="GET",
             )
 
-        responses: List[dict] = exec_async(_get_tracking, request.serialize())
+        responses: List[dict] = exec_async(_get_tracking, request.serialize(), max_workers=self.settings.max_concurrency)
         return Deserializable(responses, lambda res: [DP.to_dict(r) for r in res if any(r.strip())])
@@ -22,7 +22,7 @@ class Proxy(BaseProxy):
             )
             return ref, response
 
-        responses: List[Tuple[str, str]] = exec_async(_get_tracking, request.serialize())
+        responses: List[Tuple[str, str]] = exec_async(_get_tracking, request.serialize(), max_workers=self.settings.max_concurrency)
         return Deserializable(
             responses,
             lambda res: [(num, DP.to_dict(track)) for num, track in res if any(track.strip())]
@@ -27,7 +27,7 @@ from purplship.providers.tnt.error import parse_error_response
 def parse_rate_response(
     response: Element, settings: Settings
 ) -> Tuple[List[RateDetails], List[Message]]:
-    price_node = next(response.xpath(".//*[local-name() = $name]", name="priceResponse"), None)
+    price_node = next(XP.find("priceResponse", response), None)
     price_response = XP.build(priceResponse, price_node)
 
     if price_response is not None and price_response.ratedServices is not None:
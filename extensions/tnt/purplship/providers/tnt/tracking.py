@@ -24,7 +24,7 @@ from purplship.providers.tnt.error import parse_error_response
 
 
 def parse_tracking_response(response, settings: Settings) -> Tuple[List[TrackingDetails], List[Message]]:
-    details = response.xpath(".//*[local-name() = $name]", name="Consignment")
+    details = XP.find("Consignment", response)
     tracking_details = [_extract_detail(node, settings) for node in details]
 
     return tracking_details, parse_error_response(response, settings)
@@ -1,4 +1,6 @@
 from purplship.core.metadata import Metadata
+from purplship.core.constraints import Constraints
+from purplship.core.units import Dimension, DimensionUnit, Weight, WeightUnit
 
 from purplship.mappers.ups.mapper import Mapper
 from purplship.mappers.ups.proxy import Proxy
@@ -19,4 +21,12 @@ METADATA = Metadata(
     package_presets=units.PackagePresets,
     packaging_types=units.RatingPackagingType,
     services=units.ShippingServiceCode,
+
+    # Webservice limits
+    max_tracking_batch_size=1,
+    constraints=Constraints(
+        max_weight=Weight(150, WeightUnit.LB),
+        max_length=Dimension(108, DimensionUnit.IN),
+        max_length_plus_girth=Dimension(165, DimensionUnit.IN),
+    ),
 )
@@ -3,13 +3,15 @@ from ups_lib.av_request import AddressValidationRequest
 from purplship.core.utils import (
     XP,
     request as http,
-    exec_parrallel,
+    raw_bytes,
+    exec_async,
     Serializable,
     Deserializable,
     Envelope,
     Pipeline,
     Job
 )
+from purplship.core.utils.xml import XMLBundle
 from purplship.api.proxy import Proxy as BaseProxy
 from purplship.mappers.ups.settings import Settings
 
@@ -17,27 +19,28 @@ from purplship.mappers.ups.settings import Settings
 class Proxy(BaseProxy):
     settings: Settings
 
-    def _send_request(self, path: str, request: Serializable[Any]) -> str:
+    def _send_request(self, path: str, request: Serializable[Any]) -> bytes:
         return http(
             url=f"{self.settings.server_url}{path}",
-            data=bytearray(request.serialize(), "utf-8"),
+            data=request.serialize().encode("utf-8"),
             headers={"Content-Type": "application/xml"},
             method="POST",
+            decoder=raw_bytes,
         )
 
-    def validate_address(self, request: Serializable[AddressValidationRequest]) -> Deserializable[str]:
+    def validate_address(self, request: Serializable[AddressValidationRequest]) -> Deserializable[bytes]:
         response = self._send_request("/AV", request)
 
         return Deserializable(response, XP.to_xml)
 
-    def get_rates(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def get_rates(self, request: Serializable[Envelope]) -> Deserializable[bytes]:
         response = self._send_request("/Rate", request)
 
         return Deserializable(response, XP.to_xml)
 
     def get_tracking(
         self, request: Serializable[List[Envelope]]
-    ) -> Deserializable[str]:
+    ) -> Deserializable[XMLBundle]:
         """
         get_tracking make parallel request for each TrackRequest
         """
@@ -45,21 +48,21 @@ class Proxy(BaseProxy):
         def get_tracking(track_request: str):
             return self._send_request("/Track", Serializable(track_request))
 
-        response: List[str] = exec_parrallel(get_tracking, request.serialize())
+        response: List[bytes] = exec_async(get_tracking, request.serialize(), max_workers=self.settings.max_concurrency)
 
-        return Deserializable(XP.bundle_xml(xml_strings=response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def create_shipment(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def create_shipment(self, request: Serializable[Envelope]) -> Deserializable[bytes]:
         response = self._send_request("/Ship", request)
 
         return Deserializable(response, XP.to_xml)
 
-    def cancel_shipment(self, request: Serializable) -> Deserializable[str]:
+    def cancel_shipment(self, request: Serializable) -> Deserializable[bytes]:
         response = self._send_request("/Ship", request)
 
         return Deserializable(response, XP.to_xml)
 
-    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def schedule_pickup(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -69,9 +72,9 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def modify_pickup(self, request: Serializable[Pipeline]) -> Deserializable[str]:
+    def modify_pickup(self, request: Serializable[Pipeline]) -> Deserializable[XMLBundle]:
         def process(job: Job):
             if job.data is None:
                 return job.fallback
@@ -81,9 +84,9 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(XP.bundle(response), XP.to_xml)
 
-    def cancel_pickup(self, request: Serializable[Envelope]) -> Deserializable[str]:
+    def cancel_pickup(self, request: Serializable[Envelope]) -> Deserializable[bytes]:
         response = self._send_request("/Pickup", request)
 
         return Deserializable(response, XP.to_xml)
@@ -15,7 +15,7 @@ def parse_address_validation_response(response: Element, settings: Settings) ->
     status = XP.build(
         Response,
         next(
-            iter(response.xpath(".//*[local-name() = $name]", name="Response")),
+            iter(XP.find("Response", response)),
             None,
         ),
     )
@@ -1,14 +1,12 @@
 from typing import List
 from ups_lib.error_1_1 import CodeType
 from purplship.core.models import Message
-from purplship.core.utils.xml import Element
+from purplship.core.utils import Element, XP
 from purplship.providers.ups.utils import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    notifications = response.xpath(
-        ".//*[local-name() = $name]", name="PrimaryErrorCode"
-    )
+    notifications = XP.find("PrimaryErrorCode", response)
     return [_extract_error(node, settings) for node in notifications]
 
 
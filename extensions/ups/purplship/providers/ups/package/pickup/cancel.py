@@ -20,7 +20,7 @@ def parse_pickup_cancel_response(
     status = XP.build(
         CodeDescriptionType,
         next(
-            iter(response.xpath(".//*[local-name() = $name]", name="ResponseStatus")),
+            iter(XP.find("ResponseStatus", response)),
             None,
         ),
     )
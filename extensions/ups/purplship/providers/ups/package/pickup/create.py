@@ -44,9 +44,7 @@ def parse_pickup_response(
         PickupCreationResponse,
         next(
             iter(
-                response.xpath(
-                    ".//*[local-name() = $name]", name="PickupCreationResponse"
-                )
+                XP.find("PickupCreationResponse", response)
             ),
             None,
         ),
@@ -67,9 +65,7 @@ def _extract_pickup_details(
         PickupCreationResponse,
         next(
             iter(
-                response.xpath(
-                    ".//*[local-name() = $name]", name="PickupCreationResponse"
-                )
+                XP.find("PickupCreationResponse", response)
             ),
             None,
         ),
@@ -77,7 +73,7 @@ def _extract_pickup_details(
     rate = XP.build(
         RateResultType,
         next(
-            iter(response.xpath(".//*[local-name() = $name]", name="RateResult")), None
+            iter(XP.find("RateResult", response)), None
         ),
     )
 
@@ -42,9 +42,7 @@ def _cancel_pickup_request(
 ):
     reply = next(
         iter(
-            XP.to_xml(response).xpath(
-                ".//*[local-name() = $name]", name="PickupCreationResponse"
-            )
+            XP.find("PickupCreationResponse", XP.to_xml(response))
         ),
         None,
     )
@@ -1,5 +1,6 @@
 from functools import reduce
 from typing import Callable, List, Tuple
+from ups_lib.ups_security import UPSSecurity
 from ups_lib.rate_web_service_schema import (
     RateRequest as UPSRateRequest,
     RatedShipmentType,
@@ -44,7 +45,7 @@ from purplship.providers.ups.utils import Settings
 def parse_rate_response(
     response: Element, settings: Settings
 ) -> Tuple[List[RateDetails], List[Message]]:
-    rate_reply = response.xpath(".//*[local-name() = $name]", name="RatedShipment")
+    rate_reply = XP.find("RatedShipment", response)
     rates: List[RateDetails] = reduce(_extract_package_rate(settings), rate_reply, [])
     return rates, parse_error_response(response, settings)
 
@@ -71,9 +72,7 @@ def _extract_package_rate(
         estimated_arrival = next(
             (
                 XP.build(EstimatedArrivalType, n)
-                for n in detail_node.xpath(
-                    ".//*[local-name() = $name]", name="EstimatedArrival"
-                )
+                for n in XP.find("EstimatedArrival", detail_node)
             ),
             EstimatedArrivalType(),
         )
@@ -84,9 +83,7 @@ def _extract_package_rate(
         )
         currency_ = next(
             str(c.text)
-            for c in detail_node.xpath(
-                ".//*[local-name() = $name]", name="CurrencyCode"
-            )
+            for c in XP.find("CurrencyCode", detail_node)
         )
         service = ShippingServiceCode(rate.Service.Code).name
         return rates + [
@@ -248,7 +245,13 @@ def rate_request(
         ),
     )
     return Serializable(
-        create_envelope(header_content=settings.Security, body_content=request),
+        create_envelope(
+            header_content=XP.fragment(
+                (UPSSecurity, settings.username, settings.password, settings.access_license_number),
+                lambda: settings.Security,
+            ),
+            body_content=request,
+        ),
         _request_serializer,
     )
 
@@ -21,7 +21,7 @@ def parse_shipment_cancel_response(
     status = XP.build(
         CodeDescriptionType,
         next(
-            iter(response.xpath(".//*[local-name() = $name]", name="ResponseStatus")),
+            iter(XP.find("ResponseStatus", response)),
             None,
         ),
     )
@@ -59,7 +59,7 @@ def parse_shipment_response(
     response: Element, settings: Settings
 ) -> Tuple[ShipmentDetails, List[Message]]:
     details = next(
-        iter(response.xpath(".//*[local-name() = $name]", name="ShipmentResults")), None
+        iter(XP.find("ShipmentResults", response)), None
     )
     shipment = _extract_shipment(details, settings) if details is not None else None
     return shipment, parse_error_response(response, settings)
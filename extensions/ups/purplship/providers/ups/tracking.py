@@ -15,7 +15,7 @@ from purplship.providers.ups.utils import Settings
 def parse_tracking_response(
     response: Element, settings: Settings
 ) -> Tuple[List[TrackingDetails], List[Message]]:
-    track_details = response.xpath(".//*[local-name() = $name]", name="Shipment")
+    track_details = XP.find("Shipment", response)
     tracking: List[TrackingDetails] = [
         _extract_details(node, settings) for node in track_details
     ]
@@ -23,12 +23,8 @@ def parse_tracking_response(
 
 
 def _extract_details(shipment_node: Element, settings: Settings) -> TrackingDetails:
-    track_detail = XP.build(ShipmentType, shipment_node)
-    activities = [
-        XP.build(ActivityType, node)
-        for node in
-        shipment_node.xpath(".//*[local-name() = $name]", name="Activity")
-    ]
+    track_detail = XP.view(ShipmentType, shipment_node)
+    activities: List[ActivityType] = XP.find("Activity", shipment_node, ActivityType)
     delivered = any(a.Status.Type == 'D' for a in activities)
 
     return TrackingDetails(
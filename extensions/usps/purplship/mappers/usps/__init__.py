@@ -1,4 +1,6 @@
 from purplship.core.metadata import Metadata
+from purplship.core.constraints import Constraints
+from purplship.core.units import Dimension, DimensionUnit, Weight, WeightUnit
 
 from purplship.mappers.usps.mapper import Mapper
 from purplship.mappers.usps.proxy import Proxy
@@ -17,4 +19,12 @@ METADATA = Metadata(
     # Data Units
     services=units.ShipmentService,
     options=units.ShipmentOption,
+
+    # Webservice limits
+    max_tracking_batch_size=10,
+    constraints=Constraints(
+        max_weight=Weight(70, WeightUnit.LB),
+        max_length_plus_girth=Dimension(130, DimensionUnit.IN),
+        origin_countries=frozenset(["US"]),
+    ),
 )
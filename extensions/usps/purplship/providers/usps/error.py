@@ -8,7 +8,7 @@ from purplship.providers.usps.utils import Settings
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
     error_nodes = (
         [response] if response.tag == 'Error' else
-        response.xpath(".//*[local-name() = $name]", name="Error")
+        XP.find("Error", response)
     )
     errors = [XP.build(Error, node) for node in error_nodes]
 
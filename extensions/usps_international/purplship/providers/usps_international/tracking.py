@@ -15,11 +15,11 @@ from purplship.providers.usps_international import Settings
 def parse_tracking_response(
     response: Element, settings: Settings
 ) -> Tuple[List[TrackingDetails], List[Message]]:
-    tracks_info = response.xpath(".//*[local-name() = $name]", name="TrackInfo")
+    tracks_info = XP.find("TrackInfo", response)
     details = [
         _extract_details(node, settings)
         for node in tracks_info
-        if len(node.xpath(".//*[local-name() = $name]", name="TrackDetail")) > 0
+        if len(XP.find("TrackDetail", node)) > 0
     ]
 
     return details, parse_error_response(response, settings)
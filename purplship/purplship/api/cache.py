@@ -0,0 +1,222 @@
+"""Purplship Fluent API responses cache definition module."""
+
+import abc
+import attr
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, cast
+
+from purplship.core.settings import Settings
+from purplship.core.utils import DP
+
+DELIVERED_TTL = 30 * 24 * 3600
+# the settings that do not identify a carrier account (they do not change the carrier responses)
+OPERATIONAL_SETTINGS = ("id", "max_concurrency", "timeout", "rate_limit")
+_rate_cache: Optional['Cache'] = None
+_tracking_cache: Tuple[Optional['Cache'], float] = (None, DELIVERED_TTL)
+
+
+def _normalize(value: Any, key: str = None) -> Any:
+    if isinstance(value, dict):
+        return {k: _normalize(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [_normalize(v) for v in value]
+        return sorted(items) if key == "services" else items
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return repr(round(float(value), 6))
+    if isinstance(value, str) and key == "postal_code":
+        return value.replace(" ", "").upper()
+    if isinstance(value, str):
+        return value.strip()
+
+    return value
+
+
+def account_key(settings: Settings) -> str:
+    """Return the identity of a carrier account: its carrier, id and environment
+    and a hash of its other settings (e.g: account numbers and credentials)"""
+    fields = {
+        key: value for key, value in attr.asdict(cast(Any, settings), recurse=False).items()
+        if key not in OPERATIONAL_SETTINGS
+    } if attr.has(type(settings)) else {}
+    digest = hashlib.sha256(json.dumps(fields, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    return f"{settings.carrier_name}:{settings.carrier_id}:{settings.test}:{digest[:16]}"
+
+
+def fingerprint(payload: Any, settings: Settings, exclude: Tuple[str, ...] = ("reference",)) -> str:
+    """Return a canonical hash of a unified request payload sent to a carrier account.
+
+    The key order, the numbers formatting (1 == 1.0), the services order and the postal codes
+    spacing and case do not change the fingerprint. The `exclude`d fields do not affect the quotes.
+    """
+    content = {k: v for k, v in DP.to_dict(payload).items() if k not in exclude}
+    canonical = json.dumps(_normalize(content), sort_keys=True, separators=(",", ":"))
+
+    return hashlib.sha256(f"{account_key(settings)}:{canonical}".encode("utf-8")).hexdigest()
+
+
+def tracking_key(settings: Settings, tracking_number: str) -> str:
+    """Return the cache key of a tracking number of a carrier account"""
+    return f"{account_key(settings)}:{tracking_number}"
+
+
+class Cache(abc.ABC):
+    """A TTL and size bounded (LRU) responses cache
+
+    ttl: the time (in seconds) an entry remains valid by default
+    maxsize: the maximum number of entries kept (the least recently used are evicted first)
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @abc.abstractmethod
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        pass
+
+    @abc.abstractmethod
+    def _set(self, key: str, value: Any, expiry: float, now: float):
+        pass
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the entry value or None if it is missing or expired"""
+        value = self._get(key, time.time())
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        """Store an entry valid for `ttl` seconds (the cache ttl by default)"""
+        now = time.time()
+        self._set(key, value, now + (self.ttl if ttl is None else ttl), now)
+
+    @property
+    def stats(self) -> dict:
+        return dict(hits=self.hits, misses=self.misses, size=len(self))
+
+
+class MemoryCache(Cache):
+    """An in-process cache. The cached values are returned as is (not copied)"""
+
+    def __init__(self, ttl: float = 300, maxsize: int = 1024):
+        super().__init__(ttl, maxsize)
+        self.lock = threading.Lock()
+        self.entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        with self.lock:
+            expiry, value = self.entries.get(key, (0, None))
+            if expiry <= now:
+                self.entries.pop(key, None)
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Any, expiry: float, now: float):
+        with self.lock:
+            self.entries[key] = (expiry, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class SQLiteCache(Cache):
+    """A local SQLite file cache shared by the workers of a host. The cached values are pickled"""
+
+    def __init__(self, path: str, ttl: float = 300, maxsize: int = 1024):
+        super().__init__(ttl, maxsize)
+        self.path = path
+        self.local = threading.local()
+        with self.connection as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value BLOB, expiry REAL, accessed REAL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        with self.connection as connection:
+            row = connection.execute(
+                "SELECT value FROM entries WHERE key = ? AND expiry > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            return pickle.loads(row[0])
+
+    def _set(self, key: str, value: Any, expiry: float, now: float):
+        with self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expiry, accessed) VALUES (?, ?, ?, ?)",
+                (key, pickle.dumps(value), expiry, now),
+            )
+            connection.execute("DELETE FROM entries WHERE expiry <= ?", (now,))
+            connection.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def get_rate_cache() -> Optional[Cache]:
+    """Return the cache of the rates fetched through the Rating API (None when disabled)"""
+    return _rate_cache
+
+
+def set_rate_cache(cache: Optional[Cache]) -> Optional[Cache]:
+    """Enable (or disable with None) the cache of the rates fetched through the Rating API
+    and return the previous one."""
+    global _rate_cache
+    previous, _rate_cache = _rate_cache, cache
+    return previous
+
+
+def get_tracking_cache() -> Tuple[Optional[Cache], float]:
+    """Return the cache of the tracking details fetched through the Tracking API (None when disabled)
+    and the time to live of the delivered items."""
+    return _tracking_cache
+
+
+def set_tracking_cache(cache: Optional[Cache], delivered_ttl: float = DELIVERED_TTL) -> Tuple[Optional[Cache], float]:
+    """Enable (or disable with None) the cache of the tracking details fetched through the Tracking API
+    and return the previous one.
+
+    The in transit items are cached for the cache ttl and the delivered ones for `delivered_ttl` seconds.
+    """
+    global _tracking_cache
+    previous, _tracking_cache = _tracking_cache, (cache, delivered_ttl)
+    return previous
@@ -0,0 +1,98 @@
+"""Purplship Fluent API single-flight (in-flight requests deduplication) definition module."""
+
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from purplship.api.cache import fingerprint
+from purplship.core.settings import Settings
+from purplship.core.errors import RequestTimeoutError
+from purplship.core.utils import remaining_time
+
+T = TypeVar("T")
+IDEMPOTENT_OPERATIONS = ("get_rates", "get_tracking", "validate_address")
+
+
+def flight_key(settings: Settings, operation: str, payload: Any) -> Optional[Hashable]:
+    """Return the key identifying a proxy call or None if identical calls must not be collapsed
+    (non idempotent operations or payloads that cannot be compared).
+
+    The key is the fingerprint of the unified payload sent to the carrier account: the carrier
+    request is not serialized again, and its per call content (e.g: nonces, timestamps) is ignored.
+    """
+    if operation not in IDEMPOTENT_OPERATIONS:
+        return None
+
+    try:
+        return operation, fingerprint(payload, settings, exclude=())
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class SingleFlight:
+    """Collapse the concurrent identical calls into one whose result is shared by all the callers"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls: Dict[Hashable, Future] = {}
+        self.tasks: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.collapsed = 0
+
+    def do(self, key: Optional[Hashable], action: Callable[[], T]) -> T:
+        """Run the action unless an identical one is in flight, in which case its result is awaited"""
+        if key is None:
+            return action()
+
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+                self.executed += 1
+            else:
+                self.collapsed += 1
+
+        if not leader:
+            timeout = remaining_time()
+            try:
+                return future.result(timeout=(max(timeout, 0) if timeout is not None else None))
+            except TimeoutError as e:
+                raise RequestTimeoutError(timeout) from e
+
+        try:
+            result = action()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+    async def do_async(self, key: Optional[Hashable], action: Callable[[], Awaitable[T]]) -> T:
+        """Run the awaitable action unless an identical one is in flight on the event loop,
+        in which case its result is awaited"""
+        if key is None:
+            return await action()
+
+        loop_key = (id(asyncio.get_event_loop()), key)
+        with self.lock:
+            task = self.tasks.get(loop_key)
+            if task is None:
+                task = self.tasks[loop_key] = asyncio.ensure_future(action())
+                task.add_done_callback(lambda _: self.tasks.pop(loop_key, None))
+                self.executed += 1
+            else:
+                self.collapsed += 1
+
+        return await asyncio.shield(task)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return dict(executed=self.executed, collapsed=self.collapsed)
+
+
+single_flight = SingleFlight()
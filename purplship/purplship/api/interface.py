@@ -1,12 +1,24 @@
 """The Fluent API Abstraction and interfaces definitions."""
 
 import attr
+import asyncio
 import logging
 import functools
-from typing import Callable, TypeVar, Union, List, Tuple
+import threading
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, TypeVar, Union, List, Tuple, cast
+import purplship.references as references
 from purplship.api.gateway import Gateway
-from purplship.core.utils import Serializable, Deserializable, DP, exec_async
-from purplship.core.errors import ShippingSDKDetailedError
+from purplship.api.flight import flight_key, single_flight
+from purplship.api.cache import Cache, fingerprint, tracking_key, get_rate_cache, get_tracking_cache
+from purplship.core.utils import Serializable, Deserializable, exec_io_async, deadline, throttle, MAX_WORKERS
+from purplship.core.utils.log import log_payload
+from purplship.core.utils.instrument import span, tagged
+from purplship.core.errors import ShippingSDKDetailedError, RequestTimeoutError
+from purplship.core.metadata import Metadata
+from purplship.core.constraints import Constraints
+from purplship.core.units import Packages
 from purplship.core.models import (
     AddressValidationRequest,
     RateRequest,
@@ -17,6 +29,7 @@ from purplship.core.models import (
     PickupUpdateRequest,
     Message,
     ShipmentCancelRequest,
+    TrackingDetails,
 )
 
 logger = logging.getLogger(__name__)
@@ -63,6 +76,20 @@ def fail_safe(gateway: Gateway):
         Decorator
     """
     def catcher(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as error:
+                    logger.exception(error)
+
+                    return IDeserialize(
+                        functools.partial(abort, gateway=gateway, error=error)
+                    )
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
@@ -79,6 +106,205 @@ def fail_safe(gateway: Gateway):
     return catcher
 
 
+def process(payload: Any, create: str, send: str, parse: str) -> Tuple[
+    Callable[[Gateway], 'IDeserialize'], Callable[[Gateway], Awaitable['IDeserialize']]
+]:
+    """Return the blocking and the awaitable gateway actions running an operation:
+    request creation, proxy call and lazy response parsing
+
+    Args:
+        payload (Any): the unified request payload
+        create (str): the gateway mapper request creation method name
+        send (str): the gateway proxy method name
+        parse (str): the gateway mapper response parsing method name
+
+    Returns:
+        Tuple[Callable, Callable]: the gateway action and its awaitable counterpart (non-blocking network I/O)
+    """
+    def tags(gateway: Gateway):
+        return tagged(gateway.settings.carrier_name, gateway.settings.carrier_id, send)
+
+    def deserializer(gateway: Gateway, response: Deserializable) -> IDeserialize:
+        @fail_safe(gateway)
+        def deserialize():
+            with tags(gateway), span("parse"):
+                return getattr(gateway.mapper, parse)(response)
+
+        return IDeserialize(deserialize)
+
+    def action(gateway: Gateway) -> IDeserialize:
+        with tags(gateway):
+            with span("create"):
+                request: Serializable = getattr(gateway.mapper, create)(payload)
+            with throttle(gateway.proxy.limiter):
+                response: Deserializable = single_flight.do(
+                    flight_key(gateway.settings, send, payload),
+                    lambda: getattr(gateway.proxy, send)(request),
+                )
+
+        return deserializer(gateway, response)
+
+    async def async_action(gateway: Gateway) -> IDeserialize:
+        with tags(gateway):
+            with span("create"):
+                request: Serializable = getattr(gateway.mapper, create)(payload)
+            with throttle(gateway.proxy.limiter):
+                response: Deserializable = await single_flight.do_async(
+                    flight_key(gateway.settings, send, payload),
+                    lambda: exec_io_async(getattr(gateway.proxy, send), request),
+                )
+
+        return deserializer(gateway, response)
+
+    return action, async_action
+
+
+def cached(
+    action: Callable[[Gateway], 'IDeserialize'],
+    async_action: Callable[[Gateway], Awaitable['IDeserialize']],
+    payload: Any,
+    cache: Optional[Cache],
+) -> Tuple[Callable[[Gateway], 'IDeserialize'], Callable[[Gateway], Awaitable['IDeserialize']]]:
+    """Return the gateway actions answering from the cache when possible.
+    The successful results (no messages) are cached once parsed.
+    """
+    if cache is None:
+        return action, async_action
+
+    def store(key: str, deserializable: IDeserialize) -> IDeserialize:
+        def deserialize():
+            result, messages = deserializable.parse()
+            if result is not None and not any(messages):
+                cache.set(key, (result, messages))
+            return result, messages
+
+        return IDeserialize(deserialize)
+
+    def cached_action(gateway: Gateway) -> IDeserialize:
+        key = fingerprint(payload, gateway.settings)
+        hit = cache.get(key)
+        if hit is not None:
+            return IDeserialize(lambda: hit)
+
+        return store(key, action(gateway))
+
+    async def cached_async_action(gateway: Gateway) -> IDeserialize:
+        key = fingerprint(payload, gateway.settings)
+        hit = cache.get(key)
+        if hit is not None:
+            return IDeserialize(lambda: hit)
+
+        return store(key, await async_action(gateway))
+
+    return cached_action, cached_async_action
+
+
+def constrained(
+    action: Callable[[Gateway], 'IDeserialize'],
+    async_action: Callable[[Gateway], Awaitable['IDeserialize']],
+    payload: RateRequest,
+) -> Tuple[Callable[[Gateway], 'IDeserialize'], Callable[[Gateway], Awaitable['IDeserialize']]]:
+    """Return the gateway actions skipping (before building any request) the gateways whose declared
+    constraints the shipment violates. A skipped gateway returns the violation as message.
+    """
+    packages: Dict[Any, Optional[Packages]] = {}
+    lock = threading.Lock()
+
+    def preset_packages(presets: Any) -> Optional[Packages]:
+        """Return the packages built (once for all the gateway threads) with a carrier package presets"""
+        with lock:
+            if presets not in packages:
+                try:
+                    packages[presets] = Packages(payload.parcels, presets)
+                except Exception:
+                    packages[presets] = None
+
+            return packages[presets]
+
+    def skipped(gateway: Gateway) -> Optional[IDeserialize]:
+        metadata = carrier_metadata(gateway)
+        constraints: Optional[Constraints] = getattr(metadata, "constraints", None)
+        if constraints is None:
+            return None
+
+        # the invalid parcels are reported by the gateway request creation: only the origin and destination
+        # (checked first) are checked when the packages cannot be built (or measured) with the carrier presets
+        parcels = preset_packages(metadata.package_presets)
+        try:
+            error = constraints.check(payload.shipper, payload.recipient, parcels if parcels is not None else [])
+        except Exception:
+            error = None
+
+        if error is None:
+            return None
+
+        logger.debug(f"{gateway.settings.carrier_name} skipped: {error}")
+        return aborted(gateway, error)
+
+    def constrained_action(gateway: Gateway) -> IDeserialize:
+        skip = skipped(gateway)
+        return skip if skip is not None else action(gateway)
+
+    async def constrained_async_action(gateway: Gateway) -> IDeserialize:
+        skip = skipped(gateway)
+        return skip if skip is not None else await async_action(gateway)
+
+    return constrained_action, constrained_async_action
+
+
+def tracked(payload: TrackingRequest, cache: Optional[Cache], delivered_ttl: float) -> Tuple[
+    Callable[[Gateway], 'IDeserialize'], Callable[[Gateway], Awaitable['IDeserialize']]
+]:
+    """Return the gateway tracking actions fetching only the tracking numbers missing from the cache.
+    The cached and fresh tracking details are merged in the requested tracking numbers order.
+    """
+    operation = ("create_tracking_request", "get_tracking", "parse_tracking_response")
+    if cache is None:
+        return process(payload, *operation)
+
+    def lookup(gateway: Gateway) -> Tuple[dict, List[str]]:
+        cached_details = {
+            number: cache.get(tracking_key(gateway.settings, number))
+            for number in payload.tracking_numbers
+        }
+        hits = {number: details for number, details in cached_details.items() if details is not None}
+        return hits, [number for number in payload.tracking_numbers if number not in hits]
+
+    def merge(gateway: Gateway, hits: dict, deserializable: Optional[IDeserialize]) -> IDeserialize:
+        def deserialize():
+            fresh, messages = deserializable.parse() if deserializable is not None else ([], [])
+            for details in fresh or []:
+                cache.set(
+                    tracking_key(gateway.settings, details.tracking_number),
+                    details,
+                    ttl=(delivered_ttl if details.delivered else None),
+                )
+
+            found = {**{details.tracking_number: details for details in fresh or []}, **hits}
+            ordered = [found.pop(number) for number in payload.tracking_numbers if number in found]
+            return ordered + list(found.values()), messages
+
+        return IDeserialize(deserialize)
+
+    def action(gateway: Gateway) -> IDeserialize:
+        hits, misses = lookup(gateway)
+        if not any(misses):
+            return merge(gateway, hits, None)
+
+        fetch, _ = process(attr.evolve(payload, tracking_numbers=misses), *operation)
+        return merge(gateway, hits, fetch(gateway))
+
+    async def async_action(gateway: Gateway) -> IDeserialize:
+        hits, misses = lookup(gateway)
+        if not any(misses):
+            return merge(gateway, hits, None)
+
+        _, fetch = process(attr.evolve(payload, tracking_numbers=misses), *operation)
+        return merge(gateway, hits, await fetch(gateway))
+
+    return action, async_action
+
+
 @attr.s(auto_attribs=True)
 class IDeserialize:
     """A lazy deserializer type class"""
@@ -91,25 +317,199 @@ class IDeserialize:
             return result.parse()
         return result
 
+    async def parse_async(self):
+        """Execute the response deserialization (awaitable counterpart of parse)"""
+        return self.parse()
+
+
+def carrier_metadata(gateway: Gateway) -> Optional[Metadata]:
+    """Return the metadata of the gateway extension"""
+    return (references.PROVIDERS or references.import_extensions()).get(gateway.settings.carrier_name)
+
+
+def tracking_batch_size(gateway: Gateway) -> Optional[int]:
+    """Return the maximum number of tracking numbers per tracking request declared by the gateway extension"""
+    return getattr(carrier_metadata(gateway), "max_tracking_batch_size", None)
+
+
+def budget(gateway: Gateway, timeout: Optional[float]) -> Optional[float]:
+    """Return the time budget of a gateway call: the shortest of the call timeout and the gateway default"""
+    timeouts = [t for t in (timeout, gateway.settings.timeout) if t is not None]
+    return min(timeouts) if len(timeouts) > 0 else None
+
+
+def aborted(gateway: Gateway, error: Exception) -> IDeserialize:
+    """Return the result of a gateway call aborted with an error"""
+    return IDeserialize(cast(Callable[[], Any], functools.partial(abort, gateway=gateway, error=error)))
+
+
+def timed_out(gateway: Gateway, timeout: Optional[float]) -> IDeserialize:
+    """Return the result of a gateway call that did not complete within its time budget"""
+    return aborted(gateway, RequestTimeoutError(timeout))
+
+
+def run(action: Callable[[Gateway], IDeserialize], gateway: Gateway, timeout: float = None) -> IDeserialize:
+    """Run a gateway action within its time budget"""
+    with deadline(budget(gateway, timeout)):
+        return fail_safe(gateway)(action)(gateway)
+
+
+async def run_async(
+    action: Callable[[Gateway], Awaitable[IDeserialize]], gateway: Gateway, timeout: float = None
+) -> IDeserialize:
+    """Run an awaitable gateway action within its time budget"""
+    limit = budget(gateway, timeout)
+    with deadline(limit):
+        try:
+            return await asyncio.wait_for(fail_safe(gateway)(action)(gateway), limit)
+        except asyncio.TimeoutError:
+            return timed_out(gateway, limit)
+
+
+def run_many(
+    action: Callable[[Gateway], IDeserialize], gateways: List[Gateway], timeout: float = None
+) -> List[IDeserialize]:
+    """Run a gateway action concurrently on all the gateways within a global time budget.
+    The gateways that did not complete in time are returned as timed out.
+    """
+    executor = ThreadPoolExecutor(max_workers=min(len(gateways), MAX_WORKERS) or 1)
+    futures = [executor.submit(copy_context().run, run, action, gateway, timeout) for gateway in gateways]
+    done, _ = wait(futures, timeout=timeout)
+    executor.shutdown(wait=False)
+
+    return [
+        cast(IDeserialize, future.result()) if future in done else timed_out(gateway, timeout)
+        for future, gateway in zip(futures, gateways)
+    ]
+
 
 @attr.s(auto_attribs=True)
 class IRequestFrom:
     """A lazy request (from) type class"""
     action: Callable[[Gateway], IDeserialize]
+    async_action: Callable[[Gateway], Awaitable[IDeserialize]] = None
 
-    def from_(self, gateway: Gateway) -> IDeserialize:
-        """Execute the request action from the provided gateway"""
-        return fail_safe(gateway)(self.action)(gateway)
+    def from_(self, gateway: Gateway, timeout: float = None) -> IDeserialize:
+        """Execute the request action from the provided gateway (within `timeout` seconds)"""
+        return run(self.action, gateway, timeout)
+
+    async def from_async(self, gateway: Gateway, timeout: float = None) -> IDeserialize:
+        """Execute the request action from the provided gateway without blocking the event loop"""
+        if self.async_action is None:
+            return await exec_io_async(self.from_, gateway, timeout)
+
+        return await run_async(self.async_action, gateway, timeout)
+
+
+Job = Tuple[Gateway, Callable[[Gateway], IDeserialize], Callable[[Gateway], Awaitable[IDeserialize]]]
+
+
+@attr.s(auto_attribs=True)
+class IStream:
+    """A lazy stream of (gateway, result, messages) iterable (or async iterable) in completion order"""
+    jobs: List[Job]
+    timeout: float = None
+    max_workers: int = None
+
+    @staticmethod
+    def _unpack(gateway: Gateway, deserializable: IDeserialize) -> Tuple[Gateway, Any, List[Message]]:
+        result, messages = deserializable.parse()
+        return gateway, (result if result is not None else []), messages
+
+    def __iter__(self) -> Iterator[Tuple[Gateway, Any, List[Message]]]:
+        executor = ThreadPoolExecutor(max_workers=min(len(self.jobs), self.max_workers or MAX_WORKERS) or 1)
+        futures = {
+            executor.submit(copy_context().run, run, action, gateway, self.timeout): gateway
+            for gateway, action, _ in self.jobs
+        }
+        pending = dict(futures)
+        try:
+            for future in as_completed(futures, timeout=self.timeout):
+                yield self._unpack(pending.pop(future), cast(IDeserialize, future.result()))
+        except TimeoutError:
+            for gateway in pending.values():
+                yield self._unpack(gateway, timed_out(gateway, self.timeout))
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[Gateway, Any, List[Message]]]:
+        semaphore = asyncio.Semaphore(self.max_workers) if self.max_workers else None
+
+        async def execute(gateway: Gateway, async_action: Callable[[Gateway], Awaitable[IDeserialize]]):
+            if semaphore is None:
+                return gateway, await run_async(async_action, gateway, self.timeout)
+
+            async with semaphore:
+                return gateway, await run_async(async_action, gateway, self.timeout)
+
+        tasks = [asyncio.ensure_future(execute(gateway, async_action)) for gateway, _, async_action in self.jobs]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield self._unpack(*(await task))
+        finally:
+            for task in tasks:
+                task.cancel()
 
 
 @attr.s(auto_attribs=True)
 class IRequestFromMany:
     """A lazy request (from one or many) type class"""
-    action: Callable[[List[Gateway]], IDeserialize]
+    action: Callable[[List[Gateway], Optional[float]], IDeserialize]
+    async_action: Callable[[List[Gateway], Optional[float]], Awaitable[IDeserialize]] = None
+    gateway_action: Callable[[Gateway], IDeserialize] = None
+    gateway_async_action: Callable[[Gateway], Awaitable[IDeserialize]] = None
+
+    def from_(self, *gateways: Gateway, timeout: float = None) -> IDeserialize:
+        """Execute the request action(s) from the provided gateway(s) (within a global `timeout` in seconds)"""
+        return self.action(list(gateways), timeout)
+
+    async def from_async(self, *gateways: Gateway, timeout: float = None) -> IDeserialize:
+        """Execute the request action(s) from the provided gateway(s) without blocking the event loop"""
+        if self.async_action is None:
+            return await exec_io_async(functools.partial(self.from_, timeout=timeout), *gateways)
+
+        return await self.async_action(list(gateways), timeout)
+
+    def stream(self, *gateways: Gateway, timeout: float = None) -> IStream:
+        """Execute the request action from each provided gateway and stream their results as they complete
+
+        e.g: `for gateway, rates, messages in Rating.fetch(request).stream(*gateways)`
+        or `async for gateway, rates, messages in Rating.fetch(request).stream(*gateways)`
+        """
+        return IStream(
+            [(gateway, self.gateway_action, self.gateway_async_action) for gateway in gateways], timeout
+        )
+
+
+@attr.s(auto_attribs=True)
+class IRequestFromChunks:
+    """A lazy request (from) type class splitting a request in chunks sent concurrently to a gateway"""
+    chunks: Callable[[Gateway], List[IRequestFrom]]
+    merge: Callable[[List[Tuple[Any, List[Message]]]], Tuple[Any, List[Message]]]
+
+    def stream(self, gateway: Gateway, timeout: float = None) -> IStream:
+        """Execute the chunk requests from the provided gateway and stream their results as they complete
+        (at most `max_concurrency` chunk requests in flight)
+
+        e.g: `for gateway, tracking_details, messages in Tracking.fetch_many(numbers).stream(gateway)`
+        """
+        return IStream(
+            [(gateway, request.action, request.async_action) for request in self.chunks(gateway)],
+            timeout,
+            gateway.settings.max_concurrency or MAX_WORKERS,
+        )
+
+    def from_(self, gateway: Gateway, timeout: float = None) -> IDeserialize:
+        """Execute the chunk requests from the provided gateway and merge their results"""
+        results = [(result, messages) for _, result, messages in self.stream(gateway, timeout)]
+        return IDeserialize(cast(Callable[[], Any], functools.partial(self.merge, results)))
 
-    def from_(self, *gateways: Gateway) -> IDeserialize:
-        """Execute the request action(s) from the provided gateway(s)"""
-        return self.action(list(gateways))
+    async def from_async(self, gateway: Gateway, timeout: float = None) -> IDeserialize:
+        """Execute the chunk requests from the provided gateway without blocking the event loop"""
+        results = [(result, messages) async for _, result, messages in self.stream(gateway, timeout)]
+        return IDeserialize(cast(Callable[[], Any], functools.partial(self.merge, results)))
 
 
 class Address:
@@ -125,22 +525,12 @@ class Address:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f'validate an address. payload: {DP.jsonify(args)}')
+        log_payload(logger, logging.DEBUG, 'validate an address. payload: %s', args)
         payload = (
             args if isinstance(args, AddressValidationRequest) else AddressValidationRequest(**args)
         )
 
-        def action(gateway: Gateway) -> IDeserialize:
-            request: Serializable = gateway.mapper.create_address_validation_request(payload)
-            response: Deserializable = gateway.proxy.validate_address(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_address_validation_response(response)
-
-            return IDeserialize(deserialize)
-
-        return IRequestFrom(action)
+        return IRequestFrom(*process(payload, "create_address_validation_request", "validate_address", "parse_address_validation_response"))
 
 
 class Pickup:
@@ -156,20 +546,10 @@ class Pickup:
         Returns:
             IRequestWith: a lazy request dataclass instance
         """
-        logger.debug(f"book a pickup. payload: {DP.jsonify(args)}")
+        log_payload(logger, logging.DEBUG, "book a pickup. payload: %s", args)
         payload = args if isinstance(args, PickupRequest) else PickupRequest(**args)
 
-        def action(gateway: Gateway):
-            request: Serializable = gateway.mapper.create_pickup_request(payload)
-            response: Deserializable = gateway.proxy.schedule_pickup(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_pickup_response(response)
-
-            return IDeserialize(deserialize)
-
-        return IRequestFrom(action)
+        return IRequestFrom(*process(payload, "create_pickup_request", "schedule_pickup", "parse_pickup_response"))
 
     @staticmethod
     def cancel(args: Union[PickupCancelRequest, dict]) -> IRequestFrom:
@@ -181,24 +561,14 @@ class Pickup:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"cancel a pickup. payload: {DP.jsonify(args)}")
+        log_payload(logger, logging.DEBUG, "cancel a pickup. payload: %s", args)
         payload = (
             args
             if isinstance(args, PickupCancelRequest)
             else PickupCancelRequest(**args)
         )
 
-        def action(gateway: Gateway):
-            request: Serializable = gateway.mapper.create_cancel_pickup_request(payload)
-            response: Deserializable = gateway.proxy.cancel_pickup(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_cancel_pickup_response(response)
-
-            return IDeserialize(deserialize)
-
-        return IRequestFrom(action)
+        return IRequestFrom(*process(payload, "create_cancel_pickup_request", "cancel_pickup", "parse_cancel_pickup_response"))
 
     @staticmethod
     def update(args: Union[PickupUpdateRequest, dict]):
@@ -210,24 +580,14 @@ class Pickup:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"update a pickup. payload: {DP.jsonify(args)}")
+        log_payload(logger, logging.DEBUG, "update a pickup. payload: %s", args)
         payload = (
             args
             if isinstance(args, PickupUpdateRequest)
             else PickupUpdateRequest(**args)
         )
 
-        def action(gateway: Gateway):
-            request: Serializable = gateway.mapper.create_pickup_update_request(payload)
-            response: Deserializable = gateway.proxy.modify_pickup(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_pickup_update_response(response)
-
-            return IDeserialize(deserialize)
-
-        return IRequestFrom(action)
+        return IRequestFrom(*process(payload, "create_pickup_update_request", "modify_pickup", "parse_pickup_update_response"))
 
 
 class Rating:
@@ -243,31 +603,33 @@ class Rating:
         Returns:
             IRequestFromMany: a lazy request dataclass instance
         """
-        logger.debug(f"fetch shipment rates. payload: {DP.jsonify(args)}")
+        log_payload(logger, logging.DEBUG, "fetch shipment rates. payload: %s", args)
         payload = args if isinstance(args, RateRequest) else RateRequest(**args)
 
-        def action(gateways: List[Gateway]):
-            def process(gateway: Gateway):
-                request: Serializable = gateway.mapper.create_rate_request(payload)
-                response: Deserializable = gateway.proxy.get_rates(request)
-
-                @fail_safe(gateway)
-                def deserialize():
-                    return gateway.mapper.parse_rate_response(response)
-
-                return IDeserialize(deserialize)
-
-            deserializable_collection: List[IDeserialize] = exec_async(lambda g: fail_safe(g)(process)(g), gateways)
+        action, async_action = constrained(
+            *cached(
+                *process(payload, "create_rate_request", "get_rates", "parse_rate_response"),
+                payload, get_rate_cache(),
+            ),
+            payload,
+        )
 
-            def flatten():
+        def flatten(deserializable_collection: List[IDeserialize]) -> IDeserialize:
+            def deserialize():
                 responses = [p.parse() for p in deserializable_collection]
                 flattened_rates = sum((r for r, _ in responses if r is not None), [])
                 messages = sum((m for _, m in responses), [])
                 return flattened_rates, messages
 
-            return IDeserialize(flatten)
+            return IDeserialize(deserialize)
+
+        def fetch(gateways: List[Gateway], timeout: float = None) -> IDeserialize:
+            return flatten(run_many(action, gateways, timeout))
+
+        async def fetch_async(gateways: List[Gateway], timeout: float = None) -> IDeserialize:
+            return flatten(await asyncio.gather(*(run_async(async_action, g, timeout) for g in gateways)))
 
-        return IRequestFromMany(action)
+        return IRequestFromMany(fetch, fetch_async, action, async_action)
 
 
 class Shipment:
@@ -284,20 +646,10 @@ class Shipment:
         Returns:
             IRequestWith: a lazy request dataclass instance
         """
-        logger.debug(f"create a shipment. payload: {DP.jsonify(args)}")
+        log_payload(logger, logging.DEBUG, "create a shipment. payload: %s", args)
         payload = args if isinstance(args, ShipmentRequest) else ShipmentRequest(**args)
 
-        def action(gateway: Gateway):
-            request: Serializable = gateway.mapper.create_shipment_request(payload)
-            response: Deserializable = gateway.proxy.create_shipment(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_shipment_response(response)
-
-            return IDeserialize(deserialize)
-
-        return IRequestFrom(action)
+        return IRequestFrom(*process(payload, "create_shipment_request", "create_shipment", "parse_shipment_response"))
 
     @staticmethod
     def cancel(args: Union[ShipmentCancelRequest, dict]) -> IRequestFrom:
@@ -309,20 +661,10 @@ class Shipment:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"void a shipment. payload: {DP.jsonify(args)}")
+        log_payload(logger, logging.DEBUG, "void a shipment. payload: %s", args)
         payload = args if isinstance(args, ShipmentCancelRequest) else ShipmentCancelRequest(**args)
 
-        def action(gateway: Gateway):
-            request: Serializable = gateway.mapper.create_cancel_shipment_request(payload)
-            response: Deserializable = gateway.proxy.cancel_shipment(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_cancel_shipment_response(response)
-
-            return IDeserialize(deserialize)
-
-        return IRequestFrom(action)
+        return IRequestFrom(*process(payload, "create_cancel_shipment_request", "cancel_shipment", "parse_cancel_shipment_response"))
 
 
 class Tracking:
@@ -338,17 +680,45 @@ class Tracking:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"track a shipment. payload: {DP.jsonify(args)}")
+        log_payload(logger, logging.DEBUG, "track a shipment. payload: %s", args)
         payload = args if isinstance(args, TrackingRequest) else TrackingRequest(**args)
 
-        def action(gateway: Gateway) -> IDeserialize:
-            request: Serializable = gateway.mapper.create_tracking_request(payload)
-            response: Deserializable = gateway.proxy.get_tracking(request)
+        return IRequestFrom(*tracked(payload, *get_tracking_cache()))
 
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_tracking_response(response)
+    @staticmethod
+    def fetch_many(args: Union[List[str], TrackingRequest, dict]) -> IRequestFromChunks:
+        """Fetch the tracking statuses and details of a large number of tracking numbers from a carrier.
+        The tracking numbers are sent in concurrent chunks of the carrier maximum batch size
 
-            return IDeserialize(deserialize)
+        Args:
+            args (Union[List[str], TrackingRequest, dict]): the tracking numbers or the tracking request payload
+
+        Returns:
+            IRequestFromChunks: a lazy request dataclass instance
+        """
+        payload = (
+            args if isinstance(args, TrackingRequest)
+            else TrackingRequest(**args) if isinstance(args, dict)
+            else TrackingRequest(tracking_numbers=list(args))
+        )
+        logger.debug(f"track {len(payload.tracking_numbers)} shipments.")
+        numbers = payload.tracking_numbers
+        order = {number: index for index, number in reversed(list(enumerate(numbers)))}
+
+        def chunks(gateway: Gateway) -> List[IRequestFrom]:
+            size = tracking_batch_size(gateway) or len(numbers) or 1
+            return [
+                IRequestFrom(*tracked(
+                    attr.evolve(payload, tracking_numbers=numbers[start:start + size]), *get_tracking_cache()
+                ))
+                for start in range(0, len(numbers), size)
+            ]
+
+        def merge(results: List[Tuple[List[TrackingDetails], List[Message]]]):
+            details = sorted(
+                (detail for result, _ in results for detail in result),
+                key=lambda detail: order.get(detail.tracking_number, len(numbers)),
+            )
+            return details, sum((messages for _, messages in results), [])
 
-        return IRequestFrom(action)
+        return IRequestFromChunks(chunks, merge)
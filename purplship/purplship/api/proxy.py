@@ -2,9 +2,12 @@
 
 import attr
 from abc import ABC
+from typing import ClassVar, Optional
 from purplship.core.settings import Settings
 from purplship.core.errors import MethodNotSupportedError
 from purplship.core.utils.serializable import Deserializable, Serializable
+from purplship.core.limiter import RateLimit, Limiter, get_limiter
+from purplship.api.cache import account_key
 
 
 @attr.s(auto_attribs=True)
@@ -12,6 +15,12 @@ class Proxy(ABC):
     """Unified Shipping API Proxy (Interface)"""
 
     settings: Settings
+    rate_limit: ClassVar[Optional[RateLimit]] = None  # the carrier webservice documented quota
+
+    @property
+    def limiter(self) -> Optional[Limiter]:
+        """Return the rate limiter shared by all the requests sent to the carrier account"""
+        return get_limiter(account_key(self.settings), self.settings.rate_limit or self.rate_limit)
 
     def get_rates(self, request: Serializable) -> Deserializable:
         """Send one or many request(s) to get shipment rates from a carrier webservice
@@ -0,0 +1,156 @@
+"""Purplship vectorized (NumPy) parcels aggregation backend.
+
+NumPy is an optional dependency: `Packages(..., vectorized=True)` falls back to the per-package
+computations and `Packages.arrays` is None when it is not installed.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from purplship.core.errors import FieldErrorCode
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+WEIGHT_FIELDS = ("weight",)
+DIMENSION_FIELDS = ("width", "height", "length")
+CM_PER_IN = 2.54
+LB_PER_KG = 2.205
+
+
+def _round(values: "numpy.ndarray") -> "numpy.ndarray":
+    """Round the values to 2 decimals as NF.decimal (the builtin `round`) does.
+    numpy.round rounds the scaled values (x * 100) which only differs from the builtin correctly rounded
+    `round` near the halves (e.g. 26.555 => 26.56 instead of 26.55): those values are rounded one by one."""
+    scaled = values * 100
+    halves = numpy.abs(scaled - numpy.floor(scaled) - 0.5) < 1e-6
+    rounded = values.round(2)
+    if halves.any():
+        rounded[halves] = [round(value, 2) for value in values[halves].tolist()]
+
+    return rounded
+
+
+class PackageArrays:
+    """The array-backed parcels collection: the weights and dimensions of all the packages
+    (in the collection compatible units, NaN when missing) aggregated in vectorized passes
+
+    Args:
+        packages (List[Package]): the packages (with their presets) of the collection
+        weight_unit (WeightUnit): the collection compatible weight unit (KG or LB)
+        dimension_unit (DimensionUnit): the collection compatible dimension unit (CM or IN)
+    """
+
+    def __init__(self, packages: list, weight_unit, dimension_unit):
+        self.packages = packages
+        self.weight_unit = weight_unit
+        self.dimension_unit = dimension_unit
+
+        count = len(packages)
+        weights = numpy.array(
+            [_number(pkg.parcel.weight or pkg.preset.weight) for pkg in packages], dtype=float, ndmin=1
+        )
+        from_kg = numpy.array([pkg.weight_unit.name == "KG" for pkg in packages], dtype=bool, ndmin=1)
+        dimensions = numpy.array(
+            [
+                [_number(getattr(pkg.preset, name) or getattr(pkg.parcel, name)) for name in DIMENSION_FIELDS]
+                for pkg in packages
+            ],
+            dtype=float,
+        ).reshape(count, len(DIMENSION_FIELDS))
+        from_cm = numpy.array([pkg._dimension_unit == "CM" for pkg in packages], dtype=bool, ndmin=1)[:, None]
+        in_cm = from_kg[:, None]
+
+        # the weights and dimensions converted (and rounded) as the Weight and Dimension helpers do:
+        # the dimensions are first converted to the package dimension unit (CM for KG weights else IN).
+        self.weights_lb = _round(numpy.where(from_kg, weights * LB_PER_KG, weights))
+        self.weights = (
+            _round(numpy.where(from_kg, weights, weights / LB_PER_KG))
+            if weight_unit.name == "KG" else self.weights_lb
+        )
+        converted = numpy.where(
+            from_cm == in_cm, dimensions, _round(numpy.where(from_cm, dimensions / CM_PER_IN, dimensions * CM_PER_IN))
+        )
+        self.cm = _round(numpy.where(in_cm, converted, converted * CM_PER_IN))
+        self.inches = _round(numpy.where(in_cm, converted / CM_PER_IN, converted))
+        self.dimensions = self.cm if dimension_unit.name == "CM" else self.inches
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    @property
+    def weight(self) -> float:
+        """The total weight (in the compatible weight unit) of the packages"""
+        return float(numpy.nansum(self.weights))
+
+    @property
+    def volumes(self) -> "numpy.ndarray":
+        """The volume (in m³, as the Volume helper computes it) of each package"""
+        return _round(numpy.prod(_round(self.cm / 100), axis=1))
+
+    @property
+    def volume(self) -> float:
+        """The total volume (in m³) of the packages"""
+        return float(numpy.nansum(self.volumes))
+
+    def girths(self, unit=None) -> "numpy.ndarray":
+        """The girth (twice the sum of the two smallest sides, in CM by default) of each package"""
+        sides = numpy.sort(self._sides(unit), axis=1)
+        return _round((sides[:, 0] + sides[:, 1]) * 2)
+
+    def length_plus_girths(self, unit=None) -> "numpy.ndarray":
+        """The longest side plus the girth (in CM by default) of each package"""
+        return _round(numpy.max(self._sides(unit), axis=1) + self.girths(unit))
+
+    def dimensional_weights(self, divisor: float) -> "numpy.ndarray":
+        """The dimensional weight (L x W x H / divisor in the compatible units, e.g: 139 for IN³/LB
+        or 5000 for CM³/KG) of each package"""
+        return _round(numpy.prod(self.dimensions, axis=1) / divisor)
+
+    def billable_weights(self, divisor: float) -> "numpy.ndarray":
+        """The greatest of the actual and the dimensional weight of each package"""
+        return numpy.fmax(self.weights, self.dimensional_weights(divisor))
+
+    def errors(self, required: List[str] = None, max_weight=None) -> Dict[str, FieldErrorCode]:
+        """Return the validation errors (ordered as Packages.validate reports them) computed as array masks"""
+        found: List[Tuple[int, int, str, FieldErrorCode]] = []
+        for position, field in enumerate(required or []):
+            if field in WEIGHT_FIELDS:
+                missing = numpy.isnan(self.weights)
+            elif field in DIMENSION_FIELDS:
+                missing = numpy.isnan(self.dimensions[:, DIMENSION_FIELDS.index(field)])
+            else:
+                missing = numpy.array([_missing(getattr(pkg, field)) for pkg in self.packages], dtype=bool)
+
+            found += [
+                (index, position, f"parcel[{index}].{field}", FieldErrorCode.required)
+                for index in numpy.flatnonzero(missing)
+            ]
+
+        if max_weight is not None:
+            exceeding = numpy.nan_to_num(self.weights_lb) > max_weight.LB
+            found += [
+                (index, len(required or []), f"parcel[{index}].weight", FieldErrorCode.exceeds)
+                for index in numpy.flatnonzero(exceeding)
+            ]
+
+        return {key: code for _, _, key, code in sorted(found, key=lambda error: error[:2])}
+
+    def _sides(self, unit=None) -> "numpy.ndarray":
+        return self.cm if unit is None or unit.name == "CM" else self.inches
+
+
+def _number(value) -> float:
+    return numpy.nan if value is None else float(value)
+
+
+def _missing(prop) -> bool:
+    return prop is None or (hasattr(prop, "value") and prop.value is None)
+
+
+def vectorize(packages: list, weight_unit, dimension_unit) -> Optional[PackageArrays]:
+    """Return the array-backed collection of the packages or None if NumPy is not installed"""
+    if numpy is None:
+        return None
+
+    return PackageArrays(packages, weight_unit, dimension_unit)
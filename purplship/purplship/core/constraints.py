@@ -0,0 +1,67 @@
+"""Purplship carrier webservices constraints (the shipments a carrier can serve) definition module."""
+
+import attr
+from typing import FrozenSet, Iterable, Optional
+from purplship.core.models import Address
+from purplship.core.units import Dimension, Package, Weight
+from purplship.core.errors import (
+    FieldError,
+    FieldErrorCode,
+    ShippingSDKError,
+    OriginNotServicedError,
+    DestinationNotServicedError,
+)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Constraints:
+    """The shipments a carrier webservice can serve, checked before sending any rate request.
+    The limits left undefined are not checked.
+
+    max_weight: the maximum weight of a package
+    max_length: the maximum length (longest side) of a package
+    max_length_plus_girth: the maximum length plus girth (twice the sum of the two shortest sides) of a package
+    origin_countries: the origin country codes served
+    destination_countries: the destination country codes served
+    """
+
+    max_weight: Optional[Weight] = None
+    max_length: Optional[Dimension] = None
+    max_length_plus_girth: Optional[Dimension] = None
+    origin_countries: Optional[FrozenSet[str]] = None
+    destination_countries: Optional[FrozenSet[str]] = None
+
+    def check(self, shipper: Address, recipient: Address, packages: Iterable[Package]) -> Optional[ShippingSDKError]:
+        """Return the error of a shipment the carrier cannot serve or None if it might be served"""
+        origin, destination = shipper.country_code, recipient.country_code
+        if self.origin_countries is not None and origin is not None and origin not in self.origin_countries:
+            return OriginNotServicedError(origin)
+        if (
+            self.destination_countries is not None
+            and destination is not None
+            and destination not in self.destination_countries
+        ):
+            return DestinationNotServicedError(destination)
+
+        errors = {}
+        max_weight = self.max_weight.LB if self.max_weight is not None else None
+        max_length = self.max_length.IN if self.max_length is not None else None
+        max_length_plus_girth = self.max_length_plus_girth.IN if self.max_length_plus_girth is not None else None
+        for index, package in enumerate(packages):
+            if max_weight is not None and (package.weight.LB or 0.0) > max_weight:
+                errors[f"parcel[{index}].weight"] = FieldErrorCode.exceeds
+
+            if max_length is None and max_length_plus_girth is None:
+                continue
+
+            sides = [package.length.IN, package.width.IN, package.height.IN]
+            if any(side is None for side in sides):
+                continue
+
+            shortest, middle, longest = sorted(sides)
+            if max_length is not None and longest > max_length:
+                errors[f"parcel[{index}].length"] = FieldErrorCode.exceeds
+            if max_length_plus_girth is not None and longest + 2 * (shortest + middle) > max_length_plus_girth:
+                errors[f"parcel[{index}].length_plus_girth"] = FieldErrorCode.exceeds
+
+        return FieldError(errors) if any(errors) else None
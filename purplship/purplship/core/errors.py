@@ -84,6 +84,17 @@ class MultiParcelNotSupportedError(ShippingSDKError):
         super().__init__(f"Multi-parcel shipment not supported")
 
 
+class RequestTimeoutError(ShippingSDKError):
+    """Raised when a carrier does not respond within the allowed time."""
+
+    code = "SHIPPING_SDK_TIMEOUT_ERROR"
+
+    def __init__(self, timeout: float = None):
+        super().__init__(
+            f"Request timed out after {timeout}s" if timeout is not None else "Request timed out"
+        )
+
+
 """Deprecated Custom Errors"""
 
 
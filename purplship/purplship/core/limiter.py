@@ -0,0 +1,199 @@
+"""Purplship carrier requests rate limiting module.
+
+A token bucket refilled at `rps` tokens per second (up to `burst` tokens) paces the requests sent
+to a carrier account while a concurrency counter caps the requests in flight.
+The bucket state lives in memory (shared by the threads of the process) or in a local file
+(shared by the worker processes, e.g: a file under /dev/shm for a shared memory backed state).
+The requests in flight are always counted per process: the slots of a worker killed before releasing them
+would otherwise never be given back.
+"""
+
+import os
+import time
+import struct
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+import attr
+
+from purplship.core.errors import RequestTimeoutError
+
+POLL_INTERVAL = 0.005
+_STATE = struct.Struct("dd")  # tokens, last refill time
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RateLimit:
+    """A carrier account requests rate limit
+
+    rps: the sustained number of requests per second
+    burst: the number of requests that can be sent at once after an idle period
+    max_concurrency: the maximum number of requests in flight (per process)
+    path: a local file sharing the limit state between worker processes (in memory by default)
+    """
+
+    rps: float = None
+    burst: int = 1
+    max_concurrency: int = None
+    path: str = None
+
+
+class Bucket(ABC):
+    """A token bucket state"""
+
+    def __init__(self, rate_limit: RateLimit):
+        self.rate_limit = rate_limit
+
+    def _take(self, tokens: float, stamp: float, in_flight: int, now: float) -> Tuple[float, float, int, float]:
+        """Refill the bucket and take a token and a request slot if both are available.
+
+        Returns:
+            Tuple: the new state and the time to wait before retrying (0 when acquired)
+        """
+        rps, burst = self.rate_limit.rps, max(self.rate_limit.burst or 1, 1)
+        max_concurrency = self.rate_limit.max_concurrency
+
+        if rps is not None:
+            tokens = min(burst, tokens + max(now - stamp, 0) * rps)
+        if max_concurrency is not None and in_flight >= max_concurrency:
+            return tokens, now, in_flight, POLL_INTERVAL
+        if rps is not None and tokens < 1:
+            return tokens, now, in_flight, (1 - tokens) / rps
+
+        return tokens - 1, now, in_flight + 1, 0
+
+    @abstractmethod
+    def take(self) -> float:
+        """Take a token and a request slot. Return 0 when acquired or the time to wait before retrying"""
+        pass
+
+    @abstractmethod
+    def release(self):
+        """Release a request slot"""
+        pass
+
+
+class MemoryBucket(Bucket):
+    """A token bucket shared by the threads of the process"""
+
+    def __init__(self, rate_limit: RateLimit):
+        super().__init__(rate_limit)
+        self.lock = threading.Lock()
+        self.state = (float(max(rate_limit.burst or 1, 1)), time.monotonic(), 0)
+
+    def take(self) -> float:
+        with self.lock:
+            tokens, stamp, in_flight, wait = self._take(*self.state, time.monotonic())
+            self.state = (tokens, stamp, in_flight)
+            return wait
+
+    def release(self):
+        with self.lock:
+            tokens, stamp, in_flight = self.state
+            self.state = (tokens, stamp, max(in_flight - 1, 0))
+
+
+class FileBucket(Bucket):
+    """A token bucket shared by the processes of the host through a locked state file
+    (the requests in flight being counted per process)"""
+
+    def __init__(self, rate_limit: RateLimit):
+        import fcntl
+
+        super().__init__(rate_limit)
+        self.flock = fcntl.flock
+        self.lock_ex, self.lock_un = fcntl.LOCK_EX, fcntl.LOCK_UN
+        self.fd = os.open(rate_limit.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+
+    @contextmanager
+    def _state(self):
+        self.flock(self.fd, self.lock_ex)
+        try:
+            content = os.pread(self.fd, _STATE.size, 0)
+            state = (
+                list(_STATE.unpack(content)) if len(content) == _STATE.size
+                else [float(max(self.rate_limit.burst or 1, 1)), time.monotonic()]
+            )
+            yield state
+            os.pwrite(self.fd, _STATE.pack(*state), 0)
+        finally:
+            self.flock(self.fd, self.lock_un)
+
+    def take(self) -> float:
+        with self.lock, self._state() as state:
+            tokens, stamp = state
+            tokens, stamp, self.in_flight, wait = self._take(tokens, stamp, self.in_flight, time.monotonic())
+            state[:] = [tokens, stamp]
+            return wait
+
+    def release(self):
+        with self.lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+
+    def __del__(self):
+        os.close(self.fd)
+
+
+class Limiter:
+    """A carrier account requests rate limiter"""
+
+    def __init__(self, rate_limit: RateLimit):
+        self.rate_limit = rate_limit
+        self.bucket: Bucket = (
+            FileBucket(rate_limit) if rate_limit.path is not None else MemoryBucket(rate_limit)
+        )
+
+    def _wait(self, expiry: Optional[float]) -> float:
+        wait = self.bucket.take()
+        if wait > 0 and expiry is not None and time.monotonic() + wait > expiry:
+            raise RequestTimeoutError()
+        return wait
+
+    @contextmanager
+    def acquire(self, timeout: float = None):
+        """Wait (at most `timeout` seconds) for the right to send a request within the context"""
+        expiry = None if timeout is None else time.monotonic() + timeout
+        wait = self._wait(expiry)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._wait(expiry)
+        try:
+            yield
+        finally:
+            self.bucket.release()
+
+    @asynccontextmanager
+    async def acquire_async(self, timeout: float = None):
+        """Wait (at most `timeout` seconds) for the right to send a request without blocking the event loop"""
+        expiry = None if timeout is None else time.monotonic() + timeout
+        wait = self._wait(expiry)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._wait(expiry)
+        try:
+            yield
+        finally:
+            self.bucket.release()
+
+
+_limiters: Dict[Tuple[str, RateLimit], Limiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(key: str, rate_limit: Optional[RateLimit]) -> Optional[Limiter]:
+    """Return the limiter shared by all the requests sent to a carrier account (identified by `key`)
+    under a given rate limit"""
+    if rate_limit is None:
+        return None
+
+    with _limiters_lock:
+        limiter = _limiters.get((key, rate_limit))
+        if limiter is None:
+            limiter = _limiters[(key, rate_limit)] = Limiter(rate_limit)
+
+        return limiter
@@ -1,11 +1,12 @@
 """Purplship Extension Metadata definition module."""
 import attr
-from enum import Enum
 from typing import Optional, Type
 
 from purplship.api.proxy import Proxy
 from purplship.api.mapper import Mapper
 from purplship.core.settings import Settings
+from purplship.core.utils.enum import Enum
+from purplship.core.constraints import Constraints
 
 
 @attr.s(auto_attribs=True)
@@ -27,5 +28,9 @@ class Metadata:
     package_presets: Optional[Type[Enum]] = None
     packaging_types: Optional[Type[Enum]] = None
 
+    # Webservice limits
+    max_tracking_batch_size: Optional[int] = None  # the tracking numbers accepted per tracking request
+    constraints: Optional[Constraints] = None  # the shipments served (the others are not sent for rating)
+
     def __getitem__(self, item):
         return getattr(self, item)
@@ -3,17 +3,25 @@
 import attr
 from typing import Optional
 from abc import ABC
+from purplship.core.limiter import RateLimit
 
 
 @attr.s(auto_attribs=True)
 class Settings(ABC):
     """
     Unified API carrier Connection settings (Interface)
+
+    max_concurrency: the maximum number of requests sent to the carrier at the same time by a single operation
+    timeout: the default time budget (in seconds) of an operation sent to the carrier
+    rate_limit: the carrier account requests rate limit (overrides the carrier documented quota)
     """
 
     carrier_id: str
     id: str = None
     test: bool = False
+    max_concurrency: int = attr.ib(default=None, kw_only=True)
+    timeout: float = attr.ib(default=None, kw_only=True)
+    rate_limit: RateLimit = attr.ib(default=None, kw_only=True)
 
     @property
     def server_url(self) -> Optional[str]:
@@ -1,7 +1,9 @@
 """Purplship universal data types and units definitions"""
 import attr
+import functools
+import threading
 import phonenumbers
-from typing import List, Type, Optional, Iterator, Iterable, Tuple, Any, Union, cast
+from typing import Callable, Dict, List, Type, Optional, Iterator, Iterable, Tuple, Any, Union, cast, TYPE_CHECKING
 from purplship.core.utils import NF, Enum, Spec, SF
 from purplship.core.models import Parcel, Address, AddressExtra
 from purplship.core.errors import (
@@ -10,6 +12,9 @@ from purplship.core.errors import (
     MultiParcelNotSupportedError,
 )
 
+if TYPE_CHECKING:
+    from purplship.core.arrays import PackageArrays
+
 
 @attr.s(auto_attribs=True)
 class PackagePreset:
@@ -95,17 +100,31 @@ class DimensionUnit(Enum):
     IN = "IN"
 
 
+@functools.lru_cache(maxsize=None)
+def _measurement_options(options: Type[Enum]) -> dict:
+    """Return the (min values and quantization) options table of a measurement options enum"""
+    return {m.name: m.value for m in list(options)}  # type: ignore
+
+
+_UNSET = object()
+
+
 class Dimension:
-    """The dimension common processing helper"""
+    """The dimension common processing helper (the conversions are computed once)"""
+    __slots__ = ("_value", "_unit", "_min_in", "_min_cm", "_quant", "_CM", "_IN", "_M")
+
     def __init__(self, value: float, unit: Union[DimensionUnit, str] = DimensionUnit.CM, options: Type[Enum] = Enum):
         self._value = value
         self._unit = DimensionUnit[unit] if isinstance(unit, str) else unit
 
         # Options mapping
-        measurement_options = {m.name: m.value for m in list(options)}  # type: ignore
+        measurement_options = _measurement_options(options)
         self._min_in = measurement_options.get('min_in')
         self._min_cm = measurement_options.get('min_cm')
         self._quant = measurement_options.get('quant')
+        self._CM: Union[float, None, object] = _UNSET
+        self._IN: Union[float, None, object] = _UNSET
+        self._M: Union[float, None, object] = _UNSET
 
     def __getitem__(self, item):
         return getattr(self, item)
@@ -129,32 +148,41 @@ class Dimension:
         if self._unit is None or self._value is None:
             return None
 
-        return self.__getattribute__(str(self._unit.name))
+        return self.CM if self._unit == DimensionUnit.CM else self.IN
 
     @property
     def CM(self):
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == DimensionUnit.IN:
-            return self._compute(self._value * 2.54, self._min_cm)
-        else:
-            return self._compute(self._value, self._min_cm)
+        if self._CM is _UNSET:
+            if self._unit is None or self._value is None:
+                self._CM = None
+            elif self._unit == DimensionUnit.IN:
+                self._CM = self._compute(self._value * 2.54, self._min_cm)
+            else:
+                self._CM = self._compute(self._value, self._min_cm)
+
+        return self._CM
 
     @property
     def IN(self):
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == DimensionUnit.CM:
-            return self._compute(self._value / 2.54, self._min_in)
-        else:
-            return self._compute(self._value, self._min_in)
+        if self._IN is _UNSET:
+            if self._unit is None or self._value is None:
+                self._IN = None
+            elif self._unit == DimensionUnit.CM:
+                self._IN = self._compute(self._value / 2.54, self._min_in)
+            else:
+                self._IN = self._compute(self._value, self._min_in)
+
+        return self._IN
 
     @property
     def M(self):
-        if self._unit is None or self._value is None:
-            return None
-        else:
-            return self._compute(self.CM / 100)
+        if self._M is _UNSET:
+            if self._unit is None or self._value is None:
+                self._M = None
+            else:
+                self._M = self._compute(self.CM / 100)
+
+        return self._M
 
     def map(self, options: Type[Enum]):
         return Dimension(
@@ -208,17 +236,22 @@ class Girth:
 
 
 class Weight:
-    """The weight common processing helper"""
+    """The weight common processing helper (the conversions are computed once)"""
+    __slots__ = ("_value", "_unit", "_min_lb", "_min_kg", "_min_oz", "_quant", "_KG", "_LB", "_OZ")
+
     def __init__(self, value: float, unit: Union[WeightUnit, str] = WeightUnit.KG, options: Type[Enum] = Enum):
         self._value = value
         self._unit = WeightUnit[unit] if isinstance(unit, str) else unit
 
         # Options mapping
-        measurement_options = {m.name: m.value for m in list(options)}  # type: ignore
+        measurement_options = _measurement_options(options)
         self._min_lb = measurement_options.get('min_lb')
         self._min_kg = measurement_options.get('min_kg')
         self._min_oz = measurement_options.get('min_oz')
         self._quant = measurement_options.get('quant')
+        self._KG: Union[float, None, object] = _UNSET
+        self._LB: Union[float, None, object] = _UNSET
+        self._OZ: Union[float, None, object] = _UNSET
 
     def __getitem__(self, item):
         return getattr(self, item)
@@ -242,40 +275,49 @@ class Weight:
         if self._unit is None or self._value is None:
             return None
 
-        return self.__getattribute__(str(self._unit.name))
+        return self.KG if self._unit == WeightUnit.KG else self.LB
 
     @property
     def KG(self) -> Optional[float]:
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == WeightUnit.KG:
-            return self._compute(self._value, self._min_kg)
-        elif self._unit == WeightUnit.LB:
-            return self._compute(self._value / 2.205, self._min_kg)
-
-        return None
+        if self._KG is _UNSET:
+            if self._unit is None or self._value is None:
+                self._KG = None
+            elif self._unit == WeightUnit.KG:
+                self._KG = self._compute(self._value, self._min_kg)
+            elif self._unit == WeightUnit.LB:
+                self._KG = self._compute(self._value / 2.205, self._min_kg)
+            else:
+                self._KG = None
+
+        return cast(Optional[float], self._KG)
 
     @property
     def LB(self) -> Optional[float]:
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == WeightUnit.LB:
-            return self._compute(self._value, self._min_lb)
-        elif self._unit == WeightUnit.KG:
-            return self._compute(self._value * 2.205, self._min_lb)
-
-        return None
+        if self._LB is _UNSET:
+            if self._unit is None or self._value is None:
+                self._LB = None
+            elif self._unit == WeightUnit.LB:
+                self._LB = self._compute(self._value, self._min_lb)
+            elif self._unit == WeightUnit.KG:
+                self._LB = self._compute(self._value * 2.205, self._min_lb)
+            else:
+                self._LB = None
+
+        return cast(Optional[float], self._LB)
 
     @property
     def OZ(self) -> Optional[float]:
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == WeightUnit.LB:
-            return self._compute(self._value * 16, self._min_oz)
-        elif self._unit == WeightUnit.KG:
-            return self._compute(self._value * 35.274, self._min_oz)
-
-        return None
+        if self._OZ is _UNSET:
+            if self._unit is None or self._value is None:
+                self._OZ = None
+            elif self._unit == WeightUnit.LB:
+                self._OZ = self._compute(self._value * 16, self._min_oz)
+            elif self._unit == WeightUnit.KG:
+                self._OZ = self._compute(self._value * 35.274, self._min_oz)
+            else:
+                self._OZ = None
+
+        return cast(Optional[float], self._OZ)
 
     def map(self, options: Type[Enum]):
         return Weight(
@@ -286,7 +328,7 @@ class Weight:
 
 
 class Package:
-    """The parcel common processing helper"""
+    """The parcel common processing helper (the weight and dimensions are computed once)"""
     def __init__(self, parcel: Parcel, template: PackagePreset = None):
         self.parcel: Parcel = parcel
         self.preset: PackagePreset = template or PackagePreset()
@@ -301,6 +343,7 @@ class Package:
             if self.parcel.weight is None
             else (self.parcel.weight_unit or self.preset.weight_unit)
         )
+        self._weight = self._width = self._height = self._length = None
 
     def _compute_dimension(self, value):
         dimension = Dimension(value, DimensionUnit[self._dimension_unit])
@@ -326,19 +369,31 @@ class Package:
 
     @property
     def weight(self):
-        return Weight(self.parcel.weight or self.preset.weight, self.weight_unit)
+        if self._weight is None:
+            self._weight = Weight(self.parcel.weight or self.preset.weight, self.weight_unit)
+
+        return self._weight
 
     @property
     def width(self):
-        return self._compute_dimension(self.preset.width or self.parcel.width)
+        if self._width is None:
+            self._width = self._compute_dimension(self.preset.width or self.parcel.width)
+
+        return self._width
 
     @property
     def height(self):
-        return self._compute_dimension(self.preset.height or self.parcel.height)
+        if self._height is None:
+            self._height = self._compute_dimension(self.preset.height or self.parcel.height)
+
+        return self._height
 
     @property
     def length(self):
-        return self._compute_dimension(self.preset.length or self.parcel.length)
+        if self._length is None:
+            self._length = self._compute_dimension(self.preset.length or self.parcel.length)
+
+        return self._length
 
     @property
     def girth(self):
@@ -371,6 +426,7 @@ class Packages(Iterable[Package]):
         presets: Type[Enum] = None,
         required: List[str] = None,
         max_weight: Weight = None,
+        vectorized: bool = False,
     ):
         def compute_preset(parcel) -> Optional[PackagePreset]:
             if (presets is None) | (
@@ -383,6 +439,9 @@ class Packages(Iterable[Package]):
         self._items = [Package(parcel, compute_preset(parcel)) for parcel in parcels]
         self._required = required
         self._max_weight = max_weight
+        self._weight: Optional[Weight] = None
+        self._arrays: Optional['PackageArrays'] = None
+        self._vectorized = vectorized
         self.validate()
 
     def __getitem__(self, index: int) -> Package:
@@ -402,13 +461,29 @@ class Packages(Iterable[Package]):
 
     @property
     def weight(self) -> Weight:
-        unit, _ = self.compatible_units
-        value = sum(pkg.weight[unit.name] for pkg in self._items if pkg.weight[unit.name] is not None)
+        if self._weight is None and self._vectorized and self.arrays is not None:
+            self._weight = Weight(unit=self.arrays.weight_unit, value=self.arrays.weight)
+
+        if self._weight is None:
+            unit, _ = self.compatible_units
+            weights = (pkg.weight[unit.name] for pkg in self._items)
+            value = sum(weight for weight in weights if weight is not None)
+
+            self._weight = (
+                Weight(None, None) if value is None or not any(self._items) else Weight(unit=unit, value=value)
+            )
+
+        return self._weight
 
-        if value is None or not any(self._items):
-            return Weight(None, None)
+    @property
+    def arrays(self) -> Optional['PackageArrays']:
+        """The array-backed (vectorized) representation of the packages or None if NumPy is not installed"""
+        if self._arrays is None:
+            from purplship.core.arrays import vectorize
+
+            self._arrays = vectorize(self._items, *self.compatible_units)
 
-        return Weight(unit=unit, value=value)
+        return self._arrays
 
     @property
     def package_type(self) -> str:
@@ -428,7 +503,12 @@ class Packages(Iterable[Package]):
         required = required or self._required
         max_weight = max_weight or self._max_weight
 
-        if any(check is not None for check in [required, max_weight]):
+        if any(check is not None for check in [required, max_weight]) and self._vectorized and self.arrays is not None:
+            errors = self.arrays.errors(required, max_weight)
+            if any(errors.items()):
+                raise FieldError(errors)
+
+        elif any(check is not None for check in [required, max_weight]):
             errors = {}
             for index, package in enumerate(self._items):
                 if required is not None:
@@ -451,9 +531,10 @@ class Packages(Iterable[Package]):
             parcels: List[Parcel],
             presets: Type[Enum] = None,
             required: List[str] = None,
-            max_weight: Weight = None) -> Union[List[Package], 'Packages']:
+            max_weight: Weight = None,
+            vectorized: bool = False) -> Union[List[Package], 'Packages']:
 
-        return cast(Union[List[Package], Packages], Packages(parcels, presets, required, max_weight))
+        return cast(Union[List[Package], Packages], Packages(parcels, presets, required, max_weight, vectorized))
 
 
 class Option(Enum):
@@ -469,15 +550,29 @@ class Option(Enum):
     signature_confirmation = Spec.asFlag("signature_confirmation")
 
 
+@functools.lru_cache(maxsize=None)
+def _members(enum: Type[Enum]) -> Dict[str, Enum]:
+    """Return the members (including the aliases) table of a services or options enum"""
+    return dict(enum.__members__)
+
+
+@functools.lru_cache(maxsize=None)
+def _option_specs(option_type: Type[Enum]) -> Dict[str, Tuple[str, Callable]]:
+    """Return the option keys → (option name, spec compute function) dispatch table of an options enum"""
+    return {key: (member.name, member.value.compute) for key, member in _members(option_type).items()}
+
+
 class Options:
     """The options common processing helper"""
     def __init__(self, options: dict, option_type: Type[Enum] = Enum):
+        specs = _option_specs(option_type) if option_type is not None else {}
+        universal_specs = _option_specs(Option)
         option_values = {}
         for key, val in options.items():
-            if option_type is not None and key in option_type:
-                option_values[option_type[key].name] = option_type[key].value.apply(val)
-            elif key in Option and key:
-                option_values[key] = Option[key].value.apply(val)
+            spec = specs.get(key) or universal_specs.get(key)
+            if spec is not None:
+                name, compute = spec
+                option_values[name] = compute(val)
 
         self._options = option_values
 
@@ -545,9 +640,11 @@ class Options:
 class Services:
     """The services common processing helper"""
     def __init__(self, services: Iterable, service_type: Type[Enum]):
+        members = _members(service_type)
         self._services = [
-            service_type[s] for s in services if s in service_type
+            members[s] for s in services if isinstance(s, str) and s in members
         ]
+        self._names = {s.name for s in self._services}
 
     def __len__(self) -> int:
         return len(self._services)
@@ -556,7 +653,7 @@ class Services:
         return iter(self._services)
 
     def __contains__(self, item) -> bool:
-        return item in [s.name for s in self._services]
+        return item in self._names
 
     @property
     def first(self) -> Enum:
@@ -604,7 +701,7 @@ class CompleteAddress:
 
     @property
     def country_name(self):
-        return Country[self._address.country_code].value
+        return COUNTRIES[self._address.country_code]
 
     @property
     def address_line(self) -> str:
@@ -660,635 +757,680 @@ class CompleteAddress:
         return cast(Union[Address, AddressExtra, CompleteAddress], CompleteAddress(address))
 
 
-class Currency(Enum):
-    EUR = "Euro"
-    AED = "UAE Dirham"
-    USD = "US Dollar"
-    XCD = "East Caribbean Dollar"
-    AMD = "Dran"
-    ANG = "Netherlands Antilles Guilder"
-    AOA = "Kwanza"
-    ARS = "Argentine Peso"
-    AUD = "Australian Dollar"
-    AWG = "Aruba Guilder"
-    AZN = "Manat"
-    BAM = "Convertible Marks"
-    BBD = "Barbadian Dollar"
-    BDT = "Taka"
-    XOF = "CFA Franc West Africa"
-    BGN = "Bulgarian Lev"
-    BHD = "Bahraini Dinar"
-    BIF = "Burundese Franc"
-    BMD = "Bermudian Dollar"
-    BND = "Brunei Dollar"
-    BOB = "Boliviano"
-    BRL = "Real"
-    BSD = "Bahamian Dollar"
-    BTN = "Ngultrum"
-    BWP = "Pula"
-    BYN = "Belarussian Ruble"
-    BZD = "Belize Dollar"
-    CAD = "Canadian Dollar"
-    CDF = "Franc Congolais"
-    XAF = "CFA Franc Central Africa"
-    CHF = "Swiss Franc"
-    NZD = "New Zealand Dollar"
-    CLP = "New Chile Peso"
-    CNY = "Yuan (Ren Min Bi)"
-    COP = "Colombian Peso"
-    CRC = "Costa Rican Colon"
-    CUC = "Peso Convertible"
-    CVE = "Cape Verde Escudo"
-    CZK = "Czech Koruna"
-    DJF = "Djibouti Franc"
-    DKK = "Danish Krone"
-    DOP = "Dominican Republic Peso"
-    DZD = "Algerian Dinar"
-    EGP = "Egyptian Pound"
-    ERN = "Nakfa"
-    ETB = "Birr"
-    FJD = "Fijian Dollar"
-    GBP = "Pound Sterling"
-    GEL = "Georgian Lari"
-    GHS = "Cedi"
-    GMD = "Dalasi"
-    GNF = "Guinea Franc"
-    GTQ = "Quetzal"
-    GYD = "Guyanan Dollar"
-    HKD = "Hong Kong Dollar"
-    HNL = "Lempira"
-    HRK = "Croatian Kuna"
-    HTG = "Gourde"
-    HUF = "Forint"
-    IDR = "Rupiah"
-    ILS = "New Israeli Shekel"
-    INR = "Indian Rupee"
-    IRR = "Iranian Rial"
-    ISK = "Icelandic Krona"
-    JMD = "Jamaican Dollar"
-    JOD = "Jordanian Dinar"
-    JPY = "Yen"
-    KES = "Kenyan Shilling"
-    KGS = "Som"
-    KHR = "Khmer Rial"
-    KMF = "Comoros Franc"
-    KPW = "North Korean Won"
-    KRW = "Won"
-    KWD = "Kuwaiti Dinar"
-    KYD = "Cayman Islands Dollar"
-    KZT = "Tenge"
-    LAK = "Kip"
-    LKR = "Sri Lankan Rupee"
-    LRD = "Liberian Dollar"
-    LSL = "Loti"
-    LYD = "Libyan Dinar"
-    MAD = "Moroccan Dirham"
-    MDL = "Leu"
-    MGA = "Ariary"
-    MKD = "Denar"
-    MMK = "Kyat"
-    MNT = "Tugrik"
-    MOP = "Pataca"
-    MRO = "Ouguiya"
-    MUR = "Mauritius Rupee"
-    MVR = "Rufiyaa"
-    MWK = "Kwacha"
-    MXN = "Mexican Nuevo Peso"
-    MYR = "Ringgit"
-    MZN = "Mozambique Metical"
-    NAD = "Namibian Dollar"
-    XPF = "CFP Franc"
-    NGN = "Naira"
-    NIO = "Cordoba Oro"
-    NOK = "Norwegian Krone"
-    NPR = "Nepalese Rupee"
-    OMR = "Omani Rial"
-    PEN = "Nuevo Sol"
-    PGK = "Kina"
-    PHP = "Phillipines Peso"
-    PKR = "Pakistani Rupee"
-    PLN = "Zloty"
-    PYG = "Guarani"
-    QAR = "Qatar Rial"
-    RON = "Leu"
-    RSD = "Serbia, Dinars"
-    RUB = "Russian Ruble"
-    RWF = "Rwanda Franc"
-    SAR = "Saudi Riyal"
-    SBD = "Solomon Islands Dollar"
-    SCR = "Seychelles Rupee"
-    SDG = "Sudanese Pound"
-    SEK = "Swedish Krona"
-    SGD = "Singapore Dollar"
-    SHP = "St. Helena Pound"
-    SLL = "Leone"
-    SOS = "Somali Shilling"
-    SRD = "Suriname Dollar"
-    SSP = "South Sudanese pound"
-    STD = "Dobra"
-    SYP = "Syrian Pound"
-    SZL = "Lilangeni"
-    THB = "Baht"
-    TJS = "Somoni"
-    TND = "Tunisian Dinar"
-    TOP = "Pa'anga"
-    TRY = "New Turkish Lira"
-    TTD = "Trinidad and Tobago Dollar"
-    TWD = "New Taiwan Dollar"
-    TZS = "Tanzanian Shilling"
-    UAH = "Hryvna"
-    UYU = "Peso Uruguayo"
-    UZS = "Sum"
-    VEF = "Bolivar Fuerte"
-    VND = "Dong"
-    VUV = "Vanuatu Vatu"
-    WST = "Tala"
-    YER = "Yemeni Riyal"
-    ZAR = "South African Rand"
-    ZMW = "Kwacha"
-
-
-class Country(Enum):
-    AD = "Andorra"
-    AE = "United Arab Emirates"
-    AF = "Afghanistan"
-    AG = "Antigua"
-    AI = "Anguilla"
-    AL = "Albania"
-    AM = "Armenia"
-    AN = "Netherlands Antilles"
-    AO = "Angola"
-    AR = "Argentina"
-    AS = "American Samoa"
-    AT = "Austria"
-    AU = "Australia"
-    AW = "Aruba"
-    AZ = "Azerbaijan"
-    BA = "Bosnia And Herzegovina"
-    BB = "Barbados"
-    BD = "Bangladesh"
-    BE = "Belgium"
-    BF = "Burkina Faso"
-    BG = "Bulgaria"
-    BH = "Bahrain"
-    BI = "Burundi"
-    BJ = "Benin"
-    BM = "Bermuda"
-    BN = "Brunei"
-    BO = "Bolivia"
-    BR = "Brazil"
-    BS = "Bahamas"
-    BT = "Bhutan"
-    BW = "Botswana"
-    BY = "Belarus"
-    BZ = "Belize"
-    CA = "Canada"
-    CD = "Congo, The Democratic Republic Of"
-    CF = "Central African Republic"
-    CG = "Congo"
-    CH = "Switzerland"
-    CI = "Cote D Ivoire"
-    CK = "Cook Islands"
-    CL = "Chile"
-    CM = "Cameroon"
-    CN = "China, Peoples Republic"
-    CO = "Colombia"
-    CR = "Costa Rica"
-    CU = "Cuba"
-    CV = "Cape Verde"
-    CY = "Cyprus"
-    CZ = "Czech Republic, The"
-    DE = "Germany"
-    DJ = "Djibouti"
-    DK = "Denmark"
-    DM = "Dominica"
-    DO = "Dominican Republic"
-    DZ = "Algeria"
-    EC = "Ecuador"
-    EE = "Estonia"
-    EG = "Egypt"
-    ER = "Eritrea"
-    ES = "Spain"
-    ET = "Ethiopia"
-    FI = "Finland"
-    FJ = "Fiji"
-    FK = "Falkland Islands"
-    FM = "Micronesia, Federated States Of"
-    FO = "Faroe Islands"
-    FR = "France"
-    GA = "Gabon"
-    GB = "United Kingdom"
-    GD = "Grenada"
-    GE = "Georgia"
-    GF = "French Guyana"
-    GG = "Guernsey"
-    GH = "Ghana"
-    GI = "Gibraltar"
-    GL = "Greenland"
-    GM = "Gambia"
-    GN = "Guinea Republic"
-    GP = "Guadeloupe"
-    GQ = "Guinea-equatorial"
-    GR = "Greece"
-    GT = "Guatemala"
-    GU = "Guam"
-    GW = "Guinea-bissau"
-    GY = "Guyana (british)"
-    HK = "Hong Kong"
-    HN = "Honduras"
-    HR = "Croatia"
-    HT = "Haiti"
-    HU = "Hungary"
-    IC = "Canary Islands, The"
-    ID = "Indonesia"
-    IE = "Ireland, Republic Of"
-    IL = "Israel"
-    IN = "India"
-    IQ = "Iraq"
-    IR = "Iran (islamic Republic Of)"
-    IS = "Iceland"
-    IT = "Italy"
-    JE = "Jersey"
-    JM = "Jamaica"
-    JO = "Jordan"
-    JP = "Japan"
-    KE = "Kenya"
-    KG = "Kyrgyzstan"
-    KH = "Cambodia"
-    KI = "Kiribati"
-    KM = "Comoros"
-    KN = "St. Kitts"
-    KP = "Korea, The D.p.r Of (north K.)"
-    KR = "Korea, Republic Of (south K.)"
-    KV = "Kosovo"
-    KW = "Kuwait"
-    KY = "Cayman Islands"
-    KZ = "Kazakhstan"
-    LA = "Lao Peoples Democratic Republic"
-    LB = "Lebanon"
-    LC = "St. Lucia"
-    LI = "Liechtenstein"
-    LK = "Sri Lanka"
-    LR = "Liberia"
-    LS = "Lesotho"
-    LT = "Lithuania"
-    LU = "Luxembourg"
-    LV = "Latvia"
-    LY = "Libya"
-    MA = "Morocco"
-    MC = "Monaco"
-    MD = "Moldova, Republic Of"
-    ME = "Montenegro, Republic Of"
-    MG = "Madagascar"
-    MH = "Marshall Islands"
-    MK = "Macedonia, Republic Of"
-    ML = "Mali"
-    MM = "Myanmar"
-    MN = "Mongolia"
-    MO = "Macau"
-    MP = "Commonwealth No. Mariana Islands"
-    MQ = "Martinique"
-    MR = "Mauritania"
-    MS = "Montserrat"
-    MT = "Malta"
-    MU = "Mauritius"
-    MV = "Maldives"
-    MW = "Malawi"
-    MX = "Mexico"
-    MY = "Malaysia"
-    MZ = "Mozambique"
-    NA = "Namibia"
-    NC = "New Caledonia"
-    NE = "Niger"
-    NG = "Nigeria"
-    NI = "Nicaragua"
-    NL = "Netherlands, The"
-    NO = "Norway"
-    NP = "Nepal"
-    NR = "Nauru, Republic Of"
-    NU = "Niue"
-    NZ = "New Zealand"
-    OM = "Oman"
-    PA = "Panama"
-    PE = "Peru"
-    PF = "Tahiti"
-    PG = "Papua New Guinea"
-    PH = "Philippines, The"
-    PK = "Pakistan"
-    PL = "Poland"
-    PR = "Puerto Rico"
-    PT = "Portugal"
-    PW = "Palau"
-    PY = "Paraguay"
-    QA = "Qatar"
-    RE = "Reunion, Island Of"
-    RO = "Romania"
-    RS = "Serbia, Republic Of"
-    RU = "Russian Federation, The"
-    RW = "Rwanda"
-    SA = "Saudi Arabia"
-    SB = "Solomon Islands"
-    SC = "Seychelles"
-    SD = "Sudan"
-    SE = "Sweden"
-    SG = "Singapore"
-    SH = "Saint Helena"
-    SI = "Slovenia"
-    SK = "Slovakia"
-    SL = "Sierra Leone"
-    SM = "San Marino"
-    SN = "Senegal"
-    SO = "Somalia"
-    SR = "Suriname"
-    SS = "South Sudan"
-    ST = "Sao Tome And Principe"
-    SV = "El Salvador"
-    SY = "Syria"
-    SZ = "Swaziland"
-    TC = "Turks And Caicos Islands"
-    TD = "Chad"
-    TG = "Togo"
-    TH = "Thailand"
-    TJ = "Tajikistan"
-    TL = "Timor Leste"
-    TN = "Tunisia"
-    TO = "Tonga"
-    TR = "Turkey"
-    TT = "Trinidad And Tobago"
-    TV = "Tuvalu"
-    TW = "Taiwan"
-    TZ = "Tanzania"
-    UA = "Ukraine"
-    UG = "Uganda"
-    US = "United States"
-    UY = "Uruguay"
-    UZ = "Uzbekistan"
-    VA = "Vatican City State"
-    VC = "St. Vincent"
-    VE = "Venezuela"
-    VG = "British Virgin Islands"
-    VI = "U.S. Virgin Islands"
-    VN = "Vietnam"
-    VU = "Vanuatu"
-    WS = "Samoa"
-    XB = "Bonaire"
-    XC = "Curacao"
-    XE = "St. Eustatius"
-    XM = "St. Maarten"
-    XN = "Nevis"
-    XS = "Somaliland, Rep Of (north Somalia)"
-    XY = "St. Barthelemy"
-    YE = "Yemen, Republic Of"
-    YT = "Mayotte"
-    ZA = "South Africa"
-    ZM = "Zambia"
-    ZW = "Zimbabwe"
-
-
-class CountryCurrency(Enum):
-    AD = "EUR"
-    AE = "AED"
-    AF = "USD"
-    AG = "XCD"
-    AI = "XCD"
-    AL = "EUR"
-    AM = "AMD"
-    AN = "ANG"
-    AO = "AOA"
-    AR = "ARS"
-    AS = "USD"
-    AT = "EUR"
-    AU = "AUD"
-    AW = "AWG"
-    AZ = "AZN"
-    BA = "BAM"
-    BB = "BBD"
-    BD = "BDT"
-    BE = "EUR"
-    BF = "XOF"
-    BG = "BGN"
-    BH = "BHD"
-    BI = "BIF"
-    BJ = "XOF"
-    BM = "BMD"
-    BN = "BND"
-    BO = "BOB"
-    BR = "BRL"
-    BS = "BSD"
-    BT = "BTN"
-    BW = "BWP"
-    BY = "BYN"
-    BZ = "BZD"
-    CA = "CAD"
-    CD = "CDF"
-    CF = "XAF"
-    CG = "XAF"
-    CH = "CHF"
-    CI = "XOF"
-    CK = "NZD"
-    CL = "CLP"
-    CM = "XAF"
-    CN = "CNY"
-    CO = "COP"
-    CR = "CRC"
-    CU = "CUC"
-    CV = "CVE"
-    CY = "EUR"
-    CZ = "CZK"
-    DE = "EUR"
-    DJ = "DJF"
-    DK = "DKK"
-    DM = "XCD"
-    DO = "DOP"
-    DZ = "DZD"
-    EC = "USD"
-    EE = "EUR"
-    EG = "EGP"
-    ER = "ERN"
-    ES = "EUR"
-    ET = "ETB"
-    FI = "EUR"
-    FJ = "FJD"
-    FK = "GBP"
-    FM = "USD"
-    FO = "DKK"
-    FR = "EUR"
-    GA = "XAF"
-    GB = "GBP"
-    GD = "XCD"
-    GE = "GEL"
-    GF = "EUR"
-    GG = "GBP"
-    GH = "GHS"
-    GI = "GBP"
-    GL = "DKK"
-    GM = "GMD"
-    GN = "GNF"
-    GP = "EUR"
-    GQ = "XAF"
-    GR = "EUR"
-    GT = "GTQ"
-    GU = "USD"
-    GW = "XOF"
-    GY = "GYD"
-    HK = "HKD"
-    HN = "HNL"
-    HR = "HRK"
-    HT = "HTG"
-    HU = "HUF"
-    IC = "EUR"
-    ID = "IDR"
-    IE = "EUR"
-    IL = "ILS"
-    IN = "INR"
-    IQ = "USD"
-    IR = "IRR"
-    IS = "ISK"
-    IT = "EUR"
-    JE = "GBP"
-    JM = "JMD"
-    JO = "JOD"
-    JP = "JPY"
-    KE = "KES"
-    KG = "KGS"
-    KH = "KHR"
-    KI = "AUD"
-    KM = "KMF"
-    KN = "XCD"
-    KP = "KPW"
-    KR = "KRW"
-    KV = "EUR"
-    KW = "KWD"
-    KY = "KYD"
-    KZ = "KZT"
-    LA = "LAK"
-    LB = "USD"
-    LC = "XCD"
-    LI = "CHF"
-    LK = "LKR"
-    LR = "LRD"
-    LS = "LSL"
-    LT = "EUR"
-    LU = "EUR"
-    LV = "EUR"
-    LY = "LYD"
-    MA = "MAD"
-    MC = "EUR"
-    MD = "MDL"
-    ME = "EUR"
-    MG = "MGA"
-    MH = "USD"
-    MK = "MKD"
-    ML = "XOF"
-    MM = "MMK"
-    MN = "MNT"
-    MO = "MOP"
-    MP = "USD"
-    MQ = "EUR"
-    MR = "MRO"
-    MS = "XCD"
-    MT = "EUR"
-    MU = "MUR"
-    MV = "MVR"
-    MW = "MWK"
-    MX = "MXN"
-    MY = "MYR"
-    MZ = "MZN"
-    NA = "NAD"
-    NC = "XPF"
-    NE = "XOF"
-    NG = "NGN"
-    NI = "NIO"
-    NL = "EUR"
-    NO = "NOK"
-    NP = "NPR"
-    NR = "AUD"
-    NU = "NZD"
-    NZ = "NZD"
-    OM = "OMR"
-    PA = "USD"
-    PE = "PEN"
-    PF = "XPF"
-    PG = "PGK"
-    PH = "PHP"
-    PK = "PKR"
-    PL = "PLN"
-    PR = "USD"
-    PT = "EUR"
-    PW = "USD"
-    PY = "PYG"
-    QA = "QAR"
-    RE = "EUR"
-    RO = "RON"
-    RS = "RSD"
-    RU = "RUB"
-    RW = "RWF"
-    SA = "SAR"
-    SB = "SBD"
-    SC = "SCR"
-    SD = "SDG"
-    SE = "SEK"
-    SG = "SGD"
-    SH = "SHP"
-    SI = "EUR"
-    SK = "EUR"
-    SL = "SLL"
-    SM = "EUR"
-    SN = "XOF"
-    SO = "SOS"
-    SR = "SRD"
-    SS = "SSP"
-    ST = "STD"
-    SV = "USD"
-    SY = "SYP"
-    SZ = "SZL"
-    TC = "USD"
-    TD = "XAF"
-    TG = "XOF"
-    TH = "THB"
-    TJ = "TJS"
-    TL = "USD"
-    TN = "TND"
-    TO = "TOP"
-    TR = "TRY"
-    TT = "TTD"
-    TV = "AUD"
-    TW = "TWD"
-    TZ = "TZS"
-    UA = "UAH"
-    UG = "USD"
-    US = "USD"
-    UY = "UYU"
-    UZ = "UZS"
-    VA = "EUR"
-    VC = "XCD"
-    VE = "VEF"
-    VG = "USD"
-    VI = "USD"
-    VN = "VND"
-    VU = "VUV"
-    WS = "WST"
-    XB = "EUR"
-    XC = "EUR"
-    XE = "ANG"
-    XM = "EUR"
-    XN = "XCD"
-    XS = "USD"
-    XY = "ANG"
-    YE = "YER"
-    YT = "EUR"
-    ZA = "ZAR"
-    ZM = "ZMW"
-    ZW = "USD"
+class Reference:
+    """A compact code → name reference table (countries, states, currencies...)
+    with its name → code index built on the first reverse lookup"""
 
+    __slots__ = ("names", "_codes")
+
+    def __init__(self, names: Dict[str, str]):
+        self.names = names
+        self._codes: Optional[Dict[str, str]] = None
+
+    def __contains__(self, code: Any) -> bool:
+        return isinstance(code, str) and code in self.names
+
+    def __getitem__(self, code: str) -> str:
+        return self.names[code]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def name(self, code: Optional[str]) -> Optional[str]:
+        """Return the name of a code or None"""
+        return self.names.get(code) if isinstance(code, str) else None
+
+    def code(self, name: Optional[str]) -> Optional[str]:
+        """Return the code of a (case insensitive) name or None"""
+        if not isinstance(name, str):
+            return None
+
+        codes = self._codes
+        if codes is None:
+            codes = {}
+            for code, value in self.names.items():
+                codes.setdefault(value.casefold(), code)
+            self._codes = codes
+
+        return codes.get(name.casefold())
+
+
+CURRENCIES = Reference(
+    {
+        "EUR": "Euro",
+        "AED": "UAE Dirham",
+        "USD": "US Dollar",
+        "XCD": "East Caribbean Dollar",
+        "AMD": "Dran",
+        "ANG": "Netherlands Antilles Guilder",
+        "AOA": "Kwanza",
+        "ARS": "Argentine Peso",
+        "AUD": "Australian Dollar",
+        "AWG": "Aruba Guilder",
+        "AZN": "Manat",
+        "BAM": "Convertible Marks",
+        "BBD": "Barbadian Dollar",
+        "BDT": "Taka",
+        "XOF": "CFA Franc West Africa",
+        "BGN": "Bulgarian Lev",
+        "BHD": "Bahraini Dinar",
+        "BIF": "Burundese Franc",
+        "BMD": "Bermudian Dollar",
+        "BND": "Brunei Dollar",
+        "BOB": "Boliviano",
+        "BRL": "Real",
+        "BSD": "Bahamian Dollar",
+        "BTN": "Ngultrum",
+        "BWP": "Pula",
+        "BYN": "Belarussian Ruble",
+        "BZD": "Belize Dollar",
+        "CAD": "Canadian Dollar",
+        "CDF": "Franc Congolais",
+        "XAF": "CFA Franc Central Africa",
+        "CHF": "Swiss Franc",
+        "NZD": "New Zealand Dollar",
+        "CLP": "New Chile Peso",
+        "CNY": "Yuan (Ren Min Bi)",
+        "COP": "Colombian Peso",
+        "CRC": "Costa Rican Colon",
+        "CUC": "Peso Convertible",
+        "CVE": "Cape Verde Escudo",
+        "CZK": "Czech Koruna",
+        "DJF": "Djibouti Franc",
+        "DKK": "Danish Krone",
+        "DOP": "Dominican Republic Peso",
+        "DZD": "Algerian Dinar",
+        "EGP": "Egyptian Pound",
+        "ERN": "Nakfa",
+        "ETB": "Birr",
+        "FJD": "Fijian Dollar",
+        "GBP": "Pound Sterling",
+        "GEL": "Georgian Lari",
+        "GHS": "Cedi",
+        "GMD": "Dalasi",
+        "GNF": "Guinea Franc",
+        "GTQ": "Quetzal",
+        "GYD": "Guyanan Dollar",
+        "HKD": "Hong Kong Dollar",
+        "HNL": "Lempira",
+        "HRK": "Croatian Kuna",
+        "HTG": "Gourde",
+        "HUF": "Forint",
+        "IDR": "Rupiah",
+        "ILS": "New Israeli Shekel",
+        "INR": "Indian Rupee",
+        "IRR": "Iranian Rial",
+        "ISK": "Icelandic Krona",
+        "JMD": "Jamaican Dollar",
+        "JOD": "Jordanian Dinar",
+        "JPY": "Yen",
+        "KES": "Kenyan Shilling",
+        "KGS": "Som",
+        "KHR": "Khmer Rial",
+        "KMF": "Comoros Franc",
+        "KPW": "North Korean Won",
+        "KRW": "Won",
+        "KWD": "Kuwaiti Dinar",
+        "KYD": "Cayman Islands Dollar",
+        "KZT": "Tenge",
+        "LAK": "Kip",
+        "LKR": "Sri Lankan Rupee",
+        "LRD": "Liberian Dollar",
+        "LSL": "Loti",
+        "LYD": "Libyan Dinar",
+        "MAD": "Moroccan Dirham",
+        "MDL": "Leu",
+        "MGA": "Ariary",
+        "MKD": "Denar",
+        "MMK": "Kyat",
+        "MNT": "Tugrik",
+        "MOP": "Pataca",
+        "MRO": "Ouguiya",
+        "MUR": "Mauritius Rupee",
+        "MVR": "Rufiyaa",
+        "MWK": "Kwacha",
+        "MXN": "Mexican Nuevo Peso",
+        "MYR": "Ringgit",
+        "MZN": "Mozambique Metical",
+        "NAD": "Namibian Dollar",
+        "XPF": "CFP Franc",
+        "NGN": "Naira",
+        "NIO": "Cordoba Oro",
+        "NOK": "Norwegian Krone",
+        "NPR": "Nepalese Rupee",
+        "OMR": "Omani Rial",
+        "PEN": "Nuevo Sol",
+        "PGK": "Kina",
+        "PHP": "Phillipines Peso",
+        "PKR": "Pakistani Rupee",
+        "PLN": "Zloty",
+        "PYG": "Guarani",
+        "QAR": "Qatar Rial",
+        "RON": "Leu",
+        "RSD": "Serbia, Dinars",
+        "RUB": "Russian Ruble",
+        "RWF": "Rwanda Franc",
+        "SAR": "Saudi Riyal",
+        "SBD": "Solomon Islands Dollar",
+        "SCR": "Seychelles Rupee",
+        "SDG": "Sudanese Pound",
+        "SEK": "Swedish Krona",
+        "SGD": "Singapore Dollar",
+        "SHP": "St. Helena Pound",
+        "SLL": "Leone",
+        "SOS": "Somali Shilling",
+        "SRD": "Suriname Dollar",
+        "SSP": "South Sudanese pound",
+        "STD": "Dobra",
+        "SYP": "Syrian Pound",
+        "SZL": "Lilangeni",
+        "THB": "Baht",
+        "TJS": "Somoni",
+        "TND": "Tunisian Dinar",
+        "TOP": "Pa'anga",
+        "TRY": "New Turkish Lira",
+        "TTD": "Trinidad and Tobago Dollar",
+        "TWD": "New Taiwan Dollar",
+        "TZS": "Tanzanian Shilling",
+        "UAH": "Hryvna",
+        "UYU": "Peso Uruguayo",
+        "UZS": "Sum",
+        "VEF": "Bolivar Fuerte",
+        "VND": "Dong",
+        "VUV": "Vanuatu Vatu",
+        "WST": "Tala",
+        "YER": "Yemeni Riyal",
+        "ZAR": "South African Rand",
+        "ZMW": "Kwacha",
+    }
+)
+
+
+COUNTRIES = Reference(
+    {
+        "AD": "Andorra",
+        "AE": "United Arab Emirates",
+        "AF": "Afghanistan",
+        "AG": "Antigua",
+        "AI": "Anguilla",
+        "AL": "Albania",
+        "AM": "Armenia",
+        "AN": "Netherlands Antilles",
+        "AO": "Angola",
+        "AR": "Argentina",
+        "AS": "American Samoa",
+        "AT": "Austria",
+        "AU": "Australia",
+        "AW": "Aruba",
+        "AZ": "Azerbaijan",
+        "BA": "Bosnia And Herzegovina",
+        "BB": "Barbados",
+        "BD": "Bangladesh",
+        "BE": "Belgium",
+        "BF": "Burkina Faso",
+        "BG": "Bulgaria",
+        "BH": "Bahrain",
+        "BI": "Burundi",
+        "BJ": "Benin",
+        "BM": "Bermuda",
+        "BN": "Brunei",
+        "BO": "Bolivia",
+        "BR": "Brazil",
+        "BS": "Bahamas",
+        "BT": "Bhutan",
+        "BW": "Botswana",
+        "BY": "Belarus",
+        "BZ": "Belize",
+        "CA": "Canada",
+        "CD": "Congo, The Democratic Republic Of",
+        "CF": "Central African Republic",
+        "CG": "Congo",
+        "CH": "Switzerland",
+        "CI": "Cote D Ivoire",
+        "CK": "Cook Islands",
+        "CL": "Chile",
+        "CM": "Cameroon",
+        "CN": "China, Peoples Republic",
+        "CO": "Colombia",
+        "CR": "Costa Rica",
+        "CU": "Cuba",
+        "CV": "Cape Verde",
+        "CY": "Cyprus",
+        "CZ": "Czech Republic, The",
+        "DE": "Germany",
+        "DJ": "Djibouti",
+        "DK": "Denmark",
+        "DM": "Dominica",
+        "DO": "Dominican Republic",
+        "DZ": "Algeria",
+        "EC": "Ecuador",
+        "EE": "Estonia",
+        "EG": "Egypt",
+        "ER": "Eritrea",
+        "ES": "Spain",
+        "ET": "Ethiopia",
+        "FI": "Finland",
+        "FJ": "Fiji",
+        "FK": "Falkland Islands",
+        "FM": "Micronesia, Federated States Of",
+        "FO": "Faroe Islands",
+        "FR": "France",
+        "GA": "Gabon",
+        "GB": "United Kingdom",
+        "GD": "Grenada",
+        "GE": "Georgia",
+        "GF": "French Guyana",
+        "GG": "Guernsey",
+        "GH": "Ghana",
+        "GI": "Gibraltar",
+        "GL": "Greenland",
+        "GM": "Gambia",
+        "GN": "Guinea Republic",
+        "GP": "Guadeloupe",
+        "GQ": "Guinea-equatorial",
+        "GR": "Greece",
+        "GT": "Guatemala",
+        "GU": "Guam",
+        "GW": "Guinea-bissau",
+        "GY": "Guyana (british)",
+        "HK": "Hong Kong",
+        "HN": "Honduras",
+        "HR": "Croatia",
+        "HT": "Haiti",
+        "HU": "Hungary",
+        "IC": "Canary Islands, The",
+        "ID": "Indonesia",
+        "IE": "Ireland, Republic Of",
+        "IL": "Israel",
+        "IN": "India",
+        "IQ": "Iraq",
+        "IR": "Iran (islamic Republic Of)",
+        "IS": "Iceland",
+        "IT": "Italy",
+        "JE": "Jersey",
+        "JM": "Jamaica",
+        "JO": "Jordan",
+        "JP": "Japan",
+        "KE": "Kenya",
+        "KG": "Kyrgyzstan",
+        "KH": "Cambodia",
+        "KI": "Kiribati",
+        "KM": "Comoros",
+        "KN": "St. Kitts",
+        "KP": "Korea, The D.p.r Of (north K.)",
+        "KR": "Korea, Republic Of (south K.)",
+        "KV": "Kosovo",
+        "KW": "Kuwait",
+        "KY": "Cayman Islands",
+        "KZ": "Kazakhstan",
+        "LA": "Lao Peoples Democratic Republic",
+        "LB": "Lebanon",
+        "LC": "St. Lucia",
+        "LI": "Liechtenstein",
+        "LK": "Sri Lanka",
+        "LR": "Liberia",
+        "LS": "Lesotho",
+        "LT": "Lithuania",
+        "LU": "Luxembourg",
+        "LV": "Latvia",
+        "LY": "Libya",
+        "MA": "Morocco",
+        "MC": "Monaco",
+        "MD": "Moldova, Republic Of",
+        "ME": "Montenegro, Republic Of",
+        "MG": "Madagascar",
+        "MH": "Marshall Islands",
+        "MK": "Macedonia, Republic Of",
+        "ML": "Mali",
+        "MM": "Myanmar",
+        "MN": "Mongolia",
+        "MO": "Macau",
+        "MP": "Commonwealth No. Mariana Islands",
+        "MQ": "Martinique",
+        "MR": "Mauritania",
+        "MS": "Montserrat",
+        "MT": "Malta",
+        "MU": "Mauritius",
+        "MV": "Maldives",
+        "MW": "Malawi",
+        "MX": "Mexico",
+        "MY": "Malaysia",
+        "MZ": "Mozambique",
+        "NA": "Namibia",
+        "NC": "New Caledonia",
+        "NE": "Niger",
+        "NG": "Nigeria",
+        "NI": "Nicaragua",
+        "NL": "Netherlands, The",
+        "NO": "Norway",
+        "NP": "Nepal",
+        "NR": "Nauru, Republic Of",
+        "NU": "Niue",
+        "NZ": "New Zealand",
+        "OM": "Oman",
+        "PA": "Panama",
+        "PE": "Peru",
+        "PF": "Tahiti",
+        "PG": "Papua New Guinea",
+        "PH": "Philippines, The",
+        "PK": "Pakistan",
+        "PL": "Poland",
+        "PR": "Puerto Rico",
+        "PT": "Portugal",
+        "PW": "Palau",
+        "PY": "Paraguay",
+        "QA": "Qatar",
+        "RE": "Reunion, Island Of",
+        "RO": "Romania",
+        "RS": "Serbia, Republic Of",
+        "RU": "Russian Federation, The",
+        "RW": "Rwanda",
+        "SA": "Saudi Arabia",
+        "SB": "Solomon Islands",
+        "SC": "Seychelles",
+        "SD": "Sudan",
+        "SE": "Sweden",
+        "SG": "Singapore",
+        "SH": "Saint Helena",
+        "SI": "Slovenia",
+        "SK": "Slovakia",
+        "SL": "Sierra Leone",
+        "SM": "San Marino",
+        "SN": "Senegal",
+        "SO": "Somalia",
+        "SR": "Suriname",
+        "SS": "South Sudan",
+        "ST": "Sao Tome And Principe",
+        "SV": "El Salvador",
+        "SY": "Syria",
+        "SZ": "Swaziland",
+        "TC": "Turks And Caicos Islands",
+        "TD": "Chad",
+        "TG": "Togo",
+        "TH": "Thailand",
+        "TJ": "Tajikistan",
+        "TL": "Timor Leste",
+        "TN": "Tunisia",
+        "TO": "Tonga",
+        "TR": "Turkey",
+        "TT": "Trinidad And Tobago",
+        "TV": "Tuvalu",
+        "TW": "Taiwan",
+        "TZ": "Tanzania",
+        "UA": "Ukraine",
+        "UG": "Uganda",
+        "US": "United States",
+        "UY": "Uruguay",
+        "UZ": "Uzbekistan",
+        "VA": "Vatican City State",
+        "VC": "St. Vincent",
+        "VE": "Venezuela",
+        "VG": "British Virgin Islands",
+        "VI": "U.S. Virgin Islands",
+        "VN": "Vietnam",
+        "VU": "Vanuatu",
+        "WS": "Samoa",
+        "XB": "Bonaire",
+        "XC": "Curacao",
+        "XE": "St. Eustatius",
+        "XM": "St. Maarten",
+        "XN": "Nevis",
+        "XS": "Somaliland, Rep Of (north Somalia)",
+        "XY": "St. Barthelemy",
+        "YE": "Yemen, Republic Of",
+        "YT": "Mayotte",
+        "ZA": "South Africa",
+        "ZM": "Zambia",
+        "ZW": "Zimbabwe",
+    }
+)
 
-def create_enum(name, values):
-    return Enum(name, values)  # type: ignore
+
+COUNTRY_CURRENCIES = Reference(
+    {
+        "AD": "EUR",
+        "AE": "AED",
+        "AF": "USD",
+        "AG": "XCD",
+        "AI": "XCD",
+        "AL": "EUR",
+        "AM": "AMD",
+        "AN": "ANG",
+        "AO": "AOA",
+        "AR": "ARS",
+        "AS": "USD",
+        "AT": "EUR",
+        "AU": "AUD",
+        "AW": "AWG",
+        "AZ": "AZN",
+        "BA": "BAM",
+        "BB": "BBD",
+        "BD": "BDT",
+        "BE": "EUR",
+        "BF": "XOF",
+        "BG": "BGN",
+        "BH": "BHD",
+        "BI": "BIF",
+        "BJ": "XOF",
+        "BM": "BMD",
+        "BN": "BND",
+        "BO": "BOB",
+        "BR": "BRL",
+        "BS": "BSD",
+        "BT": "BTN",
+        "BW": "BWP",
+        "BY": "BYN",
+        "BZ": "BZD",
+        "CA": "CAD",
+        "CD": "CDF",
+        "CF": "XAF",
+        "CG": "XAF",
+        "CH": "CHF",
+        "CI": "XOF",
+        "CK": "NZD",
+        "CL": "CLP",
+        "CM": "XAF",
+        "CN": "CNY",
+        "CO": "COP",
+        "CR": "CRC",
+        "CU": "CUC",
+        "CV": "CVE",
+        "CY": "EUR",
+        "CZ": "CZK",
+        "DE": "EUR",
+        "DJ": "DJF",
+        "DK": "DKK",
+        "DM": "XCD",
+        "DO": "DOP",
+        "DZ": "DZD",
+        "EC": "USD",
+        "EE": "EUR",
+        "EG": "EGP",
+        "ER": "ERN",
+        "ES": "EUR",
+        "ET": "ETB",
+        "FI": "EUR",
+        "FJ": "FJD",
+        "FK": "GBP",
+        "FM": "USD",
+        "FO": "DKK",
+        "FR": "EUR",
+        "GA": "XAF",
+        "GB": "GBP",
+        "GD": "XCD",
+        "GE": "GEL",
+        "GF": "EUR",
+        "GG": "GBP",
+        "GH": "GHS",
+        "GI": "GBP",
+        "GL": "DKK",
+        "GM": "GMD",
+        "GN": "GNF",
+        "GP": "EUR",
+        "GQ": "XAF",
+        "GR": "EUR",
+        "GT": "GTQ",
+        "GU": "USD",
+        "GW": "XOF",
+        "GY": "GYD",
+        "HK": "HKD",
+        "HN": "HNL",
+        "HR": "HRK",
+        "HT": "HTG",
+        "HU": "HUF",
+        "IC": "EUR",
+        "ID": "IDR",
+        "IE": "EUR",
+        "IL": "ILS",
+        "IN": "INR",
+        "IQ": "USD",
+        "IR": "IRR",
+        "IS": "ISK",
+        "IT": "EUR",
+        "JE": "GBP",
+        "JM": "JMD",
+        "JO": "JOD",
+        "JP": "JPY",
+        "KE": "KES",
+        "KG": "KGS",
+        "KH": "KHR",
+        "KI": "AUD",
+        "KM": "KMF",
+        "KN": "XCD",
+        "KP": "KPW",
+        "KR": "KRW",
+        "KV": "EUR",
+        "KW": "KWD",
+        "KY": "KYD",
+        "KZ": "KZT",
+        "LA": "LAK",
+        "LB": "USD",
+        "LC": "XCD",
+        "LI": "CHF",
+        "LK": "LKR",
+        "LR": "LRD",
+        "LS": "LSL",
+        "LT": "EUR",
+        "LU": "EUR",
+        "LV": "EUR",
+        "LY": "LYD",
+        "MA": "MAD",
+        "MC": "EUR",
+        "MD": "MDL",
+        "ME": "EUR",
+        "MG": "MGA",
+        "MH": "USD",
+        "MK": "MKD",
+        "ML": "XOF",
+        "MM": "MMK",
+        "MN": "MNT",
+        "MO": "MOP",
+        "MP": "USD",
+        "MQ": "EUR",
+        "MR": "MRO",
+        "MS": "XCD",
+        "MT": "EUR",
+        "MU": "MUR",
+        "MV": "MVR",
+        "MW": "MWK",
+        "MX": "MXN",
+        "MY": "MYR",
+        "MZ": "MZN",
+        "NA": "NAD",
+        "NC": "XPF",
+        "NE": "XOF",
+        "NG": "NGN",
+        "NI": "NIO",
+        "NL": "EUR",
+        "NO": "NOK",
+        "NP": "NPR",
+        "NR": "AUD",
+        "NU": "NZD",
+        "NZ": "NZD",
+        "OM": "OMR",
+        "PA": "USD",
+        "PE": "PEN",
+        "PF": "XPF",
+        "PG": "PGK",
+        "PH": "PHP",
+        "PK": "PKR",
+        "PL": "PLN",
+        "PR": "USD",
+        "PT": "EUR",
+        "PW": "USD",
+        "PY": "PYG",
+        "QA": "QAR",
+        "RE": "EUR",
+        "RO": "RON",
+        "RS": "RSD",
+        "RU": "RUB",
+        "RW": "RWF",
+        "SA": "SAR",
+        "SB": "SBD",
+        "SC": "SCR",
+        "SD": "SDG",
+        "SE": "SEK",
+        "SG": "SGD",
+        "SH": "SHP",
+        "SI": "EUR",
+        "SK": "EUR",
+        "SL": "SLL",
+        "SM": "EUR",
+        "SN": "XOF",
+        "SO": "SOS",
+        "SR": "SRD",
+        "SS": "SSP",
+        "ST": "STD",
+        "SV": "USD",
+        "SY": "SYP",
+        "SZ": "SZL",
+        "TC": "USD",
+        "TD": "XAF",
+        "TG": "XOF",
+        "TH": "THB",
+        "TJ": "TJS",
+        "TL": "USD",
+        "TN": "TND",
+        "TO": "TOP",
+        "TR": "TRY",
+        "TT": "TTD",
+        "TV": "AUD",
+        "TW": "TWD",
+        "TZ": "TZS",
+        "UA": "UAH",
+        "UG": "USD",
+        "US": "USD",
+        "UY": "UYU",
+        "UZ": "UZS",
+        "VA": "EUR",
+        "VC": "XCD",
+        "VE": "VEF",
+        "VG": "USD",
+        "VI": "USD",
+        "VN": "VND",
+        "VU": "VUV",
+        "WS": "WST",
+        "XB": "EUR",
+        "XC": "EUR",
+        "XE": "ANG",
+        "XM": "EUR",
+        "XN": "XCD",
+        "XS": "USD",
+        "XY": "ANG",
+        "YE": "YER",
+        "YT": "EUR",
+        "ZA": "ZAR",
+        "ZM": "ZMW",
+        "ZW": "USD",
+    }
+)
 
 
-class CountryState(Enum):
-    AE = create_enum(
-        "State",
+COUNTRY_STATES: Dict[str, Reference] = {
+    "AE": Reference(
         {
             "AB": "Abu Dhabi",
             "AJ": "Ajman",
@@ -1297,10 +1439,9 @@ class CountryState(Enum):
             "RA": "Ras al-Khaimah",
             "SH": "Sharjah",
             "UM": "Umm al-Qaiwain",
-        },
-    )
-    CA = create_enum(
-        "State",
+        }
+    ),
+    "CA": Reference(
         {
             "AB": "Alberta",
             "BC": "British Columbia",
@@ -1315,10 +1456,9 @@ class CountryState(Enum):
             "QC": "Quebec",
             "SK": "Saskatchewan",
             "YT": "Yukon",
-        },
-    )
-    CN = create_enum(
-        "State",
+        }
+    ),
+    "CN": Reference(
         {
             "anhui": "Anhui",
             "hainan": "Hainan",
@@ -1348,10 +1488,9 @@ class CountryState(Enum):
             "jiangsu": "Jiangsu",
             "shandong": "Shandong",
             "zhejiang": "Zhejiang",
-        },
-    )
-    IN = create_enum(
-        "State",
+        }
+    ),
+    "IN": Reference(
         {
             "AN": "Andaman & Nicobar (U.T)",
             "AP": "Andhra Pradesh",
@@ -1388,10 +1527,9 @@ class CountryState(Enum):
             "UA": "Uttaranchal",
             "UP": "Uttar Pradesh",
             "WB": "West Bengal",
-        },
-    )
-    MX = create_enum(
-        "State",
+        }
+    ),
+    "MX": Reference(
         {
             "AG": "Aguascalientes",
             "BC": "Baja California",
@@ -1425,10 +1563,9 @@ class CountryState(Enum):
             "VE": "Veracruz",
             "YU": "Yucatán",
             "ZA": "Zacatecas",
-        },
-    )
-    US = create_enum(
-        "State",
+        }
+    ),
+    "US": Reference(
         {
             "AL": "Alabama",
             "AK": "Alaska",
@@ -1482,5 +1619,52 @@ class CountryState(Enum):
             "WI": "Wisconsin",
             "WY": "Wyoming",
             "PR": "Puerto Rico",
-        },
-    )
+        }
+    ),
+}
+
+
+def state_name(country_code: Optional[str], code: Optional[str]) -> Optional[str]:
+    """Return the name of a country state (or province) code or None"""
+    states = COUNTRY_STATES.get(country_code) if isinstance(country_code, str) else None
+    return states.name(code) if states is not None else None
+
+
+def state_code(country_code: Optional[str], name: Optional[str]) -> Optional[str]:
+    """Return the code of a (case insensitive) country state (or province) name or None"""
+    states = COUNTRY_STATES.get(country_code) if isinstance(country_code, str) else None
+    return states.code(name) if states is not None else None
+
+
+def create_enum(name, values):
+    return Enum(name, values)  # type: ignore
+
+
+def _create_reference_enum(name: str) -> Type[Enum]:
+    if name == "CountryState":
+        states = {country: create_enum("State", table.names) for country, table in COUNTRY_STATES.items()}
+        return Enum(name, states, module=__name__)  # type: ignore
+
+    return Enum(name, _REFERENCE_TABLES[name].names, module=__name__)  # type: ignore
+
+
+_REFERENCE_TABLES = dict(Currency=CURRENCIES, Country=COUNTRIES, CountryCurrency=COUNTRY_CURRENCIES)
+_REFERENCE_ENUMS = ("Currency", "Country", "CountryCurrency", "CountryState")
+_reference_enums_lock = threading.Lock()
+
+# the reference enums are only created (from the tables) on their first access
+Currency: Any
+Country: Any
+CountryCurrency: Any
+CountryState: Any
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _REFERENCE_ENUMS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _reference_enums_lock:
+        if name not in globals():
+            globals()[name] = _create_reference_enum(name)
+
+    return globals()[name]
@@ -1,9 +1,75 @@
+import re
 import attr
 import json
 import types
-from typing import Union, Any, TypeVar, Callable
+import functools
+from typing import Union, Any, TypeVar, Callable, Hashable, Tuple, cast
 
 T = TypeVar("T")
+EMPTY_VALUES: Tuple[Any, ...] = (None, [], "")
+EMPTY_ARRAY = re.compile(r"\[\s*\]")
+
+
+def _prune(item: dict) -> dict:
+    return {k: v for k, v in item.items() if v not in EMPTY_VALUES}
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple:
+    return tuple(sorted(field.name for field in attr.fields(cls)))
+
+
+def _key(key: Any) -> str:
+    """Return a dictionary key as JSON (json.dumps) turns it into a string"""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True or key is False:
+        return "true" if key else "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _convert(item: Any, markers: set) -> Any:
+    """Return the value DICTPARSE.to_dict would have got back from its JSON round trip"""
+    if item is None or item is True or item is False:
+        return item
+    if isinstance(item, str):
+        return str.__str__(item)
+    if isinstance(item, int):
+        return int.__index__(item)
+    if isinstance(item, float):
+        return float(item)
+
+    if id(item) in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(id(item))
+    try:
+        if isinstance(item, (list, tuple)):
+            return [_convert(value, markers) for value in item]
+        if isinstance(item, dict):
+            return _prune({_key(key): _convert(value, markers) for key, value in sorted(item.items())})
+        if isinstance(item, type):
+            return item.__name__ if attr.has(item) else None
+        if attr.has(type(item)) and not callable(item):
+            return _prune({
+                name: _convert(getattr(item, name), markers) for name in _field_names(cast(Hashable, type(item)))
+            })
+        if isinstance(item, types.FunctionType):
+            return None
+        if callable(item):
+            return str(item)
+        if hasattr(item, "__dict__"):
+            return _convert(item.__dict__, markers)
+
+        return json.loads(DICTPARSE.jsonify(item), object_hook=_prune)
+    finally:
+        markers.discard(id(item))
 
 
 class DICTPARSE:
@@ -42,10 +108,17 @@ class DICTPARSE:
     def to_dict(entity: Any) -> dict:
         """Return a python dictionary.
 
-        recursively parse a data type using __dict__ into a JSON
+        recursively parse a data type (attrs classes, dictionaries, lists or using __dict__) or a JSON text
+        into a dictionary pruned of its None, [] and "" values
         """
-        return json.loads(
-            DICTPARSE.jsonify(entity) if not isinstance(entity, str) else entity,
-            object_hook=lambda d: {k: v for k, v in d.items() if v not in (None, [], "")},
-        )
+        if isinstance(entity, (str, bytes)):
+            text = entity if isinstance(entity, str) else entity.decode("utf-8")
+
+            # The pruning hook is only needed if the text holds a null, "" or [] token
+            if "null" in text or '""' in text or EMPTY_ARRAY.search(text) is not None:
+                return json.loads(text, object_hook=_prune)
+
+            return json.loads(text)
+
+        return _convert(entity, set())
 
@@ -1,17 +1,40 @@
 import io
 import re
+import time
+import socket
 import asyncio
 import logging
 import base64
 from PIL import Image
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError
-from typing import List, TypeVar, Callable, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.error import HTTPError, URLError
+from contextvars import ContextVar, copy_context
+from typing import Any, List, TypeVar, Callable, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from purplship.core.errors import RequestTimeoutError, ShippingSDKError
+from purplship.core.utils.transport import (
+    Transport,
+    PooledTransport,
+    AsyncTransport,
+    AsyncPooledTransport,
+    ReplayTransport,
+    PendingRequests,
+    Slot,
+)
+from purplship.core.limiter import Limiter
+from purplship.core.utils.log import log_payload
+from purplship.core.utils.instrument import span
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 S = TypeVar("S")
+MAX_WORKERS = 10
+MAX_REPLAY_ROUNDS = 50
+_transport: Transport = PooledTransport()
+_async_transport: AsyncTransport = AsyncPooledTransport()
+_replay: ContextVar[Optional[ReplayTransport]] = ContextVar("replay", default=None)
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+_limiter: ContextVar[Optional[Limiter]] = ContextVar("limiter", default=None)
 
 
 def gif_to_pdf(gif_str: str) -> str:
@@ -29,24 +52,103 @@ def decode_bytes(byte):
     return byte.decode("utf-8")
 
 
-def request(decoder: Callable = decode_bytes, on_error: Callable[[HTTPError], str] = None, **args) -> str:
-    """Return an HTTP response body.
+def raw_bytes(byte: bytes) -> bytes:
+    """Keep a response body undecoded (e.g: XML responses handed to lxml as is)"""
+    return byte
 
-    make a http request (wrapper around Request method from built in urllib)
+
+def get_transport() -> Transport:
+    """Return the HTTP transport used by all the carrier proxies."""
+    return _transport
+
+
+def set_transport(transport: Transport) -> Transport:
+    """Replace the HTTP transport used by all the carrier proxies and return the previous one."""
+    global _transport
+    previous, _transport = _transport, transport
+    return previous
+
+
+def get_async_transport() -> AsyncTransport:
+    """Return the asynchronous HTTP transport used by the asyncio API."""
+    return _async_transport
+
+
+def set_async_transport(transport: AsyncTransport) -> AsyncTransport:
+    """Replace the asynchronous HTTP transport used by the asyncio API and return the previous one."""
+    global _async_transport
+    previous, _async_transport = _async_transport, transport
+    return previous
+
+
+@contextmanager
+def deadline(timeout: Optional[float]):
+    """Bound the time spent in all the requests sent within the context to `timeout` seconds.
+
+    Nested deadlines can only shorten the current one.
+    """
+    if timeout is None:
+        yield
+        return
+
+    current = _deadline.get()
+    expiry = time.monotonic() + timeout
+    token = _deadline.set(expiry if current is None else min(current, expiry))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Return the time left (in seconds) before the current deadline or None if there is none."""
+    expiry = _deadline.get()
+    return None if expiry is None else expiry - time.monotonic()
+
+
+@contextmanager
+def throttle(limiter: Optional[Limiter]):
+    """Pace all the requests sent within the context with the (carrier account) `limiter`."""
+    token = _limiter.set(limiter)
+    try:
+        yield
+    finally:
+        _limiter.reset(token)
+
+
+def _send(**args) -> bytes:
+    replay, limiter = _replay.get(), _limiter.get()
+    if replay is not None:
+        return replay.send(timeout=remaining_time(), **args)
+    if limiter is None:
+        with span("network"):
+            return _transport.send(timeout=remaining_time(), **args)
+
+    with limiter.acquire(remaining_time()):
+        with span("network"):
+            return _transport.send(timeout=remaining_time(), **args)
+
+
+def request(decoder: Callable = decode_bytes, on_error: Callable[[HTTPError], str] = None, **args) -> Any:
+    """Return an HTTP response body decoded by the decoder (a str by default, bytes with `raw_bytes`).
+
+    make a http request through the configured transport (pooled keep-alive connections by default)
     """
     logger.debug(f"sending request")
+    timeout = remaining_time()
+    if timeout is not None and timeout <= 0:
+        raise RequestTimeoutError()
+
     try:
-        req = Request(**args)
-        logger.info(f"Request URL:: {req.full_url}")
-        with urlopen(req) as f:
-            res = f.read()
-            try:
-                res = decoder(res)
-            except Exception as e:
-                logger.exception(e)
-
-            logger.debug(f"response content {res}")
-            return res
+        logger.info(f"Request URL:: {args.get('url')}")
+        res: Any = _send(**args)
+        try:
+            res = decoder(res)
+        except Exception as e:
+            logger.exception(e)
+
+        log_payload(logger, logging.DEBUG, "response content %s", res)
+        return res
     except HTTPError as e:
         logger.exception(e)
 
@@ -54,25 +156,86 @@ def request(decoder: Callable = decode_bytes, on_error: Callable[[HTTPError], st
             return on_error(e)
 
         error = e.read().decode("utf-8")
-        logger.debug(f"error response content {error}")
+        log_payload(logger, logging.DEBUG, "error response content %s", error)
         return error
+    except (socket.timeout, URLError) as e:
+        if isinstance(e, socket.timeout) or isinstance(getattr(e, "reason", None), socket.timeout):
+            raise RequestTimeoutError(timeout) from e
+        raise
 
 
 def exec_parrallel(function: Callable, sequence: List[S], max_workers: int = 2) -> List[T]:
     """Return a list of result for function execution on each element of the sequence."""
-    with ThreadPoolExecutor(max_workers=max_workers or len(sequence)) as executor:
-        requests = {executor.submit(function, item): item for item in sequence}
-        return [response.result() for response in as_completed(requests)]
+    return exec_async(function, sequence, max_workers=max_workers)
+
+
+def exec_async(action: Callable[[S], T], sequence: List[S], max_workers: int = None) -> List[T]:
+    """Return a list of result for action execution on each element of the sequence.
+
+    The actions run concurrently (at most `max_workers` at a time, MAX_WORKERS by default)
+    and the results are returned in the sequence order.
+    """
+    if _replay.get() is not None:
+        return _exec_replay(action, sequence)
+
+    workers = min(len(sequence), max_workers or MAX_WORKERS)
+    if workers <= 1:
+        return [action(args) for args in sequence]
+
+    # each action runs in a copy of the caller context to preserve its deadline.
+    contexts = [copy_context() for _ in sequence]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda context, args: context.run(action, args), contexts, sequence))
 
 
-def exec_async(action: Callable, sequence: List[S]) -> List[T]:
-    async def async_action(args):
-        return action(args)
+def _exec_replay(action: Callable[[S], T], sequence: List[S]) -> List[T]:
+    """Run the actions in turn while replaying, collecting the requests of all of them."""
+    replay = cast(ReplayTransport, _replay.get())
+    results, pending = [], []
+    for index, args in enumerate(sequence):
+        try:
+            with replay.scope(index):
+                results.append(action(args))
+        except PendingRequests as e:
+            pending += e.requests
+
+    if any(pending):
+        raise PendingRequests(pending)
 
-    async def run_tasks():
-        return await asyncio.gather(*[async_action(args) for args in sequence])
+    return results
 
-    return asyncio.run(run_tasks())
+
+async def exec_io_async(action: Callable[..., T], *args) -> T:
+    """Run a blocking (proxy) action on the event loop without blocking it on network I/O.
+
+    The action is run with a replay transport: the requests it sends are collected, sent concurrently
+    through the asynchronous transport, then the action is replayed with their responses until it completes
+    (within MAX_REPLAY_ROUNDS rounds of requests).
+    """
+    replay, limiter = ReplayTransport(), _limiter.get()
+
+    async def record(slot: Slot, request: dict):
+        if limiter is None:
+            return await replay.record(slot, request, _async_transport)
+
+        async with limiter.acquire_async(request.get("timeout")):
+            await replay.record(slot, request, _async_transport)
+
+    while True:
+        token = _replay.set(replay)
+        replay.rewind()
+        try:
+            return action(*args)
+        except PendingRequests as e:
+            pending = e.requests
+        finally:
+            _replay.reset(token)
+
+        if replay.rounds >= MAX_REPLAY_ROUNDS:
+            raise ShippingSDKError(f"The requests did not complete after {replay.rounds} replay rounds")
+
+        with span("network"):
+            await asyncio.gather(*(record(slot, request) for slot, request in pending))
 
 
 class Location:
@@ -97,20 +260,13 @@ class Location:
 
     @property
     def as_country_name(self) -> str:
-        from purplship.core.units import Country
-        if self.value in Country:
-            return Country[self.value].value
-
-        return self.value
+        from purplship.core.units import COUNTRIES
+        return COUNTRIES.name(self.value) or self.value
 
     @property
     def as_state_name(self) -> str:
-        from purplship.core.units import CountryState
+        from purplship.core.units import state_name
         try:
-            country: Any = CountryState.__members__.get(self.extra['country'])
-            if self.value in getattr(country, 'value', []):
-                return country.value[self.value].value
-
-            return self.value
+            return state_name(self.extra['country'], self.value) or self.value
         except KeyError as e:
             raise Exception('Missing country code. e.g: Location(state_code, country="US").as_state_name') from e
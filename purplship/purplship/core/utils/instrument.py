@@ -0,0 +1,177 @@
+"""Purplship operations instrumentation (per-phase timing spans) definition module."""
+
+import attr
+import bisect
+import logging
+import threading
+from time import perf_counter
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("create", "serialize", "network", "deserialize", "parse")
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+Tags = Tuple[Optional[str], Optional[str], Optional[str]]
+_tags: ContextVar[Tags] = ContextVar("instrumentation_tags", default=(None, None, None))
+_disabled = nullcontext()
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class Span:
+    """The timing of an operation phase
+
+    phase: one of "create" (mapper.create_*), "serialize" (Serializable.serialize),
+        "network" (the proxy HTTP calls), "deserialize" (Deserializable.deserialize) or "parse" (mapper.parse_*)
+    operation: the gateway proxy operation (e.g: get_rates, create_shipment, get_tracking)
+    duration: the phase duration in seconds
+    failed: whether the phase raised an error
+    """
+
+    phase: str
+    carrier_name: Optional[str]
+    carrier_id: Optional[str]
+    operation: Optional[str]
+    duration: float
+    failed: bool = False
+
+
+class Sink:
+    """The spans receiver interface. The base sink is a no-op: spans are not even timed"""
+
+    enabled = False
+
+    def emit(self, span: Span):
+        pass
+
+
+class Callback(Sink):
+    """A sink handing every span to a callback (e.g: a metrics system client)"""
+
+    enabled = True
+
+    def __init__(self, callback: Callable[[Span], None]):
+        self.callback = callback
+
+    def emit(self, span: Span):
+        try:
+            self.callback(span)
+        except Exception as error:
+            logger.exception(error)
+
+
+@attr.s(auto_attribs=True)
+class Timings:
+    """The aggregated durations (in seconds) of a phase"""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = None
+    max: float = None
+    buckets: List[int] = attr.ib(factory=lambda: [0] * (len(BUCKETS) + 1))
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count > 0 else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the `q` quantile (0 to 1) of the durations"""
+        if self.count == 0:
+            return None
+
+        rank, seen = q * self.count, 0
+        for bound, count in zip(BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+
+        return self.max
+
+
+class Histogram(Sink):
+    """An in-memory sink aggregating the spans durations per (carrier_name, carrier_id, operation, phase)"""
+
+    enabled = True
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timings: Dict[Tuple[Optional[str], Optional[str], Optional[str], str], Timings] = {}
+
+    def emit(self, span: Span):
+        key = (span.carrier_name, span.carrier_id, span.operation, span.phase)
+        with self.lock:
+            timings = self.timings.get(key)
+            if timings is None:
+                timings = self.timings[key] = Timings()
+
+            timings.count += 1
+            timings.total += span.duration
+            timings.min = span.duration if timings.min is None else min(timings.min, span.duration)
+            timings.max = span.duration if timings.max is None else max(timings.max, span.duration)
+            timings.buckets[bisect.bisect_left(BUCKETS, span.duration)] += 1
+
+    def summary(self) -> Dict[tuple, dict]:
+        """Return the count, mean, min, max, p50 and p99 durations (in seconds) of every phase recorded"""
+        with self.lock:
+            return {
+                key: dict(
+                    count=timings.count, mean=timings.mean, min=timings.min, max=timings.max,
+                    p50=timings.quantile(0.5), p99=timings.quantile(0.99),
+                )
+                for key, timings in self.timings.items()
+            }
+
+    def reset(self):
+        with self.lock:
+            self.timings.clear()
+
+
+_sink: Sink = Sink()
+
+
+def get_instrumentation() -> Sink:
+    """Return the sink receiving the operations phases spans"""
+    return _sink
+
+
+def set_instrumentation(sink: Optional[Sink]) -> Sink:
+    """Set the sink receiving the operations phases spans (None to disable them) and return the previous one"""
+    global _sink
+    previous, _sink = _sink, sink or Sink()
+    return previous
+
+
+class _Timer:
+    __slots__ = ("phase", "sink", "start")
+
+    def __init__(self, phase: str, sink: Sink):
+        self.phase = phase
+        self.sink = sink
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = perf_counter() - self.start
+        self.sink.emit(Span(self.phase, *_tags.get(), duration, exc_type is not None))
+
+
+def span(phase: str) -> ContextManager:
+    """Time the phase run within the context, tagged with the current operation carrier and name"""
+    sink = _sink
+    if not sink.enabled:
+        return _disabled
+
+    return _Timer(phase, sink)
+
+
+@contextmanager
+def tagged(carrier_name: str, carrier_id: str, operation: str):
+    """Tag the spans emitted within the context with the operation carrier and name"""
+    token = _tags.set((carrier_name, carrier_id, operation))
+    try:
+        yield
+    finally:
+        _tags.reset(token)
@@ -1,4 +1,125 @@
+import re
+import attr
+import json
+import random
 import logging
+import functools
+from typing import Any, Pattern, Tuple
+from lxml import etree
+from purplship.core.utils.dict import DICTPARSE
+from purplship.core.utils.xml import XMLPARSER, XMLBundle
+
+REDACTED = "[REDACTED]"
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class PayloadLogging:
+    """The rendering of the requests and responses payloads logged
+
+    max_length: the maximum number of characters of a rendered payload (the rest is truncated)
+    max_field_length: the maximum length of a base64 encoded content (e.g: labels) before it is elided
+    redacted_fields: the (case insensitive) names of the fields whose values are masked
+    sample_rate: the ratio (0 to 1) of the payloads logged
+    """
+
+    max_length: int = 4096
+    max_field_length: int = 256
+    redacted_fields: Tuple[str, ...] = (
+        "password", "key", "user_key", "api_key", "secret", "token", "user_token", "usertoken",
+        "access_license_number", "accesslicensenumber", "authorization",
+    )
+    sample_rate: float = 1.0
+
+    @property
+    def patterns(self) -> Tuple[Pattern, Pattern, Pattern]:
+        return _patterns(self.redacted_fields, self.max_field_length)
+
+
+_config = PayloadLogging()
+
+
+@functools.lru_cache(maxsize=16)
+def _patterns(fields: Tuple[str, ...], max_field_length: int) -> Tuple[Pattern, Pattern, Pattern]:
+    """Return the XML tags and JSON properties to redact and the base64 contents to elide patterns"""
+    names = "|".join(re.escape(name) for name in fields)
+    return (
+        re.compile(rf"(<(?:[\w-]+:)?(?:{names})(?:\s[^>]*)?>)[^<]*(</)", re.IGNORECASE),
+        re.compile(rf"(\"(?:{names})\"\s*:\s*)\"[^\"]*\"", re.IGNORECASE),
+        re.compile(rf"[A-Za-z0-9+/\r\n]{{{max_field_length},}}={{0,2}}"),
+    )
+
+
+def set_payload_logging(config: PayloadLogging) -> PayloadLogging:
+    """Set the rendering of the payloads logged and return the previous one"""
+    global _config
+    previous, _config = _config, config
+    return previous
+
+
+def _redact(value: Any, fields: frozenset) -> Any:
+    if isinstance(value, dict):
+        return {k: (REDACTED if str(k).lower() in fields else _redact(v, fields)) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact(v, fields) for v in value]
+
+    return value
+
+
+def _text(value: Any, fields: frozenset) -> str:
+    """Return the text of a payload: XML (texts, raw bytes, elements and bundles) as is,
+    the other values as (redacted) JSON"""
+    if isinstance(value, XMLBundle):
+        try:
+            return str(value)
+        except Exception:  # a fragment that is not well formed: rendered as received
+            return "".join(_text(fragment, fields) for fragment in value.fragments)
+    if etree.iselement(value):
+        return XMLPARSER.xml_tostring(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode("utf-8", "replace")
+    if isinstance(value, str):
+        return value
+
+    try:
+        return json.dumps(_redact(json.loads(DICTPARSE.jsonify(value)), fields), indent=4, sort_keys=True)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+class Payload:
+    """A log message argument rendering a payload (redacted and truncated) only when the message is emitted"""
+
+    __slots__ = ("value", "config")
+
+    def __init__(self, value: Any, config: PayloadLogging = None):
+        self.value = value
+        self.config = config or _config
+
+    def __str__(self) -> str:
+        config = self.config
+        tags, properties, encoded = config.patterns
+        text = _text(self.value, frozenset(name.lower() for name in config.redacted_fields))
+
+        # every rendering is redacted, whatever the payload type
+        text = properties.sub(rf'\1"{REDACTED}"', tags.sub(rf"\1{REDACTED}\2", text))
+        text = encoded.sub(lambda match: f"[{len(match.group(0))} encoded characters]", text)
+        if len(text) > config.max_length:
+            text = f"{text[:config.max_length]}... [{len(text) - config.max_length} characters truncated]"
+
+        return text
+
+
+def log_payload(logger: logging.Logger, level: int, message: str, value: Any):
+    """Log a message with a payload (as `%s` argument) only rendered if the level is enabled
+    and the message is sampled."""
+    if not logger.isEnabledFor(level):
+        return
+
+    config = _config
+    if config.sample_rate < 1 and random.random() >= config.sample_rate:
+        return
+
+    logger.log(level, message, Payload(value, config))
 
 
 def init_log(debug: bool = None, level: int = None):
@@ -1,6 +1,8 @@
 import attr
 import logging
 from typing import Any, Callable, Generic, TypeVar
+from purplship.core.utils.log import log_payload
+from purplship.core.utils.instrument import span
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +20,9 @@ class Serializable(Generic[T]):
     _serializer: Callable[[T], Any] = _identity
 
     def serialize(self) -> Any:
-        serialized_value = self._serializer(self.value)
-        logger.info("serialized request::" f"{serialized_value}")
+        with span("serialize"):
+            serialized_value = self._serializer(self.value)
+        log_payload(logger, logging.INFO, "serialized request::%s", serialized_value)
         return serialized_value
 
 
@@ -29,5 +32,6 @@ class Deserializable(Generic[T]):
     _deserializer: Callable[[T], Any] = _identity
 
     def deserialize(self) -> Any:
-        logger.info("deserialized response::" f"{self.value}")
-        return self._deserializer(self.value)
+        log_payload(logger, logging.INFO, "deserialized response::%s", self.value)
+        with span("deserialize"):
+            return self._deserializer(self.value)
@@ -1,6 +1,7 @@
-from typing import List, Union, Any
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union, Any
 from pysoap.envelope import Header, Body, Envelope, Fault
-from purplship.core.utils.xml import GenerateDSAbstract, Element, XMLPARSER
+from purplship.core.utils.xml import GenerateDSAbstract, Element, Fragment, XMLPARSER
 from purplship.core.settings import Settings
 from purplship.core.models import Message
 
@@ -44,49 +45,89 @@ def clean_namespaces(
     header_child_prefix: str = "",
     body_child_prefix: str = "",
 ):
-    return (
-        envelope_str.replace(
-            "<%s%s" % (envelope_prefix, header_child_name),
-            "<%s%s" % (header_child_prefix, header_child_name),
+    """Replace the envelope prefix of the header and body children (opening and closing) tags
+    in a single pass over the envelope prefix occurrences"""
+    if not envelope_prefix:
+        return re.sub(
+            "<(/?)(%s|%s)" % (re.escape(header_child_name), re.escape(body_child_name)),
+            lambda match: "<%s%s%s" % (
+                match.group(1),
+                header_child_prefix if match.group(2) == header_child_name else body_child_prefix,
+                match.group(2),
+            ),
+            envelope_str,
         )
-        .replace(
-            "</%s%s" % (envelope_prefix, header_child_name),
-            "</%s%s" % (header_child_prefix, header_child_name),
-        )
-        .replace(
-            "<%s%s" % (envelope_prefix, body_child_name),
-            "<%s%s" % (body_child_prefix, body_child_name),
-        )
-        .replace(
-            "</%s%s" % (envelope_prefix, body_child_name),
-            "</%s%s" % (body_child_prefix, body_child_name),
+
+    parts = envelope_str.split(envelope_prefix)
+    pieces = [parts[0]]
+    for previous, part in zip(parts, parts[1:]):
+        prefix = envelope_prefix
+        if previous.endswith(("<", "</")):
+            if part.startswith(header_child_name):
+                prefix = header_child_prefix
+            elif part.startswith(body_child_name):
+                prefix = body_child_prefix
+        pieces += (prefix, part)
+
+    return "".join(pieces)
+
+
+Plan = Tuple[Tuple[str, str, str], ...]
+_plans: Dict[Tuple[type, int, str, Optional[str], FrozenSet], Plan] = {}
+
+
+def _prefix_plan(item, prefix: str, special_prefixes: FrozenSet, item_name: Optional[str]) -> Plan:
+    """Return the (member, member prefix attribute, member prefix) of a GenerateDS type instance.
+    The plan only depends on the type members (and the prefixes) so it is computed once per type."""
+    members = item.__dict__
+    key = (type(item), len(members), prefix, item_name, special_prefixes)
+    plan = _plans.get(key)
+    if plan is None:
+        specials = dict(special_prefixes)
+        children_prefix = specials.get(f"{item_name}_children", prefix)
+        plan = _plans[key] = tuple(
+            (name, f"{name}_nsprefix_", specials.get(name, children_prefix))
+            for name in members if name[-1:] != "_"
         )
-    )
 
+    return plan
 
-def apply_namespaceprefix(item, prefix: str, special_prefixes: dict = None, item_name: str = None):
-    if special_prefixes is None:
-        special_prefixes = {}
 
+def _apply_plan(item, prefix: str, special_prefixes: FrozenSet, item_name: Optional[str]):
     if isinstance(item, list):
-        [apply_namespaceprefix(child, prefix, special_prefixes, item_name) for child in item]
+        for child in item:
+            _apply_plan(child, prefix, special_prefixes, item_name)
+    elif isinstance(item, Fragment):
+        item.ns_prefix_ = prefix
+        item.namespacing = (
+            (prefix, special_prefixes, item_name),
+            lambda instance: _apply_plan(instance, prefix, special_prefixes, item_name),
+        )
     elif hasattr(item, "export"):
         item.ns_prefix_ = prefix
-        children_prefix = special_prefixes.get(f'{item_name}_children', prefix)
-        children = [
-            (name, node) for name, node in item.__dict__.items()
-            if name[-1:] != "_" and node is not None
-        ]
-        for name, node in children:
-            special_prefix = special_prefixes.get(name, children_prefix)
-            setattr(item, f"{name}_nsprefix_", special_prefix)
-            apply_namespaceprefix(node, special_prefix, special_prefixes, name)
+        for name, prefix_attribute, special_prefix in _prefix_plan(item, prefix, special_prefixes, item_name):
+            node = getattr(item, name)
+            if node is None:
+                continue
+
+            setattr(item, prefix_attribute, special_prefix)
+            if not isinstance(node, (str, int, float)):
+                _apply_plan(node, special_prefix, special_prefixes, name)
+
+
+def apply_namespaceprefix(item, prefix: str, special_prefixes: dict = None, item_name: str = None):
+    """Set the namespace prefix of a GenerateDS instance and (recursively) its members.
+
+    `special_prefixes` overrides the prefix of the members of a given name (e.g: dict(Request="common"))
+    or of the children of a given member (e.g: dict(shipment_children="xsd1")).
+    """
+    _apply_plan(item, prefix, frozenset((special_prefixes or {}).items()), item_name)
 
 
 def extract_fault(response: Element, settings: Settings) -> List[Message]:
     faults = [
         XMLPARSER.build(Fault, node)
-        for node in response.xpath(".//*[local-name() = $name]", name="Fault")
+        for node in XMLPARSER.find("Fault", response)
     ]
     return [
         Message(
@@ -0,0 +1,540 @@
+"""Purplship HTTP transports definition module.
+
+A transport is the component sending the raw HTTP requests built by the carrier proxies.
+"""
+
+import io
+import ssl
+import sys
+import socket
+import select
+import selectors
+import asyncio
+import weakref
+import functools
+import threading
+import http.client
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.parser import BytesParser
+from collections import OrderedDict
+from urllib.parse import urlsplit, urljoin, SplitResult
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen, getproxies
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+
+DEFAULT_USER_AGENT = "Python-urllib/%s.%s" % sys.version_info[:2]
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+DEFAULT_TIMEOUT = 60.0
+# the requests safely retried (on a new connection) when a reused keep-alive connection fails
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+Origin = Tuple[str, str, int]
+Response = Tuple[int, str, http.client.HTTPMessage, bytes]
+
+
+def _origin(parts: SplitResult) -> Origin:
+    return parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80)
+
+
+def _path(parts: SplitResult) -> str:
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+def _is_pooled(parts: SplitResult) -> bool:
+    return parts.scheme in ("http", "https") and parts.scheme not in getproxies()
+
+
+def _headers(host: str, data: Optional[bytes], headers: Optional[dict]) -> dict:
+    """Return the request headers completed with the defaults urllib would have sent"""
+    normalized = {key.capitalize(): value for key, value in (headers or {}).items()}
+    normalized.setdefault("Host", host)
+    normalized.setdefault("User-agent", DEFAULT_USER_AGENT)
+    normalized.setdefault("Accept-encoding", "identity")
+    if data is not None:
+        normalized.setdefault("Content-type", "application/x-www-form-urlencoded")
+    return normalized
+
+
+def _dropped(sock: socket.socket) -> bool:
+    """Return whether an idle connection socket was closed by the server (an idle socket is only readable at EOF)
+    polled without the select() file descriptors limit (FD_SETSIZE) busy processes exceed"""
+    if sock is None or sock.fileno() < 0:
+        return True
+
+    try:
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return any(poller.poll(0))
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            return any(selector.select(0))
+    except OSError:
+        return True
+
+
+def _redirect(url: str, response: Response, method: str, data: Optional[bytes]):
+    """Return the (url, method, data) of the request to follow or None if the response is final
+
+    Raises:
+        HTTPError: Is raised when the response status is an error code
+    """
+    status, reason, headers, body = response
+    if status in REDIRECT_CODES and "location" in headers:
+        if status == 303 or (status in (301, 302) and method not in ("GET", "HEAD")):
+            return urljoin(url, headers["location"]), "GET", None
+        return urljoin(url, headers["location"]), method, data
+
+    if status >= 400:
+        raise HTTPError(url, status, reason, cast(Any, headers), io.BytesIO(body))
+
+    return None
+
+
+class Transport:
+    """HTTP transport (Interface)"""
+
+    def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None) -> bytes:
+        """Send an HTTP request and return the response body
+
+        Args:
+            url (str): the request url
+            data (bytes): the request body
+            headers (dict): the request headers
+            method (str): the request method (defaults to POST when data is provided else GET)
+            timeout (float): the socket operations timeout in seconds
+
+        Returns:
+            bytes: the response body
+
+        Raises:
+            HTTPError: Is raised when the server responds with an error status code
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resource held by the transport"""
+        pass
+
+
+class UrllibTransport(Transport):
+    """A transport opening a new connection for every request (urllib.request.urlopen)"""
+
+    def __init__(self, ssl_context: ssl.SSLContext = None):
+        self.ssl_context = ssl_context
+
+    def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None) -> bytes:
+        req = Request(url=url, data=data, headers=headers or {}, method=method)
+        with urlopen(req, timeout=timeout or DEFAULT_TIMEOUT, context=self.ssl_context) as f:
+            return f.read()
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """An HTTPS connection resuming the last TLS session negotiated with its origin"""
+
+    def __init__(self, *args, sessions: Dict[Origin, ssl.SSLSession] = None, origin: Origin = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sessions = sessions if sessions is not None else {}
+        self.origin = origin
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=server_hostname, session=self.sessions.get(self.origin)
+        )
+
+    def save_session(self):
+        session = getattr(self.sock, "session", None)
+        if session is not None:
+            self.sessions[self.origin] = session
+
+
+class ConnectionPool:
+    """A pool of idle keep-alive connections to a single origin (scheme, host, port)"""
+
+    def __init__(self, origin: Origin, maxsize: int, ssl_context: ssl.SSLContext, sessions: dict, stats: dict):
+        self.origin = origin
+        self.maxsize = maxsize
+        self.ssl_context = ssl_context
+        self.sessions = sessions
+        self.stats = stats
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def get(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection (still open) or a new one and whether it is being reused"""
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+            while connection is not None and _dropped(connection.sock):
+                connection.close()
+                connection = self._idle.pop() if self._idle else None
+            self.stats["reused"] += int(connection is not None)
+
+        if connection is None:
+            return self.connect(timeout), False
+
+        connection.timeout = timeout
+        connection.sock.settimeout(timeout)
+        return connection, True
+
+    def connect(self, timeout: float) -> http.client.HTTPConnection:
+        """Return a new (not yet connected) connection to the pool origin"""
+        with self._lock:
+            self.stats["connections"] += 1
+
+        scheme, host, port = self.origin
+        if scheme == "https":
+            return _HTTPSConnection(
+                host, port, timeout=timeout, context=self.ssl_context, sessions=self.sessions, origin=self.origin
+            )
+
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def put(self, connection: http.client.HTTPConnection):
+        """Return a connection to the pool or close it if the pool is full"""
+        if isinstance(connection, _HTTPSConnection):
+            connection.save_session()
+
+        with self._lock:
+            if connection.sock is not None and len(self._idle) < self.maxsize:
+                self._idle.append(connection)
+                return
+
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class PooledTransport(Transport):
+    """A transport keeping per origin pools of keep-alive connections and reusing TLS sessions
+
+    Args:
+        pool_size (int): the maximum number of idle connections kept per origin
+        max_pools (int): the maximum number of origins pooled (least recently used pools are closed first)
+        ssl_context (ssl.SSLContext): the TLS context shared by all the https connections
+    """
+
+    def __init__(self, pool_size: int = 10, max_pools: int = 20, ssl_context: ssl.SSLContext = None):
+        self.pool_size = pool_size
+        self.max_pools = max_pools
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.stats = dict(connections=0, reused=0)
+        self._sessions: Dict[Origin, ssl.SSLSession] = {}
+        self._pools: "OrderedDict[Origin, ConnectionPool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fallback = UrllibTransport(self.ssl_context)
+
+    def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None) -> bytes:
+        method = method or ("POST" if data is not None else "GET")
+        for _ in range(MAX_REDIRECTS):
+            parts = urlsplit(url)
+            if not _is_pooled(parts):
+                return self._fallback.send(url, data=data, headers=headers, method=method, timeout=timeout)
+
+            response = self._request(
+                self._pool(_origin(parts)), method, _path(parts), data, _headers(parts.netloc, data, headers),
+                timeout or DEFAULT_TIMEOUT,
+            )
+            redirection = _redirect(url, response, method, data)
+            if redirection is None:
+                return response[3]
+
+            url, method, data = redirection
+
+        raise HTTPError(url, response[0], "Too many redirects", cast(Any, response[2]), io.BytesIO(response[3]))
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), OrderedDict()
+        for pool in pools:
+            pool.close()
+
+    def _pool(self, origin: Origin) -> ConnectionPool:
+        with self._lock:
+            pool = self._pools.get(origin)
+            if pool is None:
+                pool = self._pools[origin] = ConnectionPool(
+                    origin, self.pool_size, self.ssl_context, self._sessions, self.stats
+                )
+            self._pools.move_to_end(origin)
+            evicted = [
+                self._pools.popitem(last=False)[1]
+                for _ in range(len(self._pools) - self.max_pools)
+            ]
+
+        for stale_pool in evicted:
+            stale_pool.close()
+
+        return pool
+
+    @staticmethod
+    def _request(pool: ConnectionPool, method: str, path: str, data, headers: dict, timeout: float) -> Response:
+        if isinstance(data, (bytearray, memoryview)):
+            # http.client only sends headers and body in a single packet for bytes bodies.
+            data = bytes(data)
+
+        connection, reused = pool.get(timeout)
+        try:
+            connection.request(method, path, body=data, headers=headers)
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError):
+            connection.close()
+            if not reused or method not in IDEMPOTENT_METHODS:
+                raise
+
+            # the server closed the keep-alive connection, retry the idempotent request once on a new one.
+            connection = pool.connect(timeout)
+            connection.request(method, path, body=data, headers=headers)
+            response = connection.getresponse()
+        except Exception:
+            connection.close()
+            raise
+
+        try:
+            body = response.read()
+        except Exception:
+            connection.close()
+            raise
+
+        if cast(Any, response).will_close:
+            connection.close()
+        else:
+            pool.put(connection)
+
+        return response.status, response.reason, response.headers, body
+
+
+class AsyncTransport:
+    """Asynchronous HTTP transport (Interface)"""
+
+    async def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None) -> bytes:
+        """Send an HTTP request without blocking the event loop and return the response body
+
+        Raises:
+            HTTPError: Is raised when the server responds with an error status code
+            socket.timeout: Is raised when the server does not respond within the timeout
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """Release any resource held by the transport"""
+        pass
+
+
+Stream = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncPooledTransport(AsyncTransport):
+    """An asyncio transport keeping per event loop and per origin pools of keep-alive connections
+
+    Args:
+        pool_size (int): the maximum number of idle connections kept per origin
+        ssl_context (ssl.SSLContext): the TLS context shared by all the https connections
+    """
+
+    def __init__(self, pool_size: int = 10, ssl_context: ssl.SSLContext = None):
+        self.pool_size = pool_size
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.stats = dict(connections=0, reused=0)
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Origin, List[Stream]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._fallback = UrllibTransport(self.ssl_context)
+
+    async def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None) -> bytes:
+        method = method or ("POST" if data is not None else "GET")
+        for _ in range(MAX_REDIRECTS):
+            parts = urlsplit(url)
+            if not _is_pooled(parts):
+                return await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                    self._fallback.send, url, data=data, headers=headers, method=method, timeout=timeout
+                ))
+
+            try:
+                response = await asyncio.wait_for(
+                    self._request(_origin(parts), method, _path(parts), data, _headers(parts.netloc, data, headers)),
+                    timeout or DEFAULT_TIMEOUT,
+                )
+            except asyncio.TimeoutError as e:
+                raise cast(Any, socket.timeout)("timed out") from e
+            redirection = _redirect(url, response, method, data)
+            if redirection is None:
+                return response[3]
+
+            url, method, data = redirection
+
+        raise HTTPError(url, response[0], "Too many redirects", cast(Any, response[2]), io.BytesIO(response[3]))
+
+    async def close(self):
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        for _, writer in sum(pools.values(), []):
+            writer.close()
+
+    def _idle(self, origin: Origin) -> List[Stream]:
+        return self._pools.setdefault(asyncio.get_running_loop(), {}).setdefault(origin, [])
+
+    async def _connect(self, origin: Origin) -> Stream:
+        scheme, host, port = origin
+        self.stats["connections"] += 1
+        if scheme == "https":
+            return await asyncio.open_connection(host, port, ssl=self.ssl_context, server_hostname=host)
+
+        return await asyncio.open_connection(host, port)
+
+    async def _request(self, origin: Origin, method: str, path: str, data, headers: dict) -> Response:
+        idle = self._idle(origin)
+        message = _encode_request(method, path, data, headers)
+        while any(idle) and idle[-1][0].at_eof():
+            idle.pop()[1].close()
+        reused = len(idle) > 0
+        reader, writer = idle.pop() if reused else await self._connect(origin)
+        self.stats["reused"] += int(reused)
+        try:
+            writer.write(message)
+            await writer.drain()
+            response, keep_alive = await _read_response(reader, method)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            if not reused or method not in IDEMPOTENT_METHODS:
+                raise
+
+            # the server closed the keep-alive connection, retry the idempotent request once on a new one.
+            reader, writer = await self._connect(origin)
+            writer.write(message)
+            await writer.drain()
+            response, keep_alive = await _read_response(reader, method)
+        except BaseException:
+            writer.close()
+            raise
+
+        if keep_alive and len(idle) < self.pool_size:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+        return response
+
+
+def _encode_request(method: str, path: str, data: Optional[bytes], headers: dict) -> bytes:
+    lines = [f"{method} {path} HTTP/1.1"] + [f"{key}: {value}" for key, value in headers.items()]
+    if data is not None:
+        lines.append(f"Content-Length: {len(data)}")
+
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + bytes(data or b"")
+
+
+async def _read_response(reader: asyncio.StreamReader, method: str) -> Tuple[Response, bool]:
+    """Read an HTTP/1.x response and return it with whether the connection can be kept alive"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Remote end closed connection without response")
+
+    version, status, reason = (status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+    raw_headers = b""
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        raw_headers += line
+
+    headers = cast(http.client.HTTPMessage, BytesParser(_class=http.client.HTTPMessage).parsebytes(raw_headers))
+    connection = (headers.get("connection") or "").lower()
+    keep_alive: bool = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    code = int(status)
+
+    if method == "HEAD" or code in (204, 304) or 100 <= code < 200:
+        body = b""
+    elif (headers.get("transfer-encoding") or "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        body = b"".join(chunks)
+    elif headers.get("content-length") is not None:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body, keep_alive = await reader.read(), False
+
+    return (code, reason, headers, body), keep_alive
+
+
+RequestArgs = dict
+# a replayed request slot: the (nested) index of the action sending it and its call order within the action
+Slot = Tuple[Tuple[int, ...], int]
+_scope: ContextVar[Tuple[int, ...]] = ContextVar("replay_scope", default=())
+
+
+class PendingRequests(Exception):
+    """Raised by a ReplayTransport for the requests that have not been sent yet."""
+
+    def __init__(self, requests: List[Tuple[Slot, RequestArgs]]):
+        super().__init__(f"{len(requests)} pending request(s)")
+        self.requests = requests
+
+
+class ReplayTransport(Transport):
+    """A transport answering with previously recorded responses.
+
+    A request sent for the first time is not performed but reported as a PendingRequests error,
+    allowing blocking proxy code to be replayed once its requests have been sent asynchronously.
+    The requests are matched by call order, not by content (which may hold nonces or timestamps):
+    the n-th request an action sends in a replay round gets the response recorded for its n-th request.
+    """
+
+    def __init__(self):
+        self.responses: Dict[Slot, Union[bytes, Exception, Response]] = {}
+        self.rounds = 0
+        self._calls: Dict[Tuple[int, ...], int] = {}
+
+    def rewind(self):
+        """Start a new replay round: the actions requests are matched from their first one again"""
+        self.rounds += 1
+        self._calls = {}
+
+    @contextmanager
+    def scope(self, index: int):
+        """Match the requests sent within the context as the ones of the `index`-th (concurrent) action"""
+        token = _scope.set(_scope.get() + (index,))
+        try:
+            yield
+        finally:
+            _scope.reset(token)
+
+    def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None) -> bytes:
+        scope = _scope.get()
+        order = self._calls.get(scope, 0)
+        self._calls[scope] = order + 1
+        slot = (scope, order)
+        if slot not in self.responses:
+            raise PendingRequests([(slot, dict(url=url, data=data, headers=headers, method=method, timeout=timeout))])
+
+        result = self.responses[slot]
+        if isinstance(result, tuple):
+            status, reason, response_headers, body = result
+            raise HTTPError(url, status, reason, cast(Any, response_headers), io.BytesIO(body))
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    async def record(self, slot: Slot, request: RequestArgs, transport: AsyncTransport):
+        """Send a pending request through the asynchronous transport and record its outcome"""
+        try:
+            self.responses[slot] = await transport.send(**request)
+        except HTTPError as e:
+            self.responses[slot] = (e.code, cast(Any, e).msg, cast(Any, e).hdrs, e.read())
+        except Exception as e:
+            self.responses[slot] = e
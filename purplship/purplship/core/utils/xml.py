@@ -1,9 +1,14 @@
 """Purplship lxml typing and utilities wrappers"""
 
 import io
+import re
+import keyword
+import functools
+import threading
+from collections import OrderedDict
 from lxml import etree
 from xmltodict import parse
-from typing import List, TypeVar, Type, Optional, cast, Union
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, List, Tuple, TypeVar, Type, Optional, cast, Union
 from pysoap.envelope import Envelope
 from lxml.etree import _Element
 
@@ -18,6 +23,189 @@ class GenerateDSAbstract(Envelope):
     pass
 
 
+G = TypeVar("G", bound=GenerateDSAbstract)
+
+
+class _BufferReader:
+    """A file like reader feeding lxml a buffer (bytearray, memoryview) by chunks instead of a copy of it"""
+
+    def __init__(self, buffer: Union[bytearray, memoryview]):
+        self.buffer = memoryview(buffer)
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self.buffer) if size is None or size < 0 else self.position + size
+        chunk = self.buffer[self.position:end].tobytes()
+        self.position += len(chunk)
+        return chunk
+
+
+def _descendants(tag: str, in_element: Union[Element, etree._ElementTree]) -> Iterator[Element]:
+    """Return the `.//*[local-name() = $tag]` nodes (or `{namespace}tag` ones) in document order
+    using lxml tag filtered iteration instead of an XPath scan"""
+    name = tag if tag.startswith("{") else f"{{*}}{tag}"
+    if isinstance(in_element, etree._ElementTree):
+        return cast(Iterator[Element], in_element.getroot().iter(name))
+
+    return cast(Any, in_element).iterdescendants(name)
+
+
+class Fragment(Generic[G]):
+    """A static part of a request tree (e.g: the account credentials) standing in for its GenerateDS instance.
+
+    The instance is only built and exported the first time a fragment of the same key is exported
+    at a given position (level, prefixes, tag name). The following exports write the cached rendering.
+    The key must identify all the values the instance is built from.
+    The `maxsize` most recently exported renderings are kept.
+    """
+
+    maxsize = 1024
+    _renderings: 'OrderedDict[Hashable, str]' = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, key: Hashable, build: Callable[[], G]):
+        self.key = key
+        self.build = build
+        self.ns_prefix_: Optional[str] = None
+        self.original_tagname_: Optional[str] = None
+        self.namespacing: Optional[Tuple[Hashable, Callable[[G], None]]] = None
+
+    def export(self, outfile, level, namespaceprefix_="", namespacedef_="", name_=None, pretty_print=True):
+        namespacing_key, apply_namespacing = self.namespacing or (None, None)
+        key = (
+            self.key, level, namespaceprefix_, namespacedef_, name_, pretty_print,
+            self.ns_prefix_, self.original_tagname_, namespacing_key,
+        )
+        with self._lock:
+            rendering = self._renderings.get(key)
+            if rendering is not None:
+                self._renderings.move_to_end(key)
+
+        if rendering is None:
+            instance = self.build()
+            if apply_namespacing is not None:
+                apply_namespacing(instance)
+            instance.ns_prefix_ = self.ns_prefix_ or instance.ns_prefix_
+            instance.original_tagname_ = self.original_tagname_ or instance.original_tagname_
+
+            output = io.StringIO()
+            kwargs = dict(name_=name_) if name_ is not None else {}
+            instance.export(output, level, namespaceprefix_, namespacedef_, pretty_print=pretty_print, **kwargs)
+            rendering = output.getvalue()
+            with self._lock:
+                self._renderings[key] = rendering
+                while len(self._renderings) > self.maxsize:
+                    self._renderings.popitem(last=False)
+
+        outfile.write(rendering)
+
+
+class XMLBundle:
+    """A lazy bundle of XML fragments (texts, raw bytes or parsed elements appended as is).
+    => <wrapper>{all the XML trees}</wrapper>
+
+    Each fragment is parsed once, when the bundle is first turned into an element by XMLPARSER.to_xml.
+    Returned by XMLPARSER.bundle (XMLPARSER.bundle_xml renders it as a text).
+    """
+
+    def __init__(self, fragments: List[Union[str, bytes, Element]]):
+        self.fragments = fragments
+        self._element: Optional[Element] = None
+
+    @property
+    def element(self) -> Element:
+        if self._element is None:
+            wrapper = etree.Element("wrapper")
+            for fragment in self.fragments:
+                wrapper.append(XMLPARSER.to_xml(fragment) if isinstance(fragment, (str, bytes)) else fragment)
+            self._element = cast(Element, wrapper)
+
+        return self._element
+
+    def __len__(self) -> int:
+        return len(self.fragments)
+
+    def __str__(self) -> str:
+        return XMLPARSER.xml_tostring(self.element)
+
+
+_member_types: Dict[Tuple[type, str], Optional[type]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _attribute_name(tag: str) -> str:
+    """Return the GenerateDS member name of a (local) tag name"""
+    name = re.sub(r"\W", "_", tag)
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+class TypedView(Generic[G]):
+    """A read-only lazy view of a GenerateDS type over an (lxml) element.
+
+    The members are resolved on first access by the type own `buildChildren` from the matching child nodes
+    (same names, values and conversions as XMLPARSER.build), complex children being views themselves.
+    """
+
+    def __init__(self, element_type: Type[G], element: Element):
+        self._element_type = element_type
+        self._element = element
+        self._instance = element_type()
+        self._instance.buildAttributes(element, dict(element.attrib.items()), set())
+        self._children: Optional[Dict[str, List[Tuple[str, Element]]]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name.startswith("get_") and callable(getattr(self._instance, name, None)):
+            return lambda: getattr(self, name[4:])
+
+        value = self._resolve(name)
+        self.__dict__[name] = value  # resolved once, then read as a plain attribute
+        return value
+
+    def _resolve(self, name: str) -> Any:
+        if self._children is None:
+            self._children = {}
+            for child in cast(Any, self._element).iterchildren(etree.Element):
+                tag = child.tag
+                local_name = tag[tag.rfind("}") + 1:]
+                self._children.setdefault(_attribute_name(local_name), []).append((local_name, child))
+
+        instance = self._instance
+        for local_name, child in self._children.get(name, []):
+            if len(child) == 0:
+                instance.buildChildren(child, self._element, local_name)
+                continue
+
+            member_type = self._member_type(local_name, child)
+            view = child if member_type is None else TypedView(member_type, child)
+            value = getattr(instance, name, None)
+            if isinstance(value, list):
+                value.append(view)
+            else:
+                setattr(instance, name, view)
+
+        return getattr(instance, name)
+
+    def _member_type(self, local_name: str, child: Element) -> Optional[Type]:
+        """Return (and cache) the GenerateDS type a complex child is built into (None for untyped nodes)
+        by letting the type `buildChildren` build a childless copy of it once."""
+        key = (self._element_type, local_name)
+        if key not in _member_types:
+            instance = self._element_type()
+            stub = etree.Element(child.tag, cast(Dict[str, str], dict(child.attrib.items())))
+            instance.buildChildren(stub, self._element, local_name)
+            value = getattr(instance, _attribute_name(local_name), None)
+            built = value[-1] if isinstance(value, list) and len(value) > 0 else value
+            _member_types[key] = type(built) if hasattr(built, "buildChildren") else None
+
+        return _member_types[key]
+
+    def build(self) -> G:
+        """Return the GenerateDS instance fully built"""
+        return cast(G, XMLPARSER.build(self._element_type, self._element))
+
+
 class XMLPARSER:
     @staticmethod
     def build(element_type: Type[T], xml_node: Element = None) -> Optional[T]:
@@ -35,16 +223,55 @@ class XMLPARSER:
         return instance
 
     @staticmethod
-    def find(tag: str, in_element: Element, element_type: Type[Union[T, Element]] = None, first: bool = None):
-        children = [
-            (child if element_type is None else XMLPARSER.build(element_type, child))
-            for child in in_element.xpath(".//*[local-name() = $name]", name=tag)
-        ]
+    def view(element_type: Type[G], xml_node: Element = None) -> Optional[G]:
+        """Wrap xml element node into a lazy view of the type class.
+        => The members are only built when read. Prefer it to XMLPARSER.build for large nodes
+        of which only a few members are read.
+
+        :param element_type: The xml node corresponding type (class)
+        :param xml_node: the xml node source
+        :return: None if the node is None else a (read-only) TypedView of the GenerateDS XML Element class
+        """
+        if xml_node is None:
+            return None
+
+        return cast(G, TypedView(element_type, xml_node))
+
+    @staticmethod
+    def find(
+        tag: str,
+        in_element: Element,
+        element_type: Type[Union[T, Element]] = None,
+        first: bool = None,
+        lazy: bool = None,
+    ):
+        """Return the descendant nodes with the `tag` local name (or `{namespace}tag` qualified name)
+
+        :param tag: the node local name or qualified name
+        :param in_element: the element to search in
+        :param element_type: the GenerateDS type to build the nodes into (optional)
+        :param first: return the first node only (or None)
+        :param lazy: return lazy views of the type instead of built instances (see XMLPARSER.view)
+        :return: the list of (built) nodes or the first one
+        """
+        children = _descendants(tag, in_element)
+        build = XMLPARSER.view if lazy is True else XMLPARSER.build
 
         if first is True:
-            return next((c for c in children), None)
+            child = next(children, None)
+            return child if element_type is None else build(element_type, child)
+
+        return [(child if element_type is None else build(element_type, child)) for child in children]
+
+    @staticmethod
+    def fragment(key: Hashable, build: Callable[[], G]) -> G:
+        """Stand in for a static part of a request tree exported once per key (see Fragment)
 
-        return children
+        :param key: the (hashable) values identifying the built instance
+        :param build: the GenerateDS instance constructor
+        :return: a Fragment exported as the built instance
+        """
+        return cast(G, Fragment(key, build))
 
     @staticmethod
     def export(typed_xml_element: Type[GenerateDSAbstract], **kwds) -> str:
@@ -60,15 +287,24 @@ class XMLPARSER:
         return output.getvalue()
 
     @staticmethod
-    def bundle_xml(xml_strings: List[str]) -> str:
+    def bundle(fragments: List[Union[str, bytes, Element]]) -> XMLBundle:
+        """Bundle a list of XML fragments lazily.
+        => <wrapper>{all the XML trees}</wrapper> built on XMLPARSER.to_xml
+
+        :param fragments: the XML texts, raw bytes or parsed elements
+        :return: a bundle of the non empty fragments parsed (once) by XMLPARSER.to_xml
+        """
+        return XMLBundle([x for x in fragments if x is not None and (etree.iselement(x) or len(x) > 0)])
+
+    @staticmethod
+    def bundle_xml(xml_strings: List[Union[str, bytes, Element]]) -> str:
         """Bundle a list of XML string into a single one.
         => <wrapper>{all the XML trees concatenated}</wrapper>
 
-        :param xml_strings:
+        :param xml_strings: the XML texts, raw bytes or parsed elements
         :return: a bundled XML text containing all the micro XML string
         """
-        bundle = "".join([XMLPARSER.xml_tostring(XMLPARSER.to_xml(x)) for x in xml_strings if x is not None and x != ""])
-        return f"<wrapper>{bundle}</wrapper>"
+        return str(XMLPARSER.bundle(xml_strings))
 
     @staticmethod
     def jsonify_xml(xml_str: str) -> dict:
@@ -80,13 +316,22 @@ class XMLPARSER:
         return parse(xml_str)
 
     @staticmethod
-    def to_xml(xml_str: str) -> Element:
+    def to_xml(xml_str: Union[str, bytes, bytearray, memoryview, XMLBundle]) -> Element:
         """Turn a XML text into an (lxml) XML Element.
 
-        :param xml_str:
+        :param xml_str: the XML text or the raw (utf-8 or declared encoding) bytes, parsed without copy
+            or a bundle of XML fragments
         :return: Node Element
         """
-        element = etree.fromstring(bytes(bytearray(xml_str, encoding="utf-8")))
+        if isinstance(xml_str, XMLBundle):
+            return xml_str.element
+        if isinstance(xml_str, bytes):
+            element = etree.fromstring(xml_str)
+        elif isinstance(xml_str, (bytearray, memoryview)):
+            element = etree.parse(_BufferReader(xml_str)).getroot()
+        else:
+            element = etree.fromstring(xml_str.encode("utf-8"))
+
         return cast(Element, element)
 
     @staticmethod
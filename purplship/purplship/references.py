@@ -63,11 +63,11 @@ def collect_references() -> dict:
     }
 
     REFERENCES = {
-        "countries": {c.name: c.value for c in list(units.Country)},
-        "currencies": {c.name: c.value for c in list(units.Currency)},
+        "countries": dict(units.COUNTRIES.names),
+        "currencies": dict(units.CURRENCIES.names),
         "weight_units": {c.name: c.value for c in list(units.WeightUnit)},
         "dimension_units": {c.name: c.value for c in list(units.DimensionUnit)},
-        "states": {c.name: {s.name: s.value for s in list(c.value)} for c in list(units.CountryState)},
+        "states": {country: dict(states.names) for country, states in units.COUNTRY_STATES.items()},
         "payment_types": {c.name: c.value for c in list(units.PaymentType)},
         "customs_content_type": {c.name: c.value for c in list(units.CustomsContentType)},
         "incoterms": {c.name: c.value for c in list(units.Incoterm)},
@@ -0,0 +1,14 @@
+from tests.core.transport import *
+from tests.core.helpers import *
+from tests.core.interface import *
+from tests.core.limiter import *
+from tests.core.cache import *
+from tests.core.flight import *
+from tests.core.xml import *
+from tests.core.soap import *
+from tests.core.log import *
+from tests.core.dict import *
+from tests.core.instrument import *
+from tests.core.units import *
+from tests.core.arrays import *
+from tests.core.constraints import *
@@ -0,0 +1,91 @@
+import random
+import unittest
+from purplship.core.models import Parcel
+from purplship.core.errors import FieldError
+from purplship.core.units import DimensionUnit, Packages, Weight, WeightUnit
+from purplship.core.arrays import numpy
+
+
+def manifest(count: int, seed: int = 7):
+    generator = random.Random(seed)
+    return [
+        Parcel(
+            weight=generator.choice([None, round(generator.uniform(0.1, 200), 1)]),
+            weight_unit=generator.choice(["KG", "LB"]),
+            width=generator.choice([None, round(generator.uniform(1, 120), 1)]),
+            height=round(generator.uniform(1, 120), 1),
+            length=generator.choice([None, round(generator.uniform(1, 120), 1)]),
+            dimension_unit=generator.choice(["CM", "IN"]),
+        )
+        for _ in range(count)
+    ]
+
+
+def errors(parcels, vectorized: bool):
+    try:
+        Packages(
+            parcels, required=["weight", "width", "length", "packaging_type"],
+            max_weight=Weight(150, WeightUnit.LB), vectorized=vectorized,
+        )
+    except FieldError as error:
+        return list(error.details.items())
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestPackageArrays(unittest.TestCase):
+    def test_validation_masks_match_the_per_package_validation(self):
+        parcels = manifest(300)
+
+        self.assertListEqual(errors(parcels, vectorized=True), errors(parcels, vectorized=False))
+
+    def test_aggregates_match_the_per_package_helpers(self):
+        parcels = [parcel for parcel in manifest(300) if parcel.weight and parcel.width and parcel.length]
+        packages = Packages(parcels)
+        arrays = Packages(parcels, vectorized=True).arrays
+
+        self.assertAlmostEqual(Packages(parcels, vectorized=True).weight.value, packages.weight.value, places=6)
+        self.assertListEqual(arrays.volumes.tolist(), [pkg.volume.value for pkg in packages])
+        self.assertListEqual(arrays.girths().tolist(), [pkg.girth.value for pkg in packages])
+        sides = [sorted([pkg.width.IN, pkg.height.IN, pkg.length.IN]) for pkg in packages]
+        self.assertListEqual(
+            arrays.length_plus_girths(DimensionUnit.IN).tolist(),
+            [round(longest + round((side1 + side2) * 2, 2), 2) for side1, side2, longest in sides],
+        )
+
+    def test_conversions_are_rounded_as_the_per_package_helpers(self):
+        generator = random.Random(11)
+        parcels = [
+            Parcel(weight=26.555, weight_unit="KG", width=10.125, height=1.005, length=2.675, dimension_unit="CM"),
+            *[
+                Parcel(
+                    weight=round(generator.uniform(0.1, 200), 3),
+                    weight_unit=generator.choice(["KG", "LB"]),
+                    width=round(generator.uniform(1, 120), 3),
+                    height=round(generator.uniform(1, 120), 3),
+                    length=round(generator.uniform(1, 120), 3),
+                    dimension_unit=generator.choice(["CM", "IN"]),
+                )
+                for _ in range(500)
+            ],
+        ]
+        packages = Packages(parcels)
+        arrays = Packages(parcels, vectorized=True).arrays
+
+        self.assertEqual(arrays.weights[0], 26.55)
+        self.assertListEqual(arrays.weights.tolist(), [pkg.weight[arrays.weight_unit.name] for pkg in packages])
+        self.assertListEqual(arrays.weights_lb.tolist(), [pkg.weight.LB for pkg in packages])
+        self.assertListEqual(arrays.cm.tolist(), [[pkg.width.CM, pkg.height.CM, pkg.length.CM] for pkg in packages])
+        self.assertListEqual(arrays.inches.tolist(), [[pkg.width.IN, pkg.height.IN, pkg.length.IN] for pkg in packages])
+
+    def test_dimensional_weights(self):
+        arrays = Packages([
+            Parcel(weight=10, weight_unit="LB", width=10, height=10, length=13.9, dimension_unit="IN"),
+            Parcel(weight=1, weight_unit="LB", width=20, height=10, length=13.9, dimension_unit="IN"),
+        ], vectorized=True).arrays
+
+        self.assertListEqual(arrays.dimensional_weights(139).tolist(), [10.0, 20.0])
+        self.assertListEqual(arrays.billable_weights(139).tolist(), [10.0, 20.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import re
+import attr
+import time
+import tempfile
+import unittest
+from unittest.mock import patch
+from purplship import Rating, Tracking
+from purplship.api.cache import MemoryCache, SQLiteCache, fingerprint, set_rate_cache, set_tracking_cache
+from purplship.core.utils import DP
+from purplship.core.models import RateRequest
+from tests.canadapost.fixture import gateway
+from tests.canadapost.rate import RatePayload, RateResponseXml, ParsedQuoteResponse, QuoteParsingError
+from tests.canadapost.tracking import TrackingResponseXml
+from tests.fedex.fixture import gateway as fedex_gateway
+
+
+def track(url: str, **_) -> str:
+    pin = re.search(r"/pin/(\w+)/", url).group(1)
+    response = TrackingResponseXml.replace("7023210039414604", pin)
+    delivered = pin.startswith("D")
+    return response if delivered else response.replace("<event-identifier>1496</event-identifier>", "")
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_equivalent_requests_share_a_fingerprint(self):
+        equivalent = {
+            **RatePayload,
+            "reference": "cart-42",
+            "shipper": {"country_code": "CA", "postal_code": "h8z2z3 "},
+            "parcels": [{**RatePayload["parcels"][0], "weight": 4, "height": 3.0}],
+        }
+
+        self.assertEqual(
+            fingerprint(RateRequest(**RatePayload), gateway.settings),
+            fingerprint(RateRequest(**equivalent), gateway.settings),
+        )
+
+    def test_different_requests_or_accounts_have_different_fingerprints(self):
+        heavier = {**RatePayload, "parcels": [{**RatePayload["parcels"][0], "weight": 4.5}]}
+        fingerprints = {
+            fingerprint(RateRequest(**RatePayload), gateway.settings),
+            fingerprint(RateRequest(**heavier), gateway.settings),
+            fingerprint(RateRequest(**RatePayload), fedex_gateway.settings),
+            fingerprint(RateRequest(**RatePayload), attr.evolve(gateway.settings, customer_number="2004382")),
+        }
+
+        self.assertEqual(len(fingerprints), 4)
+        self.assertEqual(
+            fingerprint(RateRequest(**RatePayload), attr.evolve(gateway.settings, timeout=5)),
+            fingerprint(RateRequest(**RatePayload), gateway.settings),
+        )
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_entries_expire_after_their_ttl(self):
+        cache = MemoryCache(ttl=0.05)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=10)
+
+        self.assertEqual(cache.get("a"), 1)
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertDictEqual(cache.stats, dict(hits=2, misses=1, size=1))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertListEqual([cache.get(key) for key in "abc"], [1, None, 3])
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "rates.sqlite3")
+
+    def test_entries_are_shared_by_the_workers(self):
+        SQLiteCache(self.path).set("a", [{"total_charge": 13.64}])
+
+        self.assertEqual(SQLiteCache(self.path).get("a"), [{"total_charge": 13.64}])
+
+    def test_entries_expire_and_least_recently_used_are_evicted(self):
+        cache = SQLiteCache(self.path, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=-1)
+        cache.set("c", 3)
+        time.sleep(0.01)
+        cache.get("a")
+        cache.set("d", 4)
+
+        self.assertListEqual([cache.get(key) for key in "abcd"], [1, None, None, 4])
+        self.assertDictEqual(cache.stats, dict(hits=3, misses=2, size=2))
+
+
+class TestRatingCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = MemoryCache()
+        self.previous = set_rate_cache(self.cache)
+
+    def tearDown(self):
+        set_rate_cache(self.previous)
+
+    def test_repeated_rate_requests_are_answered_from_the_cache(self):
+        with patch("purplship.mappers.canadapost.proxy.http", return_value=RateResponseXml) as http_mock:
+            responses = [Rating.fetch(RatePayload).from_(gateway).parse() for _ in range(3)]
+
+        self.assertEqual(http_mock.call_count, 1)
+        self.assertTrue(all(DP.to_dict(r) == DP.to_dict(ParsedQuoteResponse) for r in responses))
+        self.assertDictEqual(self.cache.stats, dict(hits=2, misses=1, size=1))
+
+    def test_error_responses_are_not_cached(self):
+        with patch("purplship.mappers.canadapost.proxy.http", return_value=QuoteParsingError) as http_mock:
+            [Rating.fetch(RatePayload).from_(gateway).parse() for _ in range(2)]
+
+        self.assertEqual(http_mock.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestTrackingCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = MemoryCache(ttl=0.1)
+        self.previous = set_tracking_cache(self.cache)
+
+    def tearDown(self):
+        set_tracking_cache(*self.previous)
+
+    def test_only_the_missing_tracking_numbers_are_fetched(self):
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=track) as http_mock:
+            Tracking.fetch(dict(tracking_numbers=["D1", "T1"])).from_(gateway).parse()
+            details, messages = Tracking.fetch(dict(tracking_numbers=["T2", "D1", "T1"])).from_(gateway).parse()
+
+        self.assertEqual(http_mock.call_count, 3)
+        self.assertListEqual([d.tracking_number for d in details], ["T2", "D1", "T1"])
+        self.assertListEqual(messages, [])
+
+    def test_delivered_items_outlive_the_in_transit_ones(self):
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=track) as http_mock:
+            Tracking.fetch(dict(tracking_numbers=["D1", "T1"])).from_(gateway).parse()
+            time.sleep(0.15)
+            details, _ = Tracking.fetch(dict(tracking_numbers=["D1", "T1"])).from_(gateway).parse()
+
+        self.assertEqual(http_mock.call_count, 3)
+        self.assertEqual(http_mock.call_args[1]["url"].split("/")[-2], "T1")
+        self.assertListEqual([(d.tracking_number, d.delivered) for d in details], [("D1", True), ("T1", False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
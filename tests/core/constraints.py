@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import patch
+from purplship import Rating
+from purplship.core.models import RateRequest, Address, Parcel
+from purplship.core.constraints import Constraints
+from purplship.core.units import Dimension, DimensionUnit, Packages, Weight, WeightUnit
+from purplship.providers.canadapost.units import PackagePresets as CanadaPostPresets
+from tests.canadapost.fixture import gateway as canadapost_gateway
+from tests.canadapost.rate import RatePayload, RateResponseXml
+from tests.ups.fixture import gateway as ups_gateway
+
+CONSTRAINTS = Constraints(
+    max_weight=Weight(30, WeightUnit.KG),
+    max_length=Dimension(200, DimensionUnit.CM),
+    max_length_plus_girth=Dimension(300, DimensionUnit.CM),
+    origin_countries=frozenset(["CA"]),
+)
+
+
+def parcel(weight: float = 4.0, length: float = 10, width: float = 3, height: float = 3) -> dict:
+    return dict(weight=weight, length=length, width=width, height=height, weight_unit="KG", dimension_unit="CM")
+
+
+class TestConstraints(unittest.TestCase):
+    def check(self, *parcels: dict, origin: str = "CA"):
+        error = CONSTRAINTS.check(Address(country_code=origin), Address(country_code="US"), Packages([Parcel(**p) for p in parcels]))
+        return error if error is None else (error.code, getattr(error, "details", None))
+
+    def test_served_shipments(self):
+        self.assertIsNone(self.check(parcel(), parcel(weight=30, length=150, width=35, height=35)))
+
+    def test_unserved_shipments(self):
+        self.assertEqual(self.check(parcel(), origin="US")[0], "SHIPPING_SDK_ORIGIN_NOT_SERVICED_ERROR")
+        self.assertDictEqual(
+            self.check(parcel(), parcel(weight=31, length=210), parcel(length=150, width=40, height=40))[1],
+            {
+                "parcel[1].weight": {"code": "exceeds", "message": "This field exceeds the max value"},
+                "parcel[1].length": {"code": "exceeds", "message": "This field exceeds the max value"},
+                "parcel[2].length_plus_girth": {"code": "exceeds", "message": "This field exceeds the max value"},
+            },
+        )
+
+
+class TestRatingConstraints(unittest.TestCase):
+    def test_unserved_gateways_are_skipped_before_any_request(self):
+        payload = RateRequest(**{**RatePayload, "parcels": [parcel(weight=40)]})
+
+        with patch("purplship.mappers.canadapost.proxy.http") as canadapost, \
+                patch("purplship.mappers.ups.proxy.http") as ups:
+            ups.return_value = "<a></a>"
+            rates, messages = Rating.fetch(payload).from_(canadapost_gateway, ups_gateway).parse()
+
+        canadapost.assert_not_called()
+        ups.assert_called()
+        self.assertEqual(
+            [(m.carrier_name, m.code) for m in messages if m.carrier_name == "canadapost"],
+            [("canadapost", "SHIPPING_SDK_FIELD_ERROR")],
+        )
+
+    def test_gateways_are_checked_when_the_parcels_are_invalid_for_their_presets(self):
+        payload = RateRequest(**{
+            **RatePayload, "shipper": dict(country_code="US"), "parcels": [parcel(weight=40), parcel()]
+        })
+        built = []
+
+        def packages(parcels, presets):
+            built.append(presets)
+            if presets is CanadaPostPresets:
+                raise KeyError("invalid preset")
+            return Packages(parcels, presets)
+
+        with patch("purplship.api.interface.Packages", side_effect=packages), \
+                patch.object(type(canadapost_gateway.mapper), "create_rate_request") as canadapost, \
+                patch("purplship.mappers.ups.proxy.http") as ups:
+            ups.return_value = "<a></a>"
+            _, messages = Rating.fetch(payload).from_(canadapost_gateway, ups_gateway, ups_gateway).parse()
+
+        canadapost.assert_not_called()
+        ups.assert_called()
+        self.assertEqual(len(built), 2)
+        self.assertEqual(
+            [(m.carrier_name, m.code) for m in messages if m.carrier_name == "canadapost"],
+            [("canadapost", "SHIPPING_SDK_ORIGIN_NOT_SERVICED_ERROR")],
+        )
+
+    def test_served_gateways_are_rated(self):
+        with patch("purplship.mappers.canadapost.proxy.http") as canadapost:
+            canadapost.return_value = RateResponseXml
+            rates, messages = Rating.fetch(RateRequest(**RatePayload)).from_(canadapost_gateway).parse()
+
+        canadapost.assert_called()
+        self.assertTrue(any(rates))
+
+
+if __name__ == "__main__":
+    unittest.main()
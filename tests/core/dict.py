@@ -0,0 +1,53 @@
+import json
+import unittest
+from enum import Enum
+from purplship.core.utils import DP
+from purplship.core.models import RateDetails, ChargeDetails, TrackingDetails, TrackingEvent
+from tests.dhl_universal.tracking import TrackingResponseJSON
+from tests.sendle.tracking import ErrorResponseJSON
+
+
+class Status(Enum):
+    delivered = "DELIVERED"
+
+
+def round_trip(entity):
+    """The former DP.to_dict JSON round trip"""
+    return json.loads(
+        DP.jsonify(entity) if not isinstance(entity, str) else entity,
+        object_hook=lambda d: {k: v for k, v in d.items() if v not in (None, [], "")},
+    )
+
+
+class TestToDict(unittest.TestCase):
+    def test_attrs_conversion_matches_the_json_round_trip(self):
+        entities = [
+            RateDetails(
+                carrier_name="fedex", carrier_id="carrier", currency="USD", service="", total_charge=10,
+                extra_charges=[ChargeDetails(name="Fuel", amount=1.5, currency="USD")],
+                meta=dict(rate_zone=None, codes=("A", 1), nested={}, status=Status.delivered, count={2: True}),
+            ),
+            TrackingDetails(
+                carrier_name="ups", carrier_id="ups", tracking_number="1Z",
+                events=[TrackingEvent(date="2020-01-01", description="Delivered", code=None)],
+            ),
+            [dict(b=[None, ""], a=RateDetails), "", 0, False],
+        ]
+
+        for entity in entities:
+            self.assertEqual(json.dumps(DP.to_dict(entity)), json.dumps(round_trip(entity)))
+
+    def test_json_decoding_matches_the_json_round_trip(self):
+        for response in (TrackingResponseJSON, ErrorResponseJSON, '{"a": [ ], "b": {"c": 1}}', '{"a": 1}'):
+            self.assertEqual(json.dumps(DP.to_dict(response)), json.dumps(round_trip(response)))
+
+    def test_circular_references_are_rejected(self):
+        entity = dict(a=[])
+        entity["a"].append(entity)
+
+        with self.assertRaises(ValueError):
+            DP.to_dict(entity)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """A local carrier stand-in answering every request with its path and body"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _respond(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.startswith("/drop"):  # the request is received but the connection dropped unanswered
+            with self.server.lock:
+                self.server.dropped += 1
+            self.close_connection = True
+            return
+
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.in_flight, self.server.max_in_flight)
+
+        if self.path.startswith("/slow/"):
+            time.sleep(float(self.path.split("/")[2]))
+
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        status = 404 if self.path.startswith("/missing") else 200
+        content = f"<response path='{self.path}'>{body.decode('utf-8')}</response>".encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+        # the idle keep-alive connection is closed by the server right after the response
+        self.close_connection = self.path.startswith("/bye")
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(handler=StandInHandler) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.dropped = 0
+    server.daemon_threads = True
+    server.handle_error = lambda *args: None  # clients hanging up on slow responses (timeouts)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
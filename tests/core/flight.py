@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from purplship import Rating, Shipment, Tracking
+from purplship.api.flight import single_flight
+from purplship.core.utils import DP, Serializable, set_async_transport
+from purplship.core.utils.transport import AsyncPooledTransport
+from tests.core.interface import StandInTransport, delayed
+from tests.canadapost.fixture import gateway
+from tests.canadapost.rate import RatePayload, RateResponseXml, ParsedQuoteResponse
+from tests.canadapost.shipment import shipment_data
+from tests.sf_express.fixture import gateway as sf_express_gateway
+from tests.sf_express.tracking import TrackingResponseJSON
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.stats = single_flight.stats
+
+    def tearDown(self):
+        set_async_transport(AsyncPooledTransport())
+
+    def collapsed(self) -> int:
+        return single_flight.stats["collapsed"] - self.stats["collapsed"]
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=delayed(0.2, RateResponseXml)) as http_mock:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                responses = list(executor.map(
+                    lambda _: Rating.fetch(RatePayload).from_(gateway).parse(), range(5)
+                ))
+
+        self.assertEqual(http_mock.call_count, 1)
+        self.assertEqual(self.collapsed(), 4)
+        self.assertTrue(all(DP.to_dict(r) == DP.to_dict(ParsedQuoteResponse) for r in responses))
+
+    def test_concurrent_identical_async_requests_share_one_call(self):
+        transport = StandInTransport(RateResponseXml, delay=0.2)
+        set_async_transport(transport)
+
+        async def fetch():
+            return await asyncio.gather(*[Rating.fetch(RatePayload).from_async(gateway) for _ in range(5)])
+
+        responses = asyncio.run(fetch())
+
+        self.assertEqual(len(transport.urls), 1)
+        self.assertEqual(self.collapsed(), 4)
+        self.assertTrue(all(DP.to_dict(r.parse()) == DP.to_dict(ParsedQuoteResponse) for r in responses))
+
+    def test_non_idempotent_requests_are_not_collapsed(self):
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=delayed(0.1, "<a></a>")) as http_mock:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(lambda _: Shipment.create(shipment_data).from_(gateway).parse(), range(2)))
+
+        self.assertEqual(self.collapsed(), 0)
+        self.assertGreaterEqual(http_mock.call_count, 2)
+
+    def test_collapsed_requests_are_serialized_once(self):
+        serialize = Serializable.serialize
+        with patch.object(Serializable, "serialize", autospec=True, side_effect=serialize) as serialize_mock, \
+                patch("purplship.mappers.canadapost.proxy.http", return_value=RateResponseXml):
+            Rating.fetch(RatePayload).from_(gateway).parse()
+
+        self.assertEqual(serialize_mock.call_count, 1)
+
+    def test_identical_requests_holding_nonces_share_one_call(self):
+        transport = StandInTransport(TrackingResponseJSON, delay=0.2)
+        set_async_transport(transport)
+
+        async def fetch():
+            return await asyncio.gather(*[
+                Tracking.fetch(dict(tracking_numbers=["444003077898"])).from_async(sf_express_gateway)
+                for _ in range(3)
+            ])
+
+        asyncio.run(fetch())
+
+        self.assertEqual(len(transport.urls), 1)
+        self.assertEqual(self.collapsed(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
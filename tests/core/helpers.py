@@ -0,0 +1,70 @@
+import time
+import unittest
+from purplship.core.errors import RequestTimeoutError
+from purplship.core.utils import request as http, exec_async, deadline
+from tests.core.fixture import start_server
+
+
+class TestExecAsync(unittest.TestCase):
+    def setUp(self):
+        self.server = start_server()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_wall_time_is_close_to_the_slowest_call(self):
+        delays = ["0.3", "0.1", "0.2", "0.3", "0.1"]
+
+        start = time.perf_counter()
+        responses = exec_async(lambda delay: http(url=f"{self.url}/slow/{delay}"), delays)
+        elapsed = time.perf_counter() - start
+
+        self.assertListEqual(
+            responses, [f"<response path='/slow/{delay}'></response>" for delay in delays]
+        )
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(self.server.max_in_flight, len(delays))
+
+    def test_in_flight_requests_are_bounded(self):
+        delays = ["0.1"] * 6
+
+        start = time.perf_counter()
+        exec_async(lambda delay: http(url=f"{self.url}/slow/{delay}"), delays, max_workers=2)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(self.server.max_in_flight, 2)
+        self.assertGreaterEqual(elapsed, 0.3)
+
+
+class TestDeadline(unittest.TestCase):
+    def setUp(self):
+        self.server = start_server()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_request_exceeding_the_deadline_times_out(self):
+        start = time.perf_counter()
+        with deadline(0.2), self.assertRaises(RequestTimeoutError):
+            http(url=f"{self.url}/slow/1")
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.5)
+
+    def test_deadline_is_shared_by_the_requests_of_the_context(self):
+        with deadline(0.3):
+            http(url=f"{self.url}/slow/0.2")
+            with self.assertRaises(RequestTimeoutError):
+                http(url=f"{self.url}/slow/0.2")
+
+    def test_nested_deadline_cannot_extend_the_current_one(self):
+        with deadline(0.1), deadline(10), self.assertRaises(RequestTimeoutError):
+            http(url=f"{self.url}/slow/0.3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from purplship import Rating
+from purplship.core.utils import set_transport, set_async_transport
+from purplship.core.utils.transport import Transport
+from purplship.core.utils.instrument import Callback, Histogram, Sink, Span, set_instrumentation, span, tagged
+from purplship.core.models import RateRequest
+from tests.canadapost.fixture import gateway
+from tests.canadapost.rate import RatePayload, RateResponseXml
+from tests.core.interface import StandInTransport
+
+PHASES = {"create", "serialize", "network", "deserialize", "parse"}
+
+
+class StandInSyncTransport(Transport):
+    def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None):
+        return RateResponseXml.encode("utf-8")
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.spans = []
+        self.previous = set_instrumentation(Callback(self.spans.append))
+
+    def tearDown(self):
+        set_instrumentation(self.previous)
+
+    def assertOperationSpans(self):
+        self.assertSetEqual({s.phase for s in self.spans}, PHASES)
+        self.assertSetEqual(
+            {(s.carrier_name, s.carrier_id, s.operation) for s in self.spans},
+            {(gateway.settings.carrier_name, gateway.settings.carrier_id, "get_rates")},
+        )
+        self.assertTrue(all(s.duration >= 0 and not s.failed for s in self.spans))
+
+    def test_rating_phases_spans(self):
+        previous = set_transport(StandInSyncTransport())
+        try:
+            Rating.fetch(RateRequest(**RatePayload)).from_(gateway).parse()
+        finally:
+            set_transport(previous)
+
+        self.assertOperationSpans()
+
+    def test_async_rating_phases_spans(self):
+        previous = set_async_transport(StandInTransport(RateResponseXml))
+        try:
+            asyncio.run(self._fetch())
+        finally:
+            set_async_transport(previous)
+
+        self.assertOperationSpans()
+
+    async def _fetch(self):
+        return (await Rating.fetch(RateRequest(**RatePayload)).from_async(gateway)).parse()
+
+    def test_histogram_aggregation(self):
+        histogram = Histogram()
+        set_instrumentation(histogram)
+        for duration in (0.002, 0.004, 0.3):
+            histogram.emit(Span("network", "fedex", "fedex", "get_rates", duration))
+
+        with tagged("ups", "ups", "get_tracking"), self.assertRaises(ValueError), span("parse"):
+            raise ValueError()
+
+        summary = histogram.summary()
+        self.assertDictEqual(
+            summary[("fedex", "fedex", "get_rates", "network")],
+            dict(count=3, mean=0.102, min=0.002, max=0.3, p50=0.005, p99=0.3),
+        )
+        self.assertEqual(summary[("ups", "ups", "get_tracking", "parse")]["count"], 1)
+
+    def test_disabled_instrumentation_does_not_time(self):
+        set_instrumentation(None)
+
+        self.assertIsInstance(set_instrumentation(Sink()), Sink)
+        with span("create") as timer:
+            self.assertIsNone(timer)
+
+
+if __name__ == "__main__":
+    unittest.main()
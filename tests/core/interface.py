@@ -0,0 +1,291 @@
+import time
+import uuid
+import asyncio
+import unittest
+from unittest.mock import patch
+from purplship import Rating, Tracking
+from purplship.core.utils import DP, set_async_transport, exec_io_async, request as http
+from purplship.core.errors import ShippingSDKError
+from purplship.core.utils.transport import AsyncTransport, AsyncPooledTransport
+from purplship.core.models import RateRequest, TrackingRequest
+from tests.core.fixture import start_server
+from tests.canadapost.fixture import gateway
+from tests.canadapost.rate import RatePayload, RateResponseXml, ParsedQuoteResponse
+from tests.dicom.fixture import gateway as dicom_gateway
+from tests.fedex.fixture import gateway as fedex_gateway
+from tests.dicom.tracking import TrackingResponseJSON
+from tests.sf_express.fixture import gateway as sf_express_gateway
+from tests.sf_express.tracking import TrackingResponseJSON as SFTrackingResponseJSON
+from tests.core.cache import track
+
+
+class StandInTransport(AsyncTransport):
+    """An asynchronous transport answering every request with a canned response after a delay"""
+
+    def __init__(self, response: str, delay: float = 0.0, responses: dict = None):
+        self.response = response
+        self.delay = delay
+        self.responses = responses or {}
+        self.urls = []
+
+    async def send(
+        self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None
+    ) -> bytes:
+        self.urls.append(url)
+        delay, response = next(
+            (value for host, value in self.responses.items() if host in url),
+            (self.delay, self.response),
+        )
+        await asyncio.sleep(delay)
+        return response.encode("utf-8")
+
+
+def delayed(delay: float, response: str):
+    def send(*args, **kwargs):
+        time.sleep(delay)
+        return response
+
+    return send
+
+
+class TestAsyncInterface(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        set_async_transport(AsyncPooledTransport())
+
+    def test_fetch_rates_async(self):
+        transport = StandInTransport(RateResponseXml)
+        set_async_transport(transport)
+
+        async def fetch():
+            request = await Rating.fetch(RateRequest(**RatePayload)).from_async(gateway)
+            return await request.parse_async()
+
+        parsed_response = asyncio.run(fetch())
+
+        self.assertEqual(DP.to_dict(parsed_response), DP.to_dict(ParsedQuoteResponse))
+        self.assertListEqual(transport.urls, [f"{gateway.settings.server_url}/rs/ship/price"])
+
+    def test_fetch_tracking_async_sends_requests_concurrently(self):
+        transport = StandInTransport(TrackingResponseJSON, delay=0.3)
+        set_async_transport(transport)
+        requests = [TrackingRequest(tracking_numbers=[f"{i}{n}" for n in "1234"]) for i in range(5)]
+
+        async def fetch():
+            return await asyncio.gather(
+                *[Tracking.fetch(request).from_async(dicom_gateway) for request in requests]
+            )
+
+        start = time.perf_counter()
+        responses = asyncio.run(fetch())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(transport.urls), 20)
+        self.assertLess(elapsed, 1.0)
+        self.assertTrue(all(len(response.parse()[0]) == 4 for response in responses))
+
+    def test_fetch_tracking_async_with_request_nonces(self):
+        # SF Express requests hold a new request id and timestamp every time they are built.
+        transport = StandInTransport(SFTrackingResponseJSON)
+        set_async_transport(transport)
+
+        async def fetch():
+            request = await Tracking.fetch(TrackingRequest(tracking_numbers=["444003077898"])).from_async(
+                sf_express_gateway
+            )
+            return await asyncio.wait_for(request.parse_async(), 5)
+
+        details, _ = asyncio.run(asyncio.wait_for(fetch(), 5))
+
+        self.assertEqual(len(transport.urls), 1)
+        self.assertListEqual([d.tracking_number for d in details], ["SF1011603494291"])
+
+    def test_replay_rounds_are_capped(self):
+        transport = StandInTransport("<a></a>")
+        set_async_transport(transport)
+
+        def endless_requests():
+            while True:
+                http(url="https://carrier.test/poll", data=uuid.uuid4().bytes, method="POST")
+
+        with self.assertRaises(ShippingSDKError):
+            asyncio.run(asyncio.wait_for(exec_io_async(endless_requests), 5))
+
+        self.assertEqual(len(transport.urls), 49)
+
+
+class TestRatingStream(unittest.TestCase):
+    def setUp(self):
+        self.RateRequest = RateRequest(**RatePayload)
+
+    def test_stream_rates_in_completion_order(self):
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=delayed(0.5, RateResponseXml)), \
+                patch("purplship.mappers.fedex.proxy.http", side_effect=delayed(0.05, "<a></a>")):
+            start = time.perf_counter()
+            results = [
+                (gateway.settings.carrier_name, rates, time.perf_counter() - start)
+                for gateway, rates, _ in Rating.fetch(self.RateRequest).stream(gateway, fedex_gateway)
+            ]
+
+        self.assertListEqual([name for name, *_ in results], ["fedex", "canadapost"])
+        self.assertLess(results[0][2], 0.3)
+        self.assertEqual(DP.to_dict(results[1][1]), DP.to_dict(ParsedQuoteResponse[0]))
+
+    def test_stream_rates_async_in_completion_order(self):
+        set_async_transport(StandInTransport(
+            "<a></a>", responses={"canadapost": (0.5, RateResponseXml), "fedex": (0.05, "<a></a>")}
+        ))
+
+        async def fetch():
+            start = time.perf_counter()
+            return [
+                (gateway.settings.carrier_name, rates, time.perf_counter() - start)
+                async for gateway, rates, _ in Rating.fetch(self.RateRequest).stream(gateway, fedex_gateway)
+            ]
+
+        try:
+            results = asyncio.run(fetch())
+        finally:
+            set_async_transport(AsyncPooledTransport())
+
+        self.assertListEqual([name for name, *_ in results], ["fedex", "canadapost"])
+        self.assertLess(results[0][2], 0.3)
+        self.assertEqual(DP.to_dict(results[1][1]), DP.to_dict(ParsedQuoteResponse[0]))
+
+
+class TestRatingTimeout(unittest.TestCase):
+    def setUp(self):
+        self.RateRequest = RateRequest(**RatePayload)
+
+    def tearDown(self):
+        set_async_transport(AsyncPooledTransport())
+
+    def test_fetch_rates_returns_partial_results_within_the_time_budget(self):
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=delayed(0.1, RateResponseXml)), \
+                patch("purplship.mappers.fedex.proxy.http", side_effect=delayed(1, "<a></a>")):
+            start = time.perf_counter()
+            rates, messages = Rating.fetch(self.RateRequest).from_(gateway, fedex_gateway, timeout=0.3).parse()
+            elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(DP.to_dict(rates), DP.to_dict(ParsedQuoteResponse[0]))
+        self.assertListEqual(
+            [(m.carrier_name, m.code) for m in messages], [("fedex", "SHIPPING_SDK_TIMEOUT_ERROR")]
+        )
+
+    def test_fetch_rates_async_returns_partial_results_within_the_time_budget(self):
+        set_async_transport(StandInTransport(
+            "<a></a>", responses={"canadapost": (0.1, RateResponseXml), "fedex": (1, "<a></a>")}
+        ))
+
+        async def fetch():
+            request = await Rating.fetch(self.RateRequest).from_async(gateway, fedex_gateway, timeout=0.3)
+            return await request.parse_async()
+
+        start = time.perf_counter()
+        rates, messages = asyncio.run(fetch())
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(DP.to_dict(rates), DP.to_dict(ParsedQuoteResponse[0]))
+        self.assertListEqual(
+            [(m.carrier_name, m.code) for m in messages], [("fedex", "SHIPPING_SDK_TIMEOUT_ERROR")]
+        )
+
+    def test_stream_rates_yields_timed_out_gateways(self):
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=delayed(0.05, RateResponseXml)), \
+                patch("purplship.mappers.fedex.proxy.http", side_effect=delayed(1, "<a></a>")):
+            results = [
+                (gateway.settings.carrier_name, [m.code for m in messages])
+                for gateway, _, messages in Rating.fetch(self.RateRequest).stream(gateway, fedex_gateway, timeout=0.3)
+            ]
+
+        self.assertListEqual(results, [("canadapost", []), ("fedex", ["SHIPPING_SDK_TIMEOUT_ERROR"])])
+
+
+class TestTrackingFetchMany(unittest.TestCase):
+    def test_tracking_numbers_are_sent_in_carrier_batches(self):
+        numbers = [f"{i:012}" for i in range(65)]
+        with patch("purplship.mappers.fedex.proxy.http", return_value="<a></a>") as http_mock:
+            Tracking.fetch_many(numbers).from_(fedex_gateway).parse()
+
+        batches = sorted(call[1]["data"].decode("utf-8").count("<v18:Value>") for call in http_mock.call_args_list)
+        self.assertListEqual(batches, [5, 30, 30])
+
+    def test_chunk_results_are_merged_in_the_requested_order(self):
+        numbers = [f"T{i}" for i in range(6)]
+        with patch("purplship.mappers.canadapost.proxy.http", side_effect=track) as http_mock:
+            details, messages = Tracking.fetch_many(numbers).from_(gateway).parse()
+            streamed = [
+                [d.tracking_number for d in result] for _, result, _ in Tracking.fetch_many(numbers).stream(gateway)
+            ]
+
+        self.assertEqual(http_mock.call_count, 12)
+        self.assertListEqual([d.tracking_number for d in details], numbers)
+        self.assertListEqual(sorted(streamed), [[number] for number in numbers])
+        self.assertListEqual(messages, [])
+
+    def test_tracking_chunks_async(self):
+        set_async_transport(StandInTransport(TrackingResponseJSON, delay=0.2))
+        numbers = [f"W{i}" for i in range(10)]
+
+        async def fetch():
+            return await (await Tracking.fetch_many(numbers).from_async(dicom_gateway)).parse_async()
+
+        start = time.perf_counter()
+        try:
+            details, _ = asyncio.run(fetch())
+        finally:
+            set_async_transport(AsyncPooledTransport())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(details), 10)
+        self.assertLess(elapsed, 0.6)
+
+
+class TestAsyncPooledTransport(unittest.TestCase):
+    def setUp(self):
+        self.server = start_server()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_keep_alive_connection_reuse(self):
+        transport = AsyncPooledTransport()
+
+        async def send():
+            responses = [
+                await transport.send(f"{self.url}/rate", data=f"{i}".encode("utf-8"), method="POST")
+                for i in range(5)
+            ]
+            await transport.close()
+            return responses
+
+        responses = asyncio.run(send())
+
+        self.assertListEqual(responses, [f"<response path='/rate'>{i}</response>".encode("utf-8") for i in range(5)])
+        self.assertEqual(self.server.connections, 1)
+        self.assertDictEqual(transport.stats, dict(connections=1, reused=4))
+
+    def test_non_idempotent_requests_are_not_retried_on_a_dropped_connection(self):
+        transport = AsyncPooledTransport()
+
+        async def send():
+            await transport.send(f"{self.url}/rate", method="GET")
+            try:
+                await transport.send(f"{self.url}/drop/shipment", data=b"1", method="POST")
+            finally:
+                await transport.close()
+
+        with self.assertRaises((ConnectionError, asyncio.IncompleteReadError)):
+            asyncio.run(send())
+
+        self.assertEqual(self.server.dropped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
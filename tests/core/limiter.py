@@ -0,0 +1,149 @@
+import os
+import time
+import tempfile
+import unittest
+import multiprocessing
+import purplship
+from purplship import Tracking
+from purplship.core.errors import RequestTimeoutError
+from purplship.core.limiter import RateLimit, Limiter, get_limiter
+from purplship.core.utils import request as http, exec_async, throttle, set_transport
+from purplship.core.utils.transport import Transport
+from tests.core.fixture import start_server
+
+
+class StampingTransport(Transport):
+    """A transport recording the time at which each request is sent"""
+
+    def __init__(self):
+        self.stamps = []
+
+    def send(self, url: str, data: bytes = None, headers: dict = None, method: str = None, timeout: float = None) -> bytes:
+        self.stamps.append(time.monotonic())
+        return b"<tracking-detail></tracking-detail>"
+
+
+def acquire_many(path: str, count: int):
+    limiter = Limiter(RateLimit(rps=20, path=path))
+    for _ in range(count):
+        with limiter.acquire():
+            pass
+
+
+def exit_in_flight(path: str):
+    with Limiter(RateLimit(max_concurrency=1, path=path)).acquire():
+        os._exit(0)
+
+
+class TestLimiter(unittest.TestCase):
+    def test_requests_are_paced_at_the_sustained_rate(self):
+        limiter = Limiter(RateLimit(rps=20))
+
+        start = time.perf_counter()
+        for _ in range(5):
+            with limiter.acquire():
+                pass
+        elapsed = time.perf_counter() - start
+
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 0.35)
+
+    def test_burst_requests_are_sent_at_once(self):
+        limiter = Limiter(RateLimit(rps=1, burst=5))
+
+        start = time.perf_counter()
+        for _ in range(5):
+            with limiter.acquire():
+                pass
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.05)
+
+    def test_waiting_beyond_the_timeout_raises_a_timeout_error(self):
+        limiter = Limiter(RateLimit(rps=1))
+
+        with limiter.acquire():
+            pass
+        with self.assertRaises(RequestTimeoutError), limiter.acquire(timeout=0.1):
+            pass
+
+    def test_file_state_is_shared_by_worker_processes(self):
+        path = os.path.join(tempfile.mkdtemp(), "canadapost.limit")
+        processes = [multiprocessing.Process(target=acquire_many, args=(path, 5)) for _ in range(2)]
+
+        start = time.perf_counter()
+        [process.start() for process in processes]
+        [process.join() for process in processes]
+        elapsed = time.perf_counter() - start
+
+        self.assertGreaterEqual(elapsed, 0.44)
+
+    def test_slots_of_a_killed_worker_are_not_leaked(self):
+        path = os.path.join(tempfile.mkdtemp(), "canadapost.limit")
+        process = multiprocessing.Process(target=exit_in_flight, args=(path,))
+        process.start()
+        process.join()
+
+        with Limiter(RateLimit(max_concurrency=1, path=path)).acquire(timeout=0.1):
+            pass
+
+    def test_limiters_are_kept_per_account_and_rate_limit(self):
+        limiter = get_limiter("canadapost:canadapost:True:0", RateLimit(rps=1))
+        with limiter.acquire():
+            pass
+
+        self.assertIs(get_limiter("canadapost:canadapost:True:0", RateLimit(rps=1)), limiter)
+        self.assertIsNot(get_limiter("canadapost:canadapost:True:1", RateLimit(rps=1)), limiter)
+        self.assertIsNot(get_limiter("canadapost:canadapost:True:0", RateLimit(rps=2)), limiter)
+        self.assertIs(get_limiter("canadapost:canadapost:True:0", RateLimit(rps=1)), limiter)
+        with self.assertRaises(RequestTimeoutError), limiter.acquire(timeout=0.1):
+            pass
+
+
+class TestThrottle(unittest.TestCase):
+    def setUp(self):
+        self.server = start_server()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_in_flight_are_bounded(self):
+        limiter = Limiter(RateLimit(max_concurrency=2))
+
+        with throttle(limiter):
+            exec_async(lambda delay: http(url=f"{self.url}/slow/{delay}"), ["0.1"] * 6)
+
+        self.assertEqual(self.server.max_in_flight, 2)
+
+    def test_gateway_requests_are_paced_by_the_account_rate_limit(self):
+        limited_gateway = purplship.gateway["canadapost"].create(
+            dict(username="username", password="password", customer_number="2004381", rate_limit=RateLimit(rps=20))
+        )
+        transport = StampingTransport()
+        previous = set_transport(transport)
+        try:
+            Tracking.fetch(dict(tracking_numbers=["1", "2", "3", "4"])).from_(limited_gateway)
+        finally:
+            set_transport(previous)
+
+        intervals = [b - a for a, b in zip(transport.stamps, transport.stamps[1:])]
+        self.assertEqual(len(transport.stamps), 4)
+        self.assertTrue(all(interval >= 0.045 for interval in intervals))
+
+    def test_accounts_sharing_a_carrier_id_have_their_own_limiter(self):
+        gateways = [
+            purplship.gateway["canadapost"].create(
+                dict(username="username", password="password", customer_number=number, rate_limit=RateLimit(rps=20))
+            )
+            for number in ("2004381", "2004382", "2004381")
+        ]
+        limiters = [gateway.proxy.limiter for gateway in gateways]
+
+        self.assertIsNot(limiters[0], limiters[1])
+        self.assertIs(limiters[0], limiters[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
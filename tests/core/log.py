@@ -0,0 +1,69 @@
+import logging
+import unittest
+from unittest.mock import patch
+from purplship.core.utils import XP
+from purplship.core.utils.log import Payload, PayloadLogging, log_payload, set_payload_logging
+from tests.fedex.rate import RateRequestXml
+
+logger = logging.getLogger("tests.core.log")
+
+
+class TestPayload(unittest.TestCase):
+    def test_credentials_are_redacted(self):
+        self.assertNotIn("user_key", str(Payload(RateRequestXml)))
+        self.assertIn("<v28:Key>[REDACTED]</v28:Key>", str(Payload(RateRequestXml)))
+        self.assertEqual(
+            str(Payload('{"api_key": "secret-key", "weight": 4}')),
+            '{"api_key": "[REDACTED]", "weight": 4}',
+        )
+        self.assertNotIn("secret-key", str(Payload(dict(password="secret-key", weight=4))))
+        self.assertNotIn("secret-key", str(Payload({"<Password>secret-key</Password>"})))
+
+    def test_xml_bundles_are_rendered_as_xml_and_redacted(self):
+        fragments = ["<a><Password>secret</Password></a>", b"<b><UserToken>token</UserToken></b>"]
+        expected = "<wrapper><a><Password>[REDACTED]</Password></a><b><UserToken>[REDACTED]</UserToken></b></wrapper>"
+        parsed_bundle = XP.bundle(fragments)
+        XP.to_xml(parsed_bundle)
+
+        self.assertEqual(str(Payload(XP.bundle(fragments))), expected)
+        self.assertEqual(str(Payload(parsed_bundle)), expected)
+        self.assertEqual(str(Payload(XP.to_xml(fragments[0]))), "<a><Password>[REDACTED]</Password></a>")
+        self.assertEqual(
+            str(Payload(XP.bundle(["<a><Password>secret</Password>", fragments[1]]))),
+            "<a><Password>[REDACTED]</Password><b><UserToken>[REDACTED]</UserToken></b>",
+        )
+
+    def test_labels_are_elided_and_payloads_truncated(self):
+        label = "JVBERi0xLjQKJeLjz9MK" * 100
+
+        self.assertEqual(str(Payload(f"<label>{label}</label>")), "<label>[2000 encoded characters]</label>")
+        self.assertEqual(
+            str(Payload(f"<a>{'x ' * 10}</a>", PayloadLogging(max_length=10))),
+            "<a>x x x x... [17 characters truncated]",
+        )
+
+
+class TestLogPayload(unittest.TestCase):
+    def tearDown(self):
+        set_payload_logging(PayloadLogging())
+
+    def test_payloads_are_not_rendered_when_the_level_is_disabled(self):
+        logger.setLevel(logging.INFO)
+        with patch("purplship.core.utils.log.DICTPARSE.jsonify") as jsonify_mock:
+            log_payload(logger, logging.DEBUG, "payload: %s", dict(weight=4))
+
+        jsonify_mock.assert_not_called()
+
+    def test_payloads_are_sampled(self):
+        logger.setLevel(logging.DEBUG)
+        set_payload_logging(PayloadLogging(sample_rate=0))
+        with patch.object(logger, "log") as log_mock:
+            [log_payload(logger, logging.DEBUG, "payload: %s", dict(weight=4)) for _ in range(10)]
+            set_payload_logging(PayloadLogging(sample_rate=1))
+            log_payload(logger, logging.DEBUG, "payload: %s", dict(weight=4))
+
+        self.assertEqual(log_mock.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from fedex_lib.rate_service_v28 import ClientDetail, Localization, WebAuthenticationCredential, WebAuthenticationDetail
+from purplship.core.utils import XP
+from purplship.core.utils.soap import apply_namespaceprefix, clean_namespaces
+
+
+class TestApplyNamespacePrefix(unittest.TestCase):
+    def test_prefixes_of_instances_sharing_a_type(self):
+        details = [
+            ClientDetail(AccountNumber="2349857", MeterNumber="1293587", Localization=Localization(LanguageCode="en")),
+            ClientDetail(AccountNumber="2349857"),
+        ]
+
+        for detail in details:
+            apply_namespaceprefix(detail, "v28", dict(Localization_children="loc"))
+
+        self.assertEqual(
+            XP.export(details[0]).replace("\n", "").replace(" ", ""),
+            "<v28:ClientDetail><v28:AccountNumber>2349857</v28:AccountNumber><v28:MeterNumber>1293587</v28:MeterNumber>"
+            "<v28:Localization><loc:LanguageCode>en</loc:LanguageCode></v28:Localization></v28:ClientDetail>",
+        )
+        self.assertEqual(
+            XP.export(details[1]).replace("\n", "").replace(" ", ""),
+            "<v28:ClientDetail><v28:AccountNumber>2349857</v28:AccountNumber></v28:ClientDetail>",
+        )
+
+    def test_special_prefixes_of_members(self):
+        detail = WebAuthenticationDetail(UserCredential=WebAuthenticationCredential(Key="key", Password="password"))
+
+        apply_namespaceprefix(detail, "v28", dict(UserCredential="auth"))
+
+        self.assertEqual(detail.UserCredential.ns_prefix_, "auth")
+        self.assertEqual(detail.UserCredential.Key_nsprefix_, "auth")
+
+
+class TestCleanNamespaces(unittest.TestCase):
+    def test_envelope_children_tags_are_reprefixed(self):
+        envelope = (
+            "<tns:Envelope><tns:Header><tns:Security><tns:Token/></tns:Security></tns:Header>"
+            "<tns:Body><tns:RateRequest><tns:RateRequestItem/></tns:RateRequest></tns:Body></tns:Envelope>"
+        )
+
+        self.assertEqual(
+            clean_namespaces(envelope, "tns:", "RateRequest", "Security", "upss:", "rate:"),
+            "<tns:Envelope><tns:Header><upss:Security><tns:Token/></upss:Security></tns:Header>"
+            "<tns:Body><rate:RateRequest><rate:RateRequestItem/></rate:RateRequest></tns:Body></tns:Envelope>",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import time
+import resource
+import unittest
+from http.client import RemoteDisconnected
+from purplship.core.utils import request as http, set_transport
+from purplship.core.utils.transport import PooledTransport, UrllibTransport
+from tests.core.fixture import start_server
+
+
+class TestPooledTransport(unittest.TestCase):
+    def setUp(self):
+        self.server = start_server()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_keep_alive_connection_reuse(self):
+        transport = PooledTransport(pool_size=2)
+        previous = set_transport(transport)
+        try:
+            responses = [
+                http(url=f"{self.url}/rate", data=bytearray(f"{i}", "utf-8"), method="POST")
+                for i in range(5)
+            ]
+        finally:
+            set_transport(previous)
+            transport.close()
+
+        self.assertListEqual(responses, [f"<response path='/rate'>{i}</response>" for i in range(5)])
+        self.assertEqual(self.server.connections, 1)
+        self.assertDictEqual(transport.stats, dict(connections=1, reused=4))
+
+    def test_urllib_transport_opens_a_connection_per_request(self):
+        previous = set_transport(UrllibTransport())
+        try:
+            [http(url=f"{self.url}/track/{i}", method="GET") for i in range(3)]
+        finally:
+            set_transport(previous)
+
+        self.assertEqual(self.server.connections, 3)
+
+    def test_error_response_body_is_returned(self):
+        transport = PooledTransport()
+        previous = set_transport(transport)
+        try:
+            response = http(url=f"{self.url}/missing", method="GET")
+            next_response = http(url=f"{self.url}/track", method="GET")
+        finally:
+            set_transport(previous)
+            transport.close()
+
+        self.assertEqual(response, "<response path='/missing'></response>")
+        self.assertEqual(next_response, "<response path='/track'></response>")
+        self.assertEqual(self.server.connections, 1)
+
+    def test_idle_connections_closed_by_the_server_are_not_reused(self):
+        transport = PooledTransport()
+        try:
+            transport.send(f"{self.url}/bye", method="GET")
+            time.sleep(0.1)
+            response = transport.send(f"{self.url}/ship", data=b"1", method="POST")
+        finally:
+            transport.close()
+
+        self.assertEqual(response, b"<response path='/ship'>1</response>")
+        self.assertDictEqual(transport.stats, dict(connections=2, reused=0))
+
+    @unittest.skipIf(resource.getrlimit(resource.RLIMIT_NOFILE)[0] < 1100, "not enough file descriptors")
+    def test_connections_above_the_select_fd_limit_are_reused(self):
+        descriptors = [os.open(os.devnull, os.O_RDONLY)]
+        while descriptors[-1] < 1024:
+            descriptors.append(os.open(os.devnull, os.O_RDONLY))
+
+        transport = PooledTransport()
+        try:
+            transport.send(f"{self.url}/track/1", method="GET")
+            transport.send(f"{self.url}/track/2", method="GET")
+        finally:
+            transport.close()
+            [os.close(descriptor) for descriptor in descriptors]
+
+        self.assertDictEqual(transport.stats, dict(connections=1, reused=1))
+
+    def test_only_idempotent_requests_are_retried_on_a_dropped_connection(self):
+        transport = PooledTransport()
+        try:
+            transport.send(f"{self.url}/rate", method="GET")
+            with self.assertRaises((RemoteDisconnected, ConnectionError)):
+                transport.send(f"{self.url}/drop/shipment", data=b"1", method="POST")
+            self.assertEqual(self.server.dropped, 1)
+
+            transport.send(f"{self.url}/rate", method="GET")
+            with self.assertRaises((RemoteDisconnected, ConnectionError)):
+                transport.send(f"{self.url}/drop/tracking", method="GET")
+            self.assertEqual(self.server.dropped, 3)
+        finally:
+            transport.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
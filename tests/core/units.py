@@ -0,0 +1,102 @@
+import unittest
+from purplship.core import units
+from purplship.core.utils import Enum, Location, Spec
+from purplship.core.models import Parcel
+from purplship.core.units import (
+    COUNTRIES, Dimension, DimensionUnit, Options, Packages, Services, Weight, WeightUnit, state_code
+)
+
+
+class MeasurementOptions(Enum):
+    min_kg = 0.5
+    min_cm = 10.0
+    quant = 0.1
+
+
+class ServiceOption(Enum):
+    carrier_cod = Spec.asValue("COD", float)
+    carrier_saturday_delivery = Spec.asFlag("SAT")
+
+    """ Unified Option type mapping """
+    cash_on_delivery = carrier_cod
+
+
+class TestMeasurements(unittest.TestCase):
+    def test_conversions(self):
+        weight = Weight(2, WeightUnit.LB, MeasurementOptions)
+        dimension = Dimension(2, "IN", MeasurementOptions)
+
+        self.assertListEqual([weight.value, weight.KG, weight.OZ, weight.unit], [2.0, 0.9, 32.0, "LB"])
+        self.assertListEqual([Weight(0.2, "KG", MeasurementOptions).KG, Weight(None).LB], [0.5, None])
+        self.assertListEqual([dimension.value, dimension.CM, dimension.M, dimension["IN"]], [2.0, 10.0, 0.1, 2.0])
+        self.assertEqual(dimension.map(Enum).CM, 5.08)
+
+    def test_measurements_attributes_are_fixed(self):
+        with self.assertRaises(AttributeError):
+            Weight(2, WeightUnit.LB).unit = WeightUnit.KG
+        with self.assertRaises(AttributeError):
+            Dimension(2, DimensionUnit.CM).extra = 1
+
+
+class TestPackages(unittest.TestCase):
+    def test_package_measurements_are_computed_once(self):
+        packages = Packages([
+            Parcel(weight=2, weight_unit="KG", width=10, height=10, length=20, dimension_unit="CM"),
+            Parcel(weight=3, weight_unit="LB"),
+        ])
+        package = packages[0]
+
+        self.assertIs(package.weight, package.weight)
+        self.assertIs(package.length, package.length)
+        self.assertIs(packages.weight, packages.weight)
+        self.assertEqual(packages.weight.KG, 3.36)
+        self.assertEqual(package.girth.value, 40.0)
+
+
+
+class TestOptions(unittest.TestCase):
+    def test_options_parsing(self):
+        options = Options(
+            dict(cash_on_delivery="10.5", carrier_saturday_delivery=False, currency="CAD", unknown=True),
+            ServiceOption,
+        )
+
+        self.assertDictEqual(
+            dict(iter(options)), dict(carrier_cod=10.5, carrier_saturday_delivery=False, currency="CAD")
+        )
+        self.assertListEqual([options.currency, options.unknown, "carrier_cod" in options], ["CAD", None, True])
+        self.assertDictEqual(dict(iter(Options(dict(insurance="5", COD=1)))), dict(insurance=5.0))
+
+    def test_services_lookups(self):
+        services = Services(["carrier_cod", "unknown", None, "cash_on_delivery"], ServiceOption)
+
+        self.assertListEqual(list(services), [ServiceOption.carrier_cod, ServiceOption.carrier_cod])
+        self.assertListEqual(["carrier_cod" in services, "unknown" in services], [True, False])
+        self.assertIs(services.first, ServiceOption.carrier_cod)
+
+
+class TestReferences(unittest.TestCase):
+    def test_reference_lookups(self):
+        self.assertListEqual([COUNTRIES.name("CA"), COUNTRIES.name("XX"), COUNTRIES.name(None)], ["Canada", None, None])
+        self.assertListEqual([COUNTRIES.code("canada"), COUNTRIES.code("Nowhere")], ["CA", None])
+        self.assertListEqual([state_code("US", "new york"), state_code("XX", "New York")], ["NY", None])
+        self.assertListEqual(
+            [Location("QC", country="CA").as_state_name, Location("QC", country="FR").as_state_name],
+            ["Quebec", "QC"],
+        )
+        self.assertListEqual([Location("FR").as_country_name, Location("XX").as_country_name], ["France", "XX"])
+
+    def test_reference_enums_are_created_once_from_the_tables(self):
+        from purplship.core.units import Country, CountryCurrency, CountryState
+
+        self.assertIs(units.Country, Country)
+        self.assertDictEqual({c: m.value for c, m in Country.__members__.items()}, COUNTRIES.names)
+        self.assertListEqual([Country["CA"].value, CountryCurrency.FR.value], ["Canada", "EUR"])
+        self.assertIs(CountryCurrency.FR, CountryCurrency.DE)
+        self.assertEqual(CountryState.US.value.NY.value, "New York")
+        with self.assertRaises(AttributeError):
+            units.Countries
+
+
+if __name__ == "__main__":
+    unittest.main()
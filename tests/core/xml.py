@@ -0,0 +1,142 @@
+import unittest
+from collections import OrderedDict
+from unittest.mock import Mock, patch
+from lxml import etree
+from purplship import Rating
+from purplship.core.utils import XP
+from purplship.core.utils.xml import Fragment, TypedView
+from fedex_lib.rate_service_v28 import ClientDetail, RateReplyDetail
+from purplship.core.utils.soap import apply_namespaceprefix
+from tests.fedex.fixture import gateway
+from purplship.core.models import RateRequest
+from tests.fedex.rate import RateRequestPayload, RateResponseXml, ParsedRateResponse
+
+
+class TestToXML(unittest.TestCase):
+    def test_text_and_raw_bytes_are_parsed_alike(self):
+        text = "<RateReply><Rate currency='CAD'>12.26 é</Rate></RateReply>"
+        body = text.encode("utf-8")
+
+        trees = [XP.to_xml(value) for value in (text, body, bytearray(body), memoryview(body))]
+
+        self.assertTrue(all(XP.xml_tostring(tree) == XP.xml_tostring(trees[0]) for tree in trees))
+
+    def test_raw_bytes_honor_the_declared_encoding(self):
+        body = "<?xml version='1.0' encoding='iso-8859-1'?><City>Montréal</City>".encode("iso-8859-1")
+
+        self.assertEqual(XP.to_xml(body).text, "Montréal")
+
+    def test_parse_raw_bytes_response(self):
+        with patch("purplship.mappers.fedex.proxy.http", return_value=RateResponseXml.encode("utf-8")):
+            parsed_response = Rating.fetch(RateRequest(**RateRequestPayload)).from_(gateway).parse()
+
+        self.assertListEqual(parsed_response[1], [])
+        self.assertEqual(len(parsed_response[0]), len(ParsedRateResponse[0]))
+
+
+class TestFind(unittest.TestCase):
+    def setUp(self):
+        self.response = XP.to_xml(RateResponseXml)
+
+    def test_find_matches_the_local_name_xpath_lookup(self):
+        for tag in ("RateReplyDetails", "Notifications", "TotalNetCharge", "Amount", "Missing"):
+            self.assertListEqual(
+                XP.find(tag, self.response),
+                self.response.xpath(".//*[local-name() = $name]", name=tag),
+            )
+
+    def test_find_qualified_and_unqualified_tags(self):
+        document = XP.to_xml("<a xmlns:v='urn:v'><v:Rate>1</v:Rate><Rate>2</Rate><b><Rate>3</Rate></b></a>")
+
+        self.assertListEqual([n.text for n in XP.find("Rate", document)], ["1", "2", "3"])
+        self.assertListEqual([n.text for n in XP.find("{urn:v}Rate", document)], ["1"])
+        self.assertEqual(XP.find("Rate", document, first=True).text, "1")
+        self.assertIsNone(XP.find("Missing", document, first=True))
+
+
+class TestBundle(unittest.TestCase):
+    def test_bundle_wraps_the_fragments_in_order(self):
+        fragments = ["<a>1</a>", "", None, b"<?xml version='1.0'?><b>2</b>", XP.to_xml("<c>3</c>")]
+
+        bundle = XP.bundle(fragments)
+
+        self.assertEqual(len(bundle), 3)
+        self.assertEqual(str(bundle), "<wrapper><a>1</a><b>2</b><c>3</c></wrapper>")
+        self.assertListEqual([n.tag for n in XP.to_xml(bundle)], ["a", "b", "c"])
+
+    def test_bundle_xml_renders_the_bundle(self):
+        fragments = ["<a>1</a>", "", None, b"<?xml version='1.0'?><b>2</b>", XP.to_xml("<c>3</c>")]
+
+        self.assertEqual(XP.bundle_xml(fragments), "<wrapper><a>1</a><b>2</b><c>3</c></wrapper>")
+
+    def test_bundle_fragments_are_parsed_once(self):
+        bundle = XP.bundle([RateResponseXml, RateResponseXml])
+
+        with patch("purplship.core.utils.xml.etree.fromstring", wraps=etree.fromstring) as parse_mock:
+            trees = [XP.to_xml(bundle), XP.to_xml(bundle)]
+            XP.find("RateReplyDetails", trees[0])
+
+        self.assertEqual(parse_mock.call_count, 2)
+        self.assertIs(trees[0], trees[1])
+        self.assertEqual(len(XP.find("RateReplyDetails", trees[0])), 12)
+
+
+class TestTypedView(unittest.TestCase):
+    def setUp(self):
+        self.nodes = XP.find("RateReplyDetails", XP.to_xml(RateResponseXml))
+
+    def test_view_members_match_the_built_instance(self):
+        for node in self.nodes:
+            built, view = XP.build(RateReplyDetail, node), XP.view(RateReplyDetail, node)
+
+            self.assertEqual(view.ServiceType, built.ServiceType)
+            self.assertEqual(view.get_ActualRateType(), built.ActualRateType)
+            self.assertListEqual(view.AppliedOptions, built.AppliedOptions)
+            self.assertEqual(view.DeliveryTimestamp, built.DeliveryTimestamp)
+            self.assertListEqual(
+                [
+                    (d.ShipmentRateDetail.RateType, [s.Amount.Amount for s in d.ShipmentRateDetail.Surcharges])
+                    for d in view.RatedShipmentDetails
+                ],
+                [
+                    (d.ShipmentRateDetail.RateType, [s.Amount.Amount for s in d.ShipmentRateDetail.Surcharges])
+                    for d in built.RatedShipmentDetails
+                ],
+            )
+
+    def test_complex_members_are_views_resolved_once(self):
+        view = XP.find("RateReplyDetails", XP.to_xml(RateResponseXml), RateReplyDetail, first=True, lazy=True)
+
+        self.assertIsInstance(view, TypedView)
+        self.assertIsInstance(view.RatedShipmentDetails[0], TypedView)
+        self.assertIs(view.RatedShipmentDetails, view.RatedShipmentDetails)
+        self.assertIsInstance(view.build(), RateReplyDetail)
+        with self.assertRaises(AttributeError):
+            view.UnknownMember
+
+
+class TestFragment(unittest.TestCase):
+    def test_fragments_are_exported_as_their_instance_built_once(self):
+        build = Mock(side_effect=lambda: ClientDetail(AccountNumber="2349857", MeterNumber="1293587"))
+        details = [XP.fragment(("fragment-test", "2349857"), build) for _ in range(3)]
+        expected = build()
+        for detail in [expected, *details]:
+            apply_namespaceprefix(detail, "v28")
+
+        self.assertListEqual([XP.export(detail) for detail in details], [XP.export(expected)] * 3)
+        self.assertIn("<v28:AccountNumber>2349857</v28:AccountNumber>", XP.export(expected))
+        self.assertEqual(build.call_count, 2)
+
+    def test_the_most_recently_exported_renderings_are_kept(self):
+        build = Mock(side_effect=lambda: ClientDetail(AccountNumber="2349857", MeterNumber="1293587"))
+        first, second, third = [XP.fragment(("lru-test", key), build) for key in ("1", "2", "3")]
+
+        with patch.object(Fragment, "maxsize", 2), patch.object(Fragment, "_renderings", OrderedDict()):
+            for detail in (first, second, first, third, first, second):
+                XP.export(detail)
+
+        self.assertEqual(build.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
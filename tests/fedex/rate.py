@@ -34,6 +34,15 @@ class TestFeDexQuote(unittest.TestCase):
 
         self.assertEqual(serialized_request, RateRequestUsingPackagePresetXML)
 
+    def test_create_rate_request_from_rendered_fragments(self):
+        requests = [gateway.mapper.create_rate_request(self.RateRequest) for _ in range(2)]
+        serialized_requests = [
+            re.sub("<v28:ShipTimestamp>[^>]+</v28:ShipTimestamp>", "", request.serialize())
+            for request in requests
+        ]
+
+        self.assertListEqual(serialized_requests, [RateRequestXml, RateRequestXml])
+
     @patch("purplship.mappers.fedex.proxy.http", return_value="<a></a>")
     def test_get_rates(self, http_mock):
         Rating.fetch(self.RateRequest).from_(gateway)